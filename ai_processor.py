@@ -1,52 +1,148 @@
-import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+import importlib.metadata
 import logging
+import threading
 from config import AI_CONFIG
+from lazy_imports import LazyImport
+from startup_profile import PROFILER
+from tfidf_index import TfidfIndex
+
+spacy = LazyImport("spacy")
+np = LazyImport("numpy")
+TfidfVectorizer = LazyImport("sklearn.feature_extraction.text", "TfidfVectorizer")
+
+# How question and input texts are normalized before vectorizing; part of the index key
+PREPROCESSING = {'lowercase': True, 'token': 'lemma', 'drop': ['stop', 'punct'], 'disable': ['parser', 'ner']}
 
 
 class AIQuestionProcessor:
-    def __init__(self, question_db):
-        self.nlp = spacy.load("en_core_web_sm")
-        self.question_db = question_db
-        self.vectorizer = TfidfVectorizer()
-        self._prepare_question_vectors()
+    def __init__(self, question_db, index_dir=None):
+        self._nlp = None
+        self.question_db = self._normalize_db(question_db)
+        self.vectorizer = None
+        self.question_vectors = None
+        self.index = TfidfIndex(index_dir or AI_CONFIG['index_dir'])
+        self._preprocessed = {}
+        self._lock = threading.RLock()
+        self.warmup_thread = None
+        self.disabled = None  # why the index or NLP model could not be loaded, once that happened
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use so a warm index starts without it"""
+        with self._lock:
+            if self._nlp is None:
+                with PROFILER.phase(f"spacy.load {AI_CONFIG['spacy_model']}"):
+                    # Only lemmas and stop/punct flags are used, so skip the parser and NER
+                    self._nlp = spacy.load(AI_CONFIG['spacy_model'], disable=PREPROCESSING['disable'])
+            return self._nlp
+
+    def prepare(self):
+        """Load (or fit) the question vectors; safe to call repeatedly and from several threads"""
+        with self._lock:
+            if self.question_vectors is None:
+                with PROFILER.phase("tfidf index"):
+                    self._prepare_question_vectors()
+
+    def warm_up(self):
+        """Load the index and NLP model on a background thread while the browser works"""
+        def run():
+            try:
+                self.prepare()
+                self.nlp
+            except Exception as e:
+                self._disable(e)
+
+        self.warmup_thread = threading.Thread(target=run, name="ai-warmup", daemon=True)
+        self.warmup_thread.start()
+        return self.warmup_thread
+
+    def _disable(self, error):
+        """Stop trying to load what failed; every later lookup returns the default answer"""
+        with self._lock:
+            if self.disabled is None:
+                self.disabled = str(error)
+                logging.warning(f"AI question matching disabled: {self.disabled}")
+
+    @staticmethod
+    def _normalize_db(question_db):
+        """Accept both the {question: answer} dict from config and a list of {'question', 'answer'} dicts"""
+        if isinstance(question_db, dict):
+            return [{'question': q, 'answer': a} for q, a in question_db.items()]
+        return list(question_db)
 
     def _prepare_question_vectors(self):
         """Preprocess questions and create TF-IDF vectors"""
         self.questions = [q['question'] for q in self.question_db]
         self.answers = [q['answer'] for q in self.question_db]
 
-        # Train TF-IDF vectorizer
-        self.question_vectors = self.vectorizer.fit_transform(self.questions)
+        # Reuse the on-disk index when neither the question base nor the way it is fitted changed
+        settings = self._index_settings()
+        indexed = self.index.load(self.questions, settings)
+        if indexed:
+            self.vectorizer, self.question_vectors = indexed
+            return
+
+        # Train TF-IDF vectorizer on the same normalized form the inputs are compared in
+        self.vectorizer = TfidfVectorizer()
+        self.question_vectors = self.vectorizer.fit_transform(self._preprocess_many(self.questions))
+        self.index.save(self.questions, self.vectorizer, self.question_vectors, settings)
+
+    @staticmethod
+    def _index_settings():
+        """Everything besides the questions the fitted vectors depend on, without loading spaCy"""
+        def version(distribution):
+            try:
+                return importlib.metadata.version(distribution)
+            except importlib.metadata.PackageNotFoundError:
+                return None
+
+        return {'model': AI_CONFIG['spacy_model'], 'model_version': version(AI_CONFIG['spacy_model']),
+                'spacy_version': version("spacy"), 'preprocessing': PREPROCESSING,
+                'vectorizer': TfidfVectorizer().get_params()}
 
     def find_best_answer(self, input_question):
         """Find the best matching answer for a given question"""
-        try:
-            # Preprocess input question
-            processed_input = self._preprocess_text(input_question)
-
-            # Vectorize input
-            input_vector = self.vectorizer.transform([processed_input])
+        return self.find_best_answers([input_question])[0]
 
-            # Calculate similarities
-            similarities = cosine_similarity(input_vector, self.question_vectors)
-            max_index = np.argmax(similarities)
-            max_score = similarities[0, max_index]
+    def find_best_answers(self, questions, default=AI_CONFIG['default_answer']):
+        """Find the best matching answer for every question of a form step at once"""
+        if not questions:
+            return []
+        if self.disabled:
+            return [default] * len(questions)
+        try:
+            self.prepare()
+            self.nlp
+        except Exception as e:
+            self._disable(e)
+            return [default] * len(questions)
+        try:
+            # Vectorize all inputs into one sparse matrix
+            input_vectors = self.vectorizer.transform(self._preprocess_many(questions))
 
-            # Return best match if above threshold
-            if max_score >= AI_CONFIG['similarity_threshold']:
-                return self.answers[max_index]
+            # TF-IDF rows are L2-normalized, so one sparse product gives every cosine similarity
+            similarities = input_vectors @ self.question_vectors.T
+            best = np.asarray(similarities.argmax(axis=1)).ravel()
+            scores = similarities.max(axis=1).toarray().ravel()
 
-            return AI_CONFIG['default_answer']
+            # Return best match for each row if above threshold
+            threshold = AI_CONFIG['similarity_threshold']
+            return [self.answers[i] if score >= threshold else default
+                    for i, score in zip(best, scores)]
 
         except Exception as e:
             logging.error(f"AI processing failed: {str(e)}")
-            return AI_CONFIG['default_answer']
+            return [default] * len(questions)
 
     def _preprocess_text(self, text):
         """Clean and normalize text for comparison"""
-        doc = self.nlp(text.lower())
-        tokens = [token.lemma_ for token in doc if not token.is_stop and not token.is_punct]
-        return " ".join(tokens)
\ No newline at end of file
+        return self._preprocess_many([text])[0]
+
+    def _preprocess_many(self, texts):
+        """Normalize a batch of texts through nlp.pipe, memoizing results"""
+        lowered = [text.lower() for text in texts]
+        missing = list(dict.fromkeys(t for t in lowered if t not in self._preprocessed))
+        for text, doc in zip(missing, self.nlp.pipe(missing)):
+            tokens = [token.lemma_ for token in doc if not token.is_stop and not token.is_punct]
+            self._preprocessed[text] = " ".join(tokens)
+        return [self._preprocessed[t] for t in lowered]
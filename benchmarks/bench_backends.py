@@ -0,0 +1,87 @@
+"""Selenium vs pipelined CDP page backend: per-step latency of bulk element operations.
+
+Run from the repository root:  python -m benchmarks.bench_backends --latency 0 0.002 0.01
+
+Both backends work on the same fake DOM. The Selenium backend goes through the
+fake WebDriver (latency added per command, serially); the CDP backend talks to
+a stand-in DevTools server over a real local websocket (latency added per
+command, overlapping when commands are pipelined).
+"""
+import argparse
+import time
+
+from benchmarks.fake_cdp import FakeCdpServer
+from benchmarks.fake_driver import FakeDriver, FakeSite
+from benchmarks.fixtures import FORM_SIZES, form_step
+from linkedin_api import OVERLAY_CLOSE_SELECTOR
+from page_backend import CdpBackend, SeleniumBackend
+
+
+class BenchPage(FakeSite):
+    """A form step under a stack of dismissable overlays (some already hidden)"""
+
+    def __init__(self, size, overlays):
+        counts, _ = FORM_SIZES[size]
+        toasts = "".join(
+            f'<div class="artdeco-toast"{" hidden" if i % 4 == 3 else ""}><p>Sign up to see more {i}</p>'
+            f'<button aria-label="Dismiss" data-fake-action="close-toast"></button></div>'
+            for i in range(overlays))
+        self.html = (f'<html><body>{toasts}<div class="jobs-easy-apply-modal" role="dialog">'
+                     f'<form>{form_step(counts, "bench")}</form></div></body></html>')
+
+    def navigate(self, driver, url):
+        driver.load(self.html, url)
+
+    def on_action(self, driver, action, target, clicked):
+        if action == "close-toast":
+            target.parent.remove()
+
+
+def run(backend, driver, operation, repeat):
+    """Mean seconds per operation over repeat fresh page loads"""
+    total = 0.0
+    result = None
+    for _ in range(repeat):
+        driver.get("https://www.linkedin.com/jobs/view/1")
+        start = time.perf_counter()
+        result = operation(backend)
+        total += time.perf_counter() - start
+    return total / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0, 0.002, 0.01],
+                        help="simulated seconds per command")
+    parser.add_argument("--size", choices=sorted(FORM_SIZES), default="large")
+    parser.add_argument("--overlays", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    operations = {
+        "dismiss_overlays": lambda backend: backend.dismiss_overlays(OVERLAY_CLOSE_SELECTOR),
+    }
+    print(f"{'latency ms':>10} {'operation':<17} {'backend':<9} {'ms/step':>9} {'commands':>9} {'result':>7}")
+    for latency in args.latency:
+        for name, operation in operations.items():
+            driver = FakeDriver(BenchPage(args.size, args.overlays), latency=latency)
+            server = FakeCdpServer(driver, latency=latency)
+            backends = [SeleniumBackend(driver), CdpBackend(server.ws_url)]
+            try:
+                for backend in backends:
+                    count = (lambda: driver.commands) if backend.name == "selenium" else \
+                        (lambda: backend.session.round_trips)
+                    before = count()
+                    seconds, result = run(backend, driver, operation, args.repeat)
+                    # Page loads go through the fake WebDriver too; don't count them
+                    commands = (count() - before) / args.repeat - (1 if backend.name == "selenium" else 0)
+                    print(f"{latency * 1000:>10.1f} {name:<17} {backend.name:<9} {seconds * 1000:>9.2f} "
+                          f"{commands:>9.1f} {result:>7}")
+            finally:
+                for backend in backends:
+                    backend.close()
+                server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Scoped listbox option resolver vs the old page-wide XPath lookup on a large dropdown page.
+
+Run from the repository root:  python -m benchmarks.bench_combobox_options --latency 0.002
+
+The page holds --filler nodes of unrelated job page content and one target
+combobox whose listbox has --options options, next to decoy listboxes with
+--decoys options that reuse the same texts. Each pick opens the target and
+chooses one answer. Wall time is fake-DOM work plus simulated latency; the
+page-wide XPath scans every node of the document the way a browser would, the
+resolver only the listbox the combobox controls.
+"""
+import argparse
+import logging
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks import fake_dom
+from benchmarks.fake_driver import FakeDriver
+from benchmarks.fixtures import ListboxSite
+from option_resolver import OptionResolver
+from waits import WaitEngine
+
+PAGE_URL = "https://www.linkedin.com/jobs/view/1/apply/"
+
+
+def xpath_choose(driver, combobox, value):
+    """What _choose_custom_option used to do"""
+    combobox.click()
+    driver.find_element(By.XPATH, f"//span[contains(text(), '{value}')]").click()
+
+
+def resolver_choose(driver, combobox, value):
+    OptionResolver(driver, WaitEngine(driver)).choose(combobox, value)
+
+
+APPROACHES = {"xpath": xpath_choose, "resolver": resolver_choose}
+
+
+def run(approach, site, values, latency):
+    driver = FakeDriver(site, latency=latency)
+    driver.get(PAGE_URL)
+    try:  # warm-up pick: lazy imports and first-use costs stay out of the timings
+        APPROACHES[approach](driver, driver.find_element(By.CSS_SELECTOR, "[aria-controls='target-listbox']"),
+                             values[0])
+    except Exception:
+        pass
+    driver.get(PAGE_URL)
+    commands, seconds, correct, errors = 0, 0.0, 0, 0
+    for value in values:
+        combobox = driver.find_element(By.CSS_SELECTOR, "[aria-controls='target-listbox']")
+        before = driver.commands
+        start = time.perf_counter()
+        try:
+            APPROACHES[approach](driver, combobox, value)
+        except Exception:
+            errors += 1
+        seconds += time.perf_counter() - start
+        commands += driver.commands - before
+        chosen = fake_dom.select_one(driver.document, "[aria-controls='target-listbox']").text_content().strip()
+        correct += chosen == value
+        driver.get(PAGE_URL)  # fresh page, nothing chosen yet
+    return seconds / len(values), commands / len(values), correct, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--options", type=int, default=2000, help="options in the target listbox")
+    parser.add_argument("--decoys", type=int, default=5000, help="options in decoy listboxes elsewhere on the page")
+    parser.add_argument("--filler", type=int, default=20000, help="nodes of unrelated page content")
+    parser.add_argument("--picks", type=int, default=5, help="answers chosen per approach")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per WebDriver command")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    site = ListboxSite(args.options, args.decoys, filler=args.filler)
+    step = max(args.options // args.picks, 1)
+    values = [site.labels[min(args.options - 1, step * (i + 1) - 1)] for i in range(args.picks - 1)]
+    values.append("Bachelor's Degree")  # a quote in the answer breaks the interpolated XPath
+
+    print(f"{args.options} options, {args.decoys} decoys, {args.filler} filler nodes, {len(values)} picks, latency {args.latency * 1000:.1f} ms")
+    print(f"{'approach':<9} {'ms/pick':>9} {'commands':>9} {'correct':>8} {'errors':>7}")
+    for approach in APPROACHES:
+        seconds, commands, correct, errors = run(approach, site, values, args.latency)
+        print(f"{approach:<9} {seconds * 1000:>9.1f} {commands:>9.1f} {correct:>5}/{len(values):<2} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Easy Apply flow on an in-process fake WebDriver: wall time, driver commands and sleep time.
+
+Run from the repository root:  python -m benchmarks.bench_easy_apply --no-sleep
+
+Scenarios exercise _fill_all_fields (one form step), _apply_to_job (a whole
+multi-step form) and process_applications (search results through submit) on
+synthetic forms of several sizes, in both the snapshot and per-element fill
+modes. Nothing touches the network, Chrome or the real data directories.
+"""
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import config
+from benchmarks.fake_driver import FakeDriver
+from benchmarks.fixtures import FORM_SIZES, EasyApplySite, make_jobs
+from structured_logging import setup_logging
+
+SEARCH_URL = "https://www.linkedin.com/jobs/search/?keywords=python&location=Remote&f_AL=true"
+MODES = {"snapshot": True, "per-element": False}
+
+
+class SleepMeter:
+    """Stands in for time.sleep: adds up the project's fixed sleeps and, with skip=True, skips them.
+
+    WebDriverWait polling is passed through untouched: its deadline is wall-clock
+    time, so skipping its sleeps would only turn a timeout into a busy loop.
+    """
+
+    def __init__(self, skip):
+        self.skip = skip
+        self.total = 0.0
+        self._sleep = None
+
+    def __call__(self, seconds):
+        if sys._getframe(1).f_globals.get("__name__", "").startswith("selenium."):
+            self._sleep(seconds)
+            return
+        self.total += seconds
+        if not self.skip:
+            self._sleep(seconds)
+
+    def __enter__(self):
+        self._sleep = time.sleep
+        time.sleep = self
+        return self
+
+    def __exit__(self, *exc):
+        time.sleep = self._sleep
+
+
+def isolate_state(workdir):
+    """Point the ledger, fill cache, screenshots, step recordings, TF-IDF index and session at a scratch directory"""
+    config.LEDGER_CONFIG['path'] = os.path.join(workdir, "applications.sqlite3")
+    config.FILL_CACHE_CONFIG['path'] = os.path.join(workdir, "fill_plans.json")
+    config.SCREENSHOT_CONFIG['directory'] = os.path.join(workdir, "screenshots")
+    config.RECORDER_CONFIG['directory'] = os.path.join(workdir, "step_snapshots")
+    config.AI_CONFIG['index_dir'] = os.path.join(workdir, "tfidf_index")
+    config.SESSION_CONFIG.update(path=os.path.join(workdir, "session.bin"),
+                                 key_path=os.path.join(workdir, "session.key"))
+
+
+def make_bot(site, latency, use_ai):
+    from linkedin_api import LinkedInAutomator
+
+    driver = FakeDriver(site, latency=latency)
+    bot = LinkedInAutomator("bench@example.com", "not-a-password", config.QUESTION_DATABASE, driver=driver)
+    if bot.ai_processor is not None:
+        bot.ai_processor.warmup_thread.join()
+        if not use_ai:
+            bot.ai_processor = None
+    return bot
+
+
+def measure(bot, meter, run, units):
+    """Run run() once and return per-unit (seconds, commands, sleep seconds)"""
+    commands, slept = bot.driver.commands, meter.total
+    start = time.perf_counter()
+    run()
+    wall = time.perf_counter() - start
+    return wall / units, (bot.driver.commands - commands) / units, (meter.total - slept) / units
+
+
+def open_job(bot, job_id):
+    bot.driver.get(SEARCH_URL)
+    bot.driver.execute_script("arguments[0].click();", bot.driver.find_element(
+        "css selector", f"[data-job-id='{job_id}']"))
+
+
+def scenario_fill(size, args, meter):
+    site = EasyApplySite(make_jobs(1, size))
+    bot = make_bot(site, args.latency, args.ai)
+    job_id = next(iter(site.jobs))
+    try:
+        open_job(bot, job_id)
+
+        def run():
+            for _ in range(args.repeat):
+                bot.driver.find_element("css selector", ".jobs-apply-button").click()  # fresh, empty step 1
+                bot._fill_all_fields()
+        return measure(bot, meter, run, args.repeat)
+    finally:
+        bot.close()
+
+
+def scenario_apply(size, args, meter):
+    jobs = make_jobs(args.repeat, size)
+    site = EasyApplySite(jobs)
+    bot = make_bot(site, args.latency, args.ai)
+    try:
+        def run():
+            for job in jobs:
+                open_job(bot, job.job_id)
+                outcome, step, detail = bot._apply_to_job(job.job_id)
+                if outcome != "submitted":
+                    raise RuntimeError(f"job {job.job_id} not submitted at step {step}: {detail}")
+        return measure(bot, meter, run, len(jobs))
+    finally:
+        bot.close()
+
+
+def scenario_process(size, args, meter):
+    site = EasyApplySite(make_jobs(args.jobs, size, easy_apply_every=args.no_easy_apply_every))
+    bot = make_bot(site, args.latency, args.ai)
+    try:
+        def run():
+            bot.search_jobs("python")
+            if not bot.process_applications(max_jobs=args.jobs):
+                raise RuntimeError("process_applications failed")
+        return measure(bot, meter, run, args.jobs)
+    finally:
+        bot.close()
+
+
+SCENARIOS = {"fill": scenario_fill, "apply": scenario_apply, "process": scenario_process}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="scenario(s) to run (default: all)")
+    parser.add_argument("--size", choices=sorted(FORM_SIZES), action="append",
+                        help="form size(s) to run (default: all)")
+    parser.add_argument("--mode", choices=sorted(MODES), action="append",
+                        help="fill mode(s) to run (default: both)")
+    parser.add_argument("--repeat", type=int, default=5, help="form steps / applications per fill and apply run")
+    parser.add_argument("--jobs", type=int, default=10, help="jobs per process_applications run")
+    parser.add_argument("--no-easy-apply-every", type=int, default=0,
+                        help="make every Nth job lack Easy Apply in the process scenario (waits out the timeout)")
+    parser.add_argument("--lookahead", type=int, default=config.PREFETCH_CONFIG['lookahead'],
+                        help="jobs prefetched ahead in the process scenario (0 disables)")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per WebDriver command")
+    parser.add_argument("--no-sleep", action="store_true", help="account for time.sleep calls without sleeping")
+    parser.add_argument("--ai", action="store_true", help="keep the spaCy/TF-IDF fuzzy matcher enabled")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_easy_apply_")
+    setup_logging(os.path.join(workdir, "logs"), level=logging.ERROR)
+    isolate_state(workdir)
+    config.PREFETCH_CONFIG['lookahead'] = args.lookahead
+    use_snapshot = config.FILL_CONFIG['use_snapshot']
+
+    print(f"{'scenario':<8} {'size':<7} {'mode':<12} {'ms/unit':>10} {'commands':>9} {'sleep s':>8}")
+    try:
+        with SleepMeter(args.no_sleep) as meter:
+            for name in args.scenario or ["fill", "apply", "process"]:
+                for size in args.size or ["small", "medium", "large"]:
+                    for mode in args.mode or ["per-element", "snapshot"]:
+                        config.FILL_CONFIG['use_snapshot'] = MODES[mode]
+                        for path in (config.LEDGER_CONFIG['path'], config.FILL_CACHE_CONFIG['path']):
+                            if os.path.exists(path):
+                                os.remove(path)
+                        seconds, commands, slept = SCENARIOS[name](size, args, meter)
+                        print(f"{name:<8} {size:<7} {mode:<12} {seconds * 1000:>10.1f} "
+                              f"{commands:>9.1f} {slept:>8.2f}")
+    finally:
+        config.FILL_CONFIG['use_snapshot'] = use_snapshot
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
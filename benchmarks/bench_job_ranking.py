@@ -0,0 +1,57 @@
+"""Batched TF-IDF job ranking for synthetic postings of several batch sizes.
+
+Run from the repository root:  python -m benchmarks.bench_job_ranking --postings 1000 5000 10000
+"""
+import argparse
+import logging
+import random
+import time
+
+from job_feed import JobRecord
+from job_ranker import JobRanker
+
+TITLES = ["Python Developer", "Senior Backend Engineer", "Django Developer", "Data Analyst", "Java Developer",
+          "Frontend Engineer", "Staff Engineer", "Sales Manager", "DevOps Engineer", "Software Engineer Intern"]
+PHRASES = ["python", "django", "rest api", "sql", "postgresql", "docker", "aws", "react", "typescript",
+           "java", "spring", "kubernetes", "excel", "customer success",
+           "agile teams", "on-call rotation", "unit testing", "code review", "cold calling", "tableau"]
+EXCLUDED = ["security clearance", "internship", "unpaid"]
+
+
+def synthetic_postings(count, words=120, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        description = " ".join(rng.choice(PHRASES) for _ in range(words // 2))
+        if rng.random() < 0.05:
+            description += f" {rng.choice(EXCLUDED)} only"
+        records.append(JobRecord(str(5000000 + i), f"{rng.choice(TITLES)} {i % 97}", f"Company {i % 53}",
+                                 "Remote", description=f"We are hiring. {description}."))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=3, help="rankings to average per size")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    ranker = JobRanker()
+    ranker.rank(synthetic_postings(10))  # load scikit-learn outside the timings
+    print(f"{'postings':>9} {'ms/rank':>9} {'us/posting':>11} {'kept':>6} {'excluded':>9}")
+    for count in args.postings:
+        records = synthetic_postings(count)
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            ranked = ranker.rank(records)
+            times.append(time.perf_counter() - start)
+        seconds = sum(times) / len(times)
+        _, excluded = ranker.scores([ranker._document(r) for r in records])
+        print(f"{count:>9} {seconds * 1000:>9.1f} {seconds * 1e6 / count:>11.1f} {len(ranked):>6} "
+              f"{int(excluded.sum()):>9}")
+
+
+if __name__ == "__main__":
+    main()
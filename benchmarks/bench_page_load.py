@@ -0,0 +1,201 @@
+"""Bytes transferred and page-ready time per navigation with the full vs lean page-loading profile.
+
+Run from the repository root (needs Chrome):  python -m benchmarks.bench_page_load --rounds 5
+
+A local fixture server stands in for LinkedIn: a search results page and job
+detail pages whose markup is server-rendered, with company logos on the image
+CDN path, web fonts, an autoplaying promo video, tag manager and ad pixel
+scripts (served under their real host names as the first path segment, so the
+blocking patterns match), and the page's own JS and CSS. Subresources answer
+after --delay seconds, third-party scripts after --slow-delay. Responses are
+no-store so every round is a cold load. "ready s" is how long driver.get
+blocked and "page KB" what PageLoader's report saw at that point; "server KB"
+is everything the browser fetched once the page settled.
+"""
+import argparse
+import logging
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+
+import config
+from page_load import PageLoader, configure_options
+
+KB = 1024
+
+# path prefix -> (content type, size in bytes, group)
+ASSETS = {
+    "/media.licdn.com/dms/image/": ("image/jpeg", 40 * KB, "images"),
+    "/static/fonts/": ("font/woff2", 50 * KB, "fonts"),
+    "/static/promo.mp4": ("video/mp4", 1500 * KB, "media"),
+    "/www.googletagmanager.com/": ("text/javascript", 90 * KB, "analytics"),
+    "/px.ads.linkedin.com/": ("text/javascript", 60 * KB, "analytics"),
+    "/static/app.js": ("text/javascript", 300 * KB, "page"),
+    "/static/app.css": ("text/css", 30 * KB, "page"),
+}
+
+HEAD = ('<link rel="stylesheet" href="/static/app.css">'
+        '<script src="/www.googletagmanager.com/gtm.js" async></script>'
+        '<script src="/px.ads.linkedin.com/collect.js"></script>'
+        '<script src="/static/app.js" defer></script>')
+
+
+def css():
+    faces = "".join(f"@font-face{{font-family:f{i};src:url(/static/fonts/f{i}.woff2)}}" for i in range(4))
+    rules = "".join(f".f{i}{{font-family:f{i}}}" for i in range(4))
+    return (faces + rules).ljust(ASSETS["/static/app.css"][1], " ")
+
+
+def search_page(jobs):
+    cards = "".join(
+        f'<li data-occludable-job-id="{4000000 + i}"><div class="job-card-container job-card-container--clickable f{i % 4}">'
+        f'<img src="/media.licdn.com/dms/image/logo-{i}" width="48" height="48">'
+        f'<a class="job-card-container__link" href="/jobs/view/{4000000 + i}/"><strong>Python Developer {i}</strong></a>'
+        f'</div></li>' for i in range(jobs))
+    return (f'<!doctype html><html><head><title>Jobs | LinkedIn</title>{HEAD}</head><body class="f0">'
+            f'<video src="/static/promo.mp4" autoplay muted></video>'
+            f'<ul class="jobs-search-results-list">{cards}</ul></body></html>')
+
+
+def details_page(job_id):
+    images = "".join(f'<img src="/media.licdn.com/dms/image/people-{job_id}-{i}">' for i in range(8))
+    return (f'<!doctype html><html><head><title>Job {job_id} | LinkedIn</title>{HEAD}</head><body class="f1">'
+            f'<img src="/media.licdn.com/dms/image/banner-{job_id}"><div class="jobs-details f2">'
+            f'<h2>Python Developer</h2><button class="jobs-apply-button">Easy Apply</button>'
+            f'<div class="jobs-description f3">Python, Django, REST APIs and SQL.</div>{images}</div></body></html>')
+
+
+class FixtureServer:
+    """Threaded HTTP server that counts what it sends, per asset group"""
+
+    def __init__(self, delay, slow_delay, jobs):
+        self.delay, self.slow_delay, self.jobs = delay, slow_delay, jobs
+        self.lock = threading.Lock()
+        self.reset()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.serve(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True)
+        self.thread.start()
+
+    @property
+    def origin(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def reset(self):
+        with self.lock:
+            self.bytes = defaultdict(int)
+            self.requests = 0
+            self.last_request = time.perf_counter()
+
+    def serve(self, handler):
+        path = handler.path.split("?")[0]
+        asset = next((value for prefix, value in ASSETS.items() if path.startswith(prefix)), None)
+        if asset:
+            content_type, size, group = asset
+            time.sleep(self.slow_delay if group == "analytics" else self.delay)
+            body = css().encode() if path == "/static/app.css" else b"\0" * size
+        elif path.startswith("/jobs/search"):
+            content_type, group, body = "text/html", "document", search_page(self.jobs).encode()
+        elif path.startswith("/jobs/view/"):
+            content_type, group, body = "text/html", "document", details_page(path.split("/")[3]).encode()
+        else:
+            handler.send_error(404)
+            return
+        handler.send_response(200)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("Cache-Control", "no-store")
+        handler.end_headers()
+        try:
+            handler.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            return  # the browser stopped caring (navigated away)
+        with self.lock:
+            self.bytes[group] += len(body)
+            self.requests += 1
+            self.last_request = time.perf_counter()
+
+    def settled(self, quiet=0.5):
+        with self.lock:
+            return time.perf_counter() - self.last_request > quiet
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def run(profile, server, args):
+    config.PAGE_LOAD_CONFIG.update(profile=profile, headless=not args.headed)
+    driver = webdriver.Chrome(options=configure_options(webdriver.ChromeOptions()))
+    try:
+        loader = PageLoader(driver)
+        urls = [f"{server.origin}/jobs/search/?keywords=python"] + \
+               [f"{server.origin}/jobs/view/{4000000 + i}/" for i in range(args.details)]
+        rows = []
+        for _ in range(args.rounds):
+            for url in urls:
+                server.reset()
+                stats = loader.get(url)
+                deadline = time.perf_counter() + 30
+                while time.perf_counter() < deadline and not (
+                        driver.execute_script("return document.readyState") == "complete" and server.settled()):
+                    time.sleep(0.1)
+                with server.lock:
+                    rows.append((url, stats, dict(server.bytes), server.requests))
+        return rows
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--details", type=int, default=3, help="job detail pages per round")
+    parser.add_argument("--jobs", type=int, default=25, help="cards on the results page")
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds before a subresource is answered")
+    parser.add_argument("--slow-delay", type=float, default=0.8, help="seconds before third-party scripts answer")
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    saved = dict(config.PAGE_LOAD_CONFIG)
+    server = FixtureServer(args.delay, args.slow_delay, args.jobs)
+    results = {}
+    try:
+        for profile in ("full", "lean"):
+            results[profile] = run(profile, server, args)
+    finally:
+        config.PAGE_LOAD_CONFIG.update(saved)
+        server.close()
+
+    print(f"{'profile':<8} {'page':<8} {'ready s':>8} {'DOM ready ms':>12} {'page KB':>8} {'server KB':>10} "
+          f"{'requests':>9} {'images/fonts/media/analytics KB':>32}")
+    for profile, rows in results.items():
+        for page in ("search", "details"):
+            picked = [r for r in rows if ("/jobs/search" in r[0]) == (page == "search")]
+            n = len(picked)
+            ready = sum(s['ready_s'] for _, s, _, _ in picked) / n
+            dom = sum(s.get('dom_ready_ms', 0) for _, s, _, _ in picked) / n
+            page_kb = sum(s.get('bytes', 0) for _, s, _, _ in picked) / n / KB
+            server_kb = sum(sum(b.values()) for _, _, b, _ in picked) / n / KB
+            requests = sum(r for _, _, _, r in picked) / n
+            groups = "/".join(f"{sum(b.get(g, 0) for _, _, b, _ in picked) / n / KB:.0f}"
+                              for g in ("images", "fonts", "media", "analytics"))
+            print(f"{profile:<8} {page:<8} {ready:>8.2f} {dom:>12.0f} {page_kb:>8.0f} {server_kb:>10.0f} "
+                  f"{requests:>9.1f} {groups:>32}")
+
+
+if __name__ == "__main__":
+    main()
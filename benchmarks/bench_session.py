@@ -0,0 +1,64 @@
+"""Time to first search with a full login vs a restored encrypted session, on the fake WebDriver.
+
+Run from the repository root:  python -m benchmarks.bench_session --no-sleep
+
+Each path starts from a fresh browser profile (a new FakeDriver) and runs
+start_session() then search_jobs(). "login" has no saved session yet and saves
+one; "restored" reuses it; "expired" finds the site no longer accepts it and
+falls back to login. With --no-sleep the typing pauses are accounted, not slept,
+and "first search s" adds them back in. Login's WebDriverWait timeouts are real.
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+import config
+from benchmarks.bench_easy_apply import SleepMeter, isolate_state, make_bot
+from benchmarks.fixtures import EasyApplySite, make_jobs
+from structured_logging import setup_logging
+
+
+def first_search(site, args, meter):
+    bot = make_bot(site, args.latency, use_ai=False)
+    try:
+        commands, slept = bot.driver.commands, meter.total
+        start = time.perf_counter()
+        if not bot.start_session() or not bot.search_jobs("python"):
+            raise RuntimeError("could not reach the search results")
+        wall = time.perf_counter() - start
+        slept = meter.total - slept
+        return bot.session_source, wall, bot.driver.commands - commands, slept, wall + (slept if meter.skip else 0)
+    finally:
+        bot.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per WebDriver command")
+    parser.add_argument("--no-sleep", action="store_true", help="account for time.sleep calls without sleeping")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_session_")
+    setup_logging(os.path.join(workdir, "logs"), level=logging.ERROR)
+    isolate_state(workdir)
+    config.SESSION_CONFIG['enabled'] = True
+    os.environ.pop(config.SESSION_CONFIG['key_env'], None)
+    site = EasyApplySite(make_jobs(10, "small"), require_login=True)
+
+    print(f"{'path':<9} {'signed in by':<17} {'wall s':>8} {'commands':>9} {'sleep s':>8} {'first search s':>15}")
+    try:
+        with SleepMeter(args.no_sleep) as meter:
+            for path in ("login", "restored", "expired"):
+                if path == "expired":
+                    site.expire_sessions()
+                source, wall, commands, slept, total = first_search(site, args, meter)
+                print(f"{path:<9} {source:<17} {wall:>8.2f} {commands:>9} {slept:>8.2f} {total:>15.2f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Applications per minute over a long process_applications run, with and without the browser watchdog.
+
+Run from the repository root:  python -m benchmarks.bench_soak --jobs 500
+
+The fixture site leaks the way a long-lived job search tab does. Every opened
+job adds JS heap, detached DOM nodes and listeners to the fake browser, and
+every WebDriver command gets slower as the heap grows: the latency doubles once
+the heap has grown by --slowdown-mb. With the watchdog, Performance.getMetrics
+is sampled every --every jobs and the browser is recycled past --max-heap-mb.
+The table shows applications per minute for each window of jobs. Sleeps are
+accounted, not slept.
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+import config
+from benchmarks.bench_easy_apply import SleepMeter, isolate_state
+from benchmarks.fake_driver import FakeDriver
+from benchmarks.fixtures import EasyApplySite, make_jobs
+from structured_logging import setup_logging
+
+MB = 1024 * 1024
+
+
+class LeakySite(EasyApplySite):
+    """EasyApplySite whose browser gets heavier and slower with every job opened"""
+
+    def __init__(self, jobs, latency, leak_mb, slowdown_mb):
+        super().__init__(jobs)
+        self.latency = latency
+        self.leak_mb = leak_mb
+        self.slowdown_mb = slowdown_mb
+        self.opened = []  # perf_counter() of every job opened
+        self.browsers = 0
+
+    def attach(self, driver):
+        self.browsers += 1
+        self.baseline = driver.heap_bytes
+
+    def on_action(self, driver, action, target, clicked):
+        super().on_action(driver, action, target, clicked)
+        if action == "open-job":
+            self.opened.append(time.perf_counter())
+            driver.heap_bytes += int(self.leak_mb * MB)
+            driver.detached_nodes += 400
+            driver.listeners += 60
+            driver.latency = self.latency * (1 + (driver.heap_bytes - self.baseline) / MB / self.slowdown_mb)
+
+
+def soak(args, watchdog):
+    from linkedin_api import LinkedInAutomator
+
+    config.WATCHDOG_CONFIG.update(enabled=watchdog, every_jobs=args.every, max_heap_mb=args.max_heap_mb)
+    for path in (config.LEDGER_CONFIG['path'], config.FILL_CACHE_CONFIG['path'], config.SESSION_CONFIG['path']):
+        if os.path.exists(path):
+            os.remove(path)
+    site = LeakySite(make_jobs(args.jobs, "small"), args.latency, args.leak_mb, args.slowdown_mb)
+    bot = LinkedInAutomator("bench@example.com", "not-a-password", config.QUESTION_DATABASE,
+                            driver=FakeDriver(site, latency=args.latency),
+                            driver_factory=lambda: FakeDriver(site, latency=args.latency))
+    if bot.ai_processor is not None:
+        bot.ai_processor.warmup_thread.join()
+        bot.ai_processor = None
+    try:
+        start = time.perf_counter()
+        bot.search_jobs("python")
+        if not bot.process_applications(max_jobs=args.jobs):
+            raise RuntimeError("process_applications failed")
+        wall = time.perf_counter() - start
+    finally:
+        bot.close()
+    return site, wall
+
+
+def window_rates(opened, window):
+    """Applications per minute for each consecutive window of opened jobs"""
+    rates = []
+    for end in range(window, len(opened) + 1, window):
+        first = opened[end - window - 1] if end > window else opened[0]
+        count = window if end > window else window - 1
+        rates.append(count * 60 / max(opened[end - 1] - first, 1e-9))
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--window", type=int, default=50, help="jobs per reported window")
+    parser.add_argument("--latency", type=float, default=0.001, help="simulated seconds per command, fresh browser")
+    parser.add_argument("--leak-mb", type=float, default=1.0, help="heap added per opened job")
+    parser.add_argument("--slowdown-mb", type=float, default=100.0, help="heap growth that doubles command latency")
+    parser.add_argument("--every", type=int, default=10, help="watchdog sampling interval in jobs")
+    parser.add_argument("--max-heap-mb", type=float, default=64, help="watchdog heap limit")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_soak_")
+    setup_logging(os.path.join(workdir, "logs"), level=logging.ERROR)
+    isolate_state(workdir)
+    config.SESSION_CONFIG['enabled'] = True
+    config.PREFETCH_CONFIG['lookahead'] = 2
+    watchdog = dict(config.WATCHDOG_CONFIG)
+
+    results = {}
+    try:
+        with SleepMeter(skip=True):
+            for name, enabled in (("no watchdog", False), ("watchdog", True)):
+                site, wall = soak(args, enabled)
+                results[name] = (window_rates(site.opened, args.window), site, wall)
+    finally:
+        config.WATCHDOG_CONFIG.update(watchdog)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'jobs':>11} " + " ".join(f"{name + ' apps/min':>22}" for name in results))
+    windows = max(len(rates) for rates, _, _ in results.values())
+    for w in range(windows):
+        cells = [f"{rates[w]:>22.0f}" if w < len(rates) else f"{'':>22}" for rates, _, _ in results.values()]
+        print(f"{w * args.window + 1:>5}-{(w + 1) * args.window:<5} " + " ".join(cells))
+    for name, (rates, site, wall) in results.items():
+        print(f"{name}: {len(site.submitted)} submitted in {wall:.1f}s, {site.browsers} browser(s), "
+              f"last/first window {rates[-1] / rates[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
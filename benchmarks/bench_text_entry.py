@@ -0,0 +1,79 @@
+"""Round trips and seconds per field for each text entry strategy, on the fake WebDriver.
+
+Run from the repository root:  python -m benchmarks.bench_text_entry --latency 0.005
+
+Every strategy fills the same login and Easy Apply text inputs, one field type
+per row. per_char's typing pauses are accounted, not slept, and "s/field" adds
+them back in; "ok" counts fields whose value ended up exactly as intended.
+"""
+import argparse
+import time
+
+from selenium.webdriver.common.by import By
+
+import config
+from benchmarks.bench_easy_apply import SleepMeter
+from benchmarks.fake_driver import FakeDriver, FakeSite
+from text_entry import STRATEGIES, TextEntry
+
+# field type -> value, as login and the Easy Apply forms would type them
+FIELDS = {
+    'username': "jane.doe@example.com",
+    'password': "correct-horse-battery-staple",
+    'email': "jane.doe@example.com",
+    'tel': "+251911234567",
+    'number': "3",
+    'text': "Python, Django, REST APIs and PostgreSQL.",
+}
+
+
+class FormSite(FakeSite):
+    """One page with an input per field type"""
+
+    def navigate(self, driver, url):
+        inputs = "".join(f'<label for="{name}">{name}</label>'
+                         f'<input id="{name}" type="{"password" if name == "password" else name}">'
+                         for name in FIELDS)
+        driver.load(f"<html><body><form>{inputs}</form></body></html>", url)
+
+
+def run(strategy, latency, rounds, meter):
+    driver = FakeDriver(FormSite(), latency=latency)
+    driver.get("https://www.linkedin.com/jobs/view/1/apply/")
+    entry = TextEntry(driver)
+    rows = {}
+    for field_type, value in FIELDS.items():
+        element = driver.find_element(By.ID, field_type)
+        commands, seconds, ok = 0, 0.0, 0
+        for _ in range(rounds):
+            before, slept = driver.commands, meter.total
+            start = time.perf_counter()
+            used = entry.type(element, value, field_type)
+            seconds += time.perf_counter() - start + (meter.total - slept if meter.skip else 0)
+            commands += driver.commands - before
+            ok += used == strategy and element.node.value == value
+        rows[field_type] = (commands / rounds, seconds / rounds, ok)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated seconds per WebDriver command")
+    parser.add_argument("--rounds", type=int, default=5, help="times each field is filled per strategy")
+    args = parser.parse_args()
+
+    forced = config.TEXT_ENTRY_CONFIG['strategy']
+    print(f"{'strategy':<12} {'field':<9} {'chars':>5} {'cmds/field':>10} {'s/field':>8} {'ok':>5}")
+    try:
+        with SleepMeter(skip=True) as meter:
+            for strategy in STRATEGIES:
+                config.TEXT_ENTRY_CONFIG['strategy'] = strategy
+                for field_type, (commands, seconds, ok) in run(strategy, args.latency, args.rounds, meter).items():
+                    print(f"{strategy:<12} {field_type:<9} {len(FIELDS[field_type]):>5} {commands:>10.1f} "
+                          f"{seconds:>8.3f} {ok:>2}/{args.rounds}")
+    finally:
+        config.TEXT_ENTRY_CONFIG['strategy'] = forced
+
+
+if __name__ == "__main__":
+    main()
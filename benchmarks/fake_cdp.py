@@ -0,0 +1,117 @@
+"""Local stand-in for Chrome's DevTools websocket, serving a FakeDriver's DOM.
+
+Implements the protocol subset page_backend.CdpBackend uses (DOM.getDocument,
+DOM.querySelectorAll, DOM.resolveNode, Runtime.callFunctionOn,
+Runtime.releaseObjectGroup). Every command is answered after `latency` seconds
+on its own task, so pipelined commands overlap like they would against Chrome.
+"""
+import asyncio
+import itertools
+import json
+import re
+import threading
+
+from websockets.asyncio.server import serve
+
+from benchmarks import fake_dom
+
+
+class FakeCdpServer:
+    def __init__(self, driver, latency=0.0):
+        self.driver = driver
+        self.latency = latency
+        self.commands = 0
+        self._ids = itertools.count(1)
+        self._node_ids = {}  # id(node) -> nodeId
+        self._nodes = {}     # nodeId -> node
+        self._replies = set()
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fake-cdp", daemon=True)
+        self._thread.start()
+        self._started.wait(5)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        async def start():
+            return await serve(self._handle, "127.0.0.1", 0, max_size=None)
+        self._server = self.loop.run_until_complete(start())
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        self.loop.run_forever()
+
+    @property
+    def ws_url(self):
+        return f"ws://127.0.0.1:{self.port}/devtools/page/FAKE"
+
+    def close(self):
+        async def shutdown():
+            await asyncio.gather(*self._replies, return_exceptions=True)
+            self._server.close()
+            await self._server.wait_closed()
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _handle(self, websocket):
+        async for raw in websocket:
+            task = asyncio.ensure_future(self._reply(websocket, json.loads(raw)))
+            self._replies.add(task)
+            task.add_done_callback(self._replies.discard)
+
+    async def _reply(self, websocket, message):
+        self.commands += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        try:
+            response = {'id': message['id'], 'result': self.dispatch(message['method'], message.get('params', {}))}
+        except Exception as e:
+            response = {'id': message['id'], 'error': {'code': -32000, 'message': str(e)}}
+        await websocket.send(json.dumps(response))
+
+    # --- protocol --------------------------------------------------------------
+
+    def _node_id(self, node):
+        key = id(node)
+        if key not in self._node_ids:
+            self._node_ids[key] = next(self._ids)
+            self._nodes[self._node_ids[key]] = node
+        return self._node_ids[key]
+
+    def _node(self, node_id):
+        node = self._nodes.get(node_id)
+        if node is None or node.root() is not self.driver.document:
+            raise ValueError("Could not find node with given id")
+        return node
+
+    def dispatch(self, method, params):
+        if method == "DOM.getDocument":
+            return {'root': {'nodeId': self._node_id(self.driver.document), 'nodeName': "#document"}}
+        if method == "DOM.querySelectorAll":
+            scope = self._node(params['nodeId'])
+            return {'nodeIds': [self._node_id(n) for n in fake_dom.select(scope, params['selector'])]}
+        if method == "DOM.resolveNode":
+            node = self._node(params['nodeId'])
+            return {'object': {'type': "object", 'subtype': "node", 'objectId': f"node-{self._node_id(node)}"}}
+        if method == "Runtime.callFunctionOn":
+            node = self._node(int(params['objectId'].split("-", 1)[1]))
+            tag = re.search(r"//\s*@jaa:([\w-]+)", params['functionDeclaration'])
+            handler = FUNCTIONS.get(tag.group(1)) if tag else None
+            if handler is None:
+                raise ValueError("Fake CDP server cannot run this function")
+            return {'result': {'type': "object", 'value': handler(self.driver, node)}}
+        if method == "Runtime.releaseObjectGroup":
+            return {}
+        raise ValueError(f"'{method}' wasn't found")
+
+
+def dismiss_if_visible(driver, node):
+    if not node.is_displayed():
+        return False
+    driver.click_node(node)
+    return True
+
+
+FUNCTIONS = {
+    "dismiss-if-visible": dismiss_if_visible,
+}
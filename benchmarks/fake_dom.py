@@ -0,0 +1,449 @@
+"""Minimal HTML DOM with the CSS selector and XPath subsets this project uses.
+
+Backs the offline fake WebDriver; it is not a general-purpose browser engine.
+"""
+import re
+from html import escape
+from html.parser import HTMLParser
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class Node:
+    """Element node. Children are Node instances or plain text strings."""
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []
+        # Live form state, seeded from attributes like a browser does
+        self.value = self.attrs.get("value", "")
+        self.checked = "checked" in self.attrs
+        self.selected = "selected" in self.attrs
+        self._id_index = None  # id -> node, kept on the root and dropped on every tree change
+
+    # --- tree ----------------------------------------------------------------
+
+    def append(self, child):
+        if isinstance(child, Node):
+            child.parent = self
+        self.children.append(child)
+        self._changed()
+        return child
+
+    def _changed(self):
+        self.root()._id_index = None
+
+    def elements(self):
+        return [c for c in self.children if isinstance(c, Node)]
+
+    def iter(self):
+        """This node and all descendants in document order"""
+        yield self
+        for child in self.elements():
+            yield from child.iter()
+
+    def descendants(self):
+        it = self.iter()
+        next(it)
+        return it
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def previous_element(self):
+        if self.parent is None:
+            return None
+        siblings = self.parent.elements()
+        index = siblings.index(self)
+        return siblings[index - 1] if index > 0 else None
+
+    def previous_elements(self):
+        if self.parent is None:
+            return []
+        siblings = self.parent.elements()
+        return list(reversed(siblings[:siblings.index(self)]))
+
+    def set_inner_html(self, html):
+        for child in self.elements():
+            child.parent = None
+        self.children = []
+        for child in parse_fragment(html):
+            self.append(child)
+        self._changed()
+
+    def remove(self):
+        if self.parent is not None:
+            self.parent._changed()
+            self.parent.children.remove(self)
+            self.parent = None
+
+    # --- content -------------------------------------------------------------
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    @property
+    def hidden(self):
+        style = self.attrs.get("style", "").replace(" ", "")
+        return "hidden" in self.attrs or "display:none" in style
+
+    def is_displayed(self):
+        return not self.hidden and not any(a.hidden for a in self.ancestors())
+
+    def text_content(self):
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.text_content())
+        return "".join(parts)
+
+    def inner_text(self):
+        """Visible text with whitespace collapsed, roughly like innerText"""
+        if not self.is_displayed():
+            return ""
+        return " ".join(self._visible_text().split())
+
+    def _visible_text(self):
+        parts = []
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif not child.hidden and child.tag not in ("script", "style"):
+                parts.append(" " + child._visible_text() + " ")
+        return "".join(parts)
+
+    def own_text(self):
+        return "".join(c for c in self.children if isinstance(c, str))
+
+    def outer_html(self, strip_scripts=False):
+        if strip_scripts and self.tag == "script":
+            return ""
+        attrs = dict(self.attrs)
+        if self.tag in ("input", "textarea") and self.value:
+            attrs["value"] = self.value
+        if self.tag == "input" and self.checked:
+            attrs["checked"] = ""
+        if self.tag == "option" and self.selected:
+            attrs["selected"] = ""
+        attr_html = "".join(f' {k}="{escape(v, quote=True)}"' if v != "" else f" {k}" for k, v in attrs.items())
+        if self.tag in VOID_TAGS:
+            return f"<{self.tag}{attr_html}>"
+        inner = "".join(escape(c, quote=False) if isinstance(c, str) else c.outer_html(strip_scripts)
+                        for c in self.children)
+        return f"<{self.tag}{attr_html}>{inner}</{self.tag}>"
+
+    def __repr__(self):
+        ident = f"#{self.attrs['id']}" if "id" in self.attrs else ""
+        return f"<{self.tag}{ident}>"
+
+
+class _Builder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#fragment")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = self.stack[-1].append(Node(tag, {k: (v if v is not None else "") for k, v in attrs}))
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.stack[-1].append(Node(tag, {k: (v if v is not None else "") for k, v in attrs}))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].append(data)
+
+
+def parse_fragment(html):
+    builder = _Builder()
+    builder.feed(html)
+    builder.close()
+    return list(builder.root.children)
+
+
+def parse_document(html):
+    """Parse HTML into a document node whose children are the top-level nodes"""
+    document = Node("#document")
+    for child in parse_fragment(html):
+        document.append(child)
+    return document
+
+
+# --- CSS selectors ------------------------------------------------------------
+
+_ATTR_RE = re.compile(r"""\[\s*([\w:-]+)\s*(?:([*^$~|]?=)\s*("[^"]*"|'[^']*'|[^\]\s]+))?\s*\]""")
+_TOKEN_RE = re.compile(r"""\s*([>+~])\s*|\s+""")
+
+
+def _split_top(text, sep):
+    parts, depth, quote, current = [], 0, None, ""
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char == sep and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _parse_compound(text):
+    """Return a list of predicate functions for one compound selector"""
+    preds = []
+    pos = 0
+    m = re.match(r"[a-zA-Z][\w-]*|\*", text)
+    if m:
+        tag = m.group(0).lower()
+        if tag != "*":
+            preds.append(lambda n, t=tag: n.tag == t)
+        pos = m.end()
+    while pos < len(text):
+        rest = text[pos:]
+        if rest[0] == "#":
+            m = re.match(r"#([\w-]+)", rest)
+            preds.append(lambda n, v=m.group(1): n.attrs.get("id") == v)
+        elif rest[0] == ".":
+            m = re.match(r"\.([\w-]+)", rest)
+            preds.append(lambda n, v=m.group(1): v in n.classes)
+        elif rest[0] == "[":
+            m = _ATTR_RE.match(rest)
+            name, op, value = m.group(1), m.group(2), m.group(3)
+            if value and value[0] in "'\"":
+                value = value[1:-1]
+            preds.append(_attr_predicate(name, op, value))
+        elif rest.startswith(":checked"):
+            m = re.match(r":checked", rest)
+            preds.append(lambda n: (n.tag == "input" and n.checked) or (n.tag == "option" and n.selected))
+        elif rest.startswith(":disabled"):
+            m = re.match(r":disabled", rest)
+            preds.append(lambda n: "disabled" in n.attrs)
+        else:
+            raise ValueError(f"Unsupported selector syntax: {text!r}")
+        pos += m.end()
+    return preds
+
+
+def _attr_predicate(name, op, value):
+    def check(node):
+        if name not in node.attrs:
+            return False
+        actual = node.attrs[name]
+        if op is None:
+            return True
+        if op == "=":
+            return actual == value
+        if op == "*=":
+            return value in actual
+        if op == "^=":
+            return actual.startswith(value)
+        if op == "$=":
+            return actual.endswith(value)
+        if op == "~=":
+            return value in actual.split()
+        return False
+    return check
+
+
+def _parse_complex(text):
+    """Return [(combinator, preds), ...] left to right; first combinator is None"""
+    parts = []
+    combinator = None
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        # Read one compound (up to whitespace or combinator outside brackets)
+        depth, quote, end = 0, None, pos
+        while end < len(text):
+            char = text[end]
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "'\"":
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+            elif depth == 0 and (char.isspace() or char in ">+~"):
+                break
+            end += 1
+        parts.append((combinator, _parse_compound(text[pos:end])))
+        m = _TOKEN_RE.match(text, end)
+        if not m or end >= len(text):
+            break
+        combinator = m.group(1) or " "
+        pos = m.end()
+    return parts
+
+
+def _matches_complex(node, parts):
+    combinator, preds = parts[-1]
+    if not all(p(node) for p in preds):
+        return False
+    if len(parts) == 1:
+        return True
+    rest = parts[:-1]
+    if combinator == ">":
+        return node.parent is not None and node.parent.tag != "#document" and _matches_complex(node.parent, rest)
+    if combinator == "+":
+        prev = node.previous_element()
+        return prev is not None and _matches_complex(prev, rest)
+    if combinator == "~":
+        return any(_matches_complex(prev, rest) for prev in node.previous_elements())
+    return any(_matches_complex(a, rest) for a in node.ancestors() if a.tag not in ("#document", "#fragment"))
+
+
+_CSS_CACHE = {}
+
+
+def compile_css(selector):
+    if selector not in _CSS_CACHE:
+        _CSS_CACHE[selector] = [_parse_complex(group) for group in _split_top(selector, ",")]
+    return _CSS_CACHE[selector]
+
+
+def matches(node, selector):
+    return any(_matches_complex(node, parts) for parts in compile_css(selector))
+
+
+def get_element_by_id(scope, element_id):
+    """document.getElementById: an index lookup, like a browser, rather than a tree walk"""
+    root = scope.root()
+    if root._id_index is None:
+        root._id_index = {}
+        for node in root.iter():
+            if "id" in node.attrs:
+                root._id_index.setdefault(node.attrs["id"], node)
+    return root._id_index.get(element_id)
+
+
+def select(scope, selector):
+    """querySelectorAll: descendants of scope matching the selector, in document order"""
+    groups = compile_css(selector)
+    return [n for n in scope.descendants() if any(_matches_complex(n, parts) for parts in groups)]
+
+
+def select_one(scope, selector):
+    groups = compile_css(selector)
+    for n in scope.descendants():
+        if any(_matches_complex(n, parts) for parts in groups):
+            return n
+    return None
+
+
+# --- XPath subset ---------------------------------------------------------------
+
+_STEP_RE = re.compile(r"(?:(?P<axis>[\w-]+)::)?(?P<test>\*|[\w-]+)(?P<preds>(?:\[[^\]]*\])*)")
+_LITERAL = r"""("[^"]*"|'[^']*')"""
+
+
+def _literal(text):
+    return text.strip()[1:-1]
+
+
+def _xpath_predicate(expr):
+    expr = expr.strip()
+    if expr.isdigit():
+        return int(expr)
+    m = re.fullmatch(r"contains\(\s*(\.|text\(\)|@[\w-]+)\s*,\s*" + _LITERAL + r"\s*\)", expr)
+    if m:
+        source, needle = m.group(1), _literal(m.group(2))
+        return lambda n: needle in _xpath_value(n, source)
+    m = re.fullmatch(r"normalize-space\(\s*(\.|text\(\))\s*\)\s*=\s*" + _LITERAL, expr)
+    if m:
+        source, expected = m.group(1), _literal(m.group(2))
+        return lambda n: " ".join(_xpath_value(n, source).split()) == expected
+    m = re.fullmatch(r"@([\w-]+)\s*=\s*" + _LITERAL, expr)
+    if m:
+        name, expected = m.group(1), _literal(m.group(2))
+        return lambda n: n.attrs.get(name) == expected
+    raise ValueError(f"Unsupported XPath predicate: {expr!r}")
+
+
+def _xpath_value(node, source):
+    if source == ".":
+        return node.text_content()
+    if source == "text()":
+        return node.own_text()
+    return node.attrs.get(source[1:], "")
+
+
+def _xpath_path(scope, path):
+    path = path.strip()
+    if path.startswith(".//"):
+        current, rest, axis_default = [scope], path[3:], "descendant"
+    elif path.startswith("//"):
+        current, rest, axis_default = [scope.root()], path[2:], "descendant"
+    elif path.startswith("./"):
+        current, rest, axis_default = [scope], path[2:], "child"
+    else:
+        raise ValueError(f"Unsupported XPath: {path!r}")
+
+    for step_text in _split_top(rest, "/"):
+        m = _STEP_RE.fullmatch(step_text)
+        if not m:
+            raise ValueError(f"Unsupported XPath step: {step_text!r}")
+        axis = m.group("axis") or axis_default
+        test = m.group("test")
+        preds = [_xpath_predicate(p) for p in re.findall(r"\[((?:[^\[\]]|'[^']*'|\"[^\"]*\")*)\]", m.group("preds"))]
+
+        result = []
+        for node in current:
+            if axis == "descendant":
+                candidates = list(node.descendants())
+            elif axis == "child":
+                candidates = node.elements()
+            elif axis == "preceding-sibling":
+                candidates = node.previous_elements()
+            elif axis == "parent":
+                candidates = [node.parent] if node.parent else []
+            else:
+                raise ValueError(f"Unsupported XPath axis: {axis!r}")
+            candidates = [c for c in candidates if test == "*" or c.tag == test]
+            for pred in preds:
+                if isinstance(pred, int):
+                    candidates = candidates[pred - 1:pred]
+                else:
+                    candidates = [c for c in candidates if pred(c)]
+            for c in candidates:
+                if c not in result:
+                    result.append(c)
+        current = result
+        axis_default = "child"
+    return current
+
+
+def xpath(scope, expression):
+    """Evaluate the XPath subset (unions, //, ./, child/descendant/preceding-sibling axes)"""
+    found = []
+    for path in _split_top(expression, "|"):
+        for node in _xpath_path(scope, path):
+            if node not in found:
+                found.append(node)
+    order = {id(n): i for i, n in enumerate(scope.root().iter())}
+    return sorted(found, key=lambda n: order.get(id(n), 0))
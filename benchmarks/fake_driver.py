@@ -0,0 +1,721 @@
+"""In-process fake of the Selenium WebDriver surface this project uses.
+
+The fake is backed by a fake_dom document. Every call that would be a WebDriver
+HTTP round trip goes through FakeDriver.execute, so CommandCounter and
+DriverInstrumentation see it, and an optional per-command latency is injected
+there. The project's injected scripts are recognised by their "// @jaa:<name>"
+tag and emulated in Python.
+"""
+import base64
+import json
+import re
+import time
+from urllib.parse import parse_qs, urlparse
+
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException)
+
+from benchmarks import fake_dom
+
+_real_sleep = time.sleep  # latency injection must not be affected by --no-sleep patching
+
+# 1x1 transparent PNG
+_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082")).decode()
+
+
+class FakeExecutor:
+    """Stands in for selenium's RemoteConnection: one execute() per round trip"""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def execute(self, command, params):
+        self.driver.commands += 1
+        if self.driver.latency:
+            _real_sleep(self.driver.latency)
+        return {"value": None}
+
+
+class FakeElement:
+    def __init__(self, driver, node):
+        self._driver = driver
+        self.node = node
+        self.id = f"fake-{id(node)}"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and other.node is self.node
+
+    def __hash__(self):
+        return hash(id(self.node))
+
+    def __repr__(self):
+        return f"FakeElement({self.node!r})"
+
+    def _live(self, command):
+        self._driver.execute(command)
+        if self.node.root() is not self._driver.document:
+            raise StaleElementReferenceException(f"{self.node!r} is no longer attached to the DOM")
+        return self.node
+
+    # --- queries -------------------------------------------------------------
+
+    def find_element(self, by="id", value=None):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"No element for {by}={value!r}")
+        return found[0]
+
+    def find_elements(self, by="id", value=None):
+        node = self._live("findChildElements")
+        return [FakeElement(self._driver, n) for n in _find(node, by, value)]
+
+    @property
+    def tag_name(self):
+        return self._live("getElementTagName").tag
+
+    @property
+    def text(self):
+        return self._live("getElementText").inner_text()
+
+    def get_attribute(self, name):
+        node = self._live("getElementAttribute")
+        return _property(node, name)
+
+    def get_dom_attribute(self, name):
+        return self._live("getElementAttribute").attrs.get(name)
+
+    def get_property(self, name):
+        return _property(self._live("getElementProperty"), name)
+
+    def value_of_css_property(self, name):
+        node = self._live("getElementValueOfCssProperty")
+        if name == "display":
+            return "none" if node.hidden else "block"
+        if name == "visibility":
+            return "visible"
+        if name == "opacity":
+            return "1"
+        return ""
+
+    def is_selected(self):
+        node = self._live("isElementSelected")
+        return _option_selected(node) if node.tag == "option" else node.checked
+
+    def is_enabled(self):
+        return "disabled" not in self._live("isElementEnabled").attrs
+
+    def is_displayed(self):
+        return self._live("isElementDisplayed").is_displayed()
+
+    @property
+    def rect(self):
+        self._live("getElementRect")
+        return {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    @property
+    def location(self):
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self):
+        return {"width": 100, "height": 20}
+
+    # --- interaction ---------------------------------------------------------
+
+    def click(self):
+        node = self._live("clickElement")
+        if not node.is_displayed():
+            raise JavascriptException(f"element not interactable: {node!r}")
+        self._driver.click_node(node)
+
+    def send_keys(self, *values):
+        node = self._live("sendKeysToElement")
+        node.value += "".join(str(v) for v in values)
+        self._driver.site.on_input(self._driver, node)
+
+    def clear(self):
+        self._live("clearElement").value = ""
+
+
+def _property(node, name):
+    if name == "value":
+        if node.tag == "select":
+            chosen = _selected_option(node)
+            return chosen.attrs.get("value", chosen.text_content().strip()) if chosen else ""
+        return node.value
+    if name == "checked":
+        return "true" if node.checked else None
+    if name == "selected":
+        return "true" if _option_selected(node) else None
+    if name == "index" and node.tag == "option":
+        options = fake_dom.select(node.parent, "option") if node.parent else []
+        return str(options.index(node)) if node in options else None
+    if name in ("innerText", "textContent"):
+        return node.inner_text()
+    return node.attrs.get(name)
+
+
+def _selected_option(select):
+    options = fake_dom.select(select, "option")
+    for option in options:
+        if option.selected:
+            return option
+    return options[0] if options else None
+
+
+def _option_selected(option):
+    """Like a browser, a single-select with no selected option reports its first one as selected"""
+    select = next((a for a in option.ancestors() if a.tag == "select"), None)
+    return _selected_option(select) is option if select is not None else option.selected
+
+
+def _find(scope, by, value):
+    if by == "id":
+        return [n for n in scope.descendants() if n.attrs.get("id") == value]
+    if by == "tag name":
+        return [n for n in scope.descendants() if n.tag == value.lower()]
+    if by == "class name":
+        return [n for n in scope.descendants() if value in n.classes]
+    if by == "name":
+        return [n for n in scope.descendants() if n.attrs.get("name") == value]
+    if by == "css selector":
+        return fake_dom.select(scope, value)
+    if by == "xpath":
+        return fake_dom.xpath(scope, value)
+    raise ValueError(f"Unsupported locator strategy {by!r}")
+
+
+class FakeDriver:
+    """Selenium-compatible driver over a fake_dom document and a FakeSite behaviour model"""
+
+    def __init__(self, site, latency=0.0):
+        self.site = site
+        self.latency = latency
+        self.commands = 0
+        self.command_executor = FakeExecutor(self)
+        self.current_url = "about:blank"
+        self.title = ""
+        self.document = fake_dom.parse_document("<html><body></body></html>")
+        self._ref_counter = 0
+        self.cookies = []
+        self.local_storage = {}
+        self.window = {}  # page-scoped JS globals, cleared on navigation
+        self.active_element = None  # last clicked node; where Input.insertText types
+        # What Performance.getMetrics reports beyond the live document; sites may grow these
+        self.heap_bytes = 24 * 1024 * 1024
+        self.detached_nodes = 0
+        self.listeners = 400
+        self.quit_called = False
+        site.attach(self)
+
+    # --- transport -----------------------------------------------------------
+
+    def execute(self, driver_command, params=None):
+        return self.command_executor.execute(driver_command, params)
+
+    def load(self, html, url=None):
+        self.document = fake_dom.parse_document(html)
+        self.window = {}
+        self.active_element = None
+        if url:
+            self.current_url = url
+
+    # --- navigation ----------------------------------------------------------
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+        self.current_url = url
+        self.site.navigate(self, url)
+
+    def quit(self):
+        self.execute("quit")
+        self.quit_called = True
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    # --- lookup ----------------------------------------------------------------
+
+    def find_element(self, by="id", value=None):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"No element for {by}={value!r}")
+        return found[0]
+
+    def find_elements(self, by="id", value=None):
+        self.execute("findElements", {"using": by, "value": value})
+        return [FakeElement(self, n) for n in _find(self.document, by, value)]
+
+    # --- scripts ---------------------------------------------------------------
+
+    def execute_script(self, script, *args):
+        self.execute("executeScript")
+        return self._run_script(script, args)
+
+    def execute_async_script(self, script, *args):
+        self.execute("executeAsyncScript")
+        return self._run_script(script, args)
+
+    def _run_script(self, script, args):
+        nodes = [a.node if isinstance(a, FakeElement) else a for a in args]
+        tag = re.search(r"//\s*@jaa:([\w-]+)", script)
+        if tag:
+            handler = SCRIPTS.get(tag.group(1))
+            if handler is None:
+                raise JavascriptException(f"No fake implementation for script @jaa:{tag.group(1)}")
+            return _wrap(self, handler(self, *nodes))
+        if re.search(r"arguments\[0\]\.click\(\)", script):
+            self.click_node(nodes[0])
+            return None
+        if "scrollIntoView" in script:
+            return None
+        if "scrollHeight" in script or "scrollWidth" in script:
+            return 1000
+        raise JavascriptException(f"Fake driver cannot run script: {script.strip()[:60]!r}")
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.execute("executeCdpCommand", {"cmd": cmd})
+        return self.site.cdp(self, cmd, params)
+
+    # --- misc WebDriver surface --------------------------------------------------
+
+    def set_script_timeout(self, seconds):
+        self.execute("setTimeouts")
+
+    def set_page_load_timeout(self, seconds):
+        self.execute("setTimeouts")
+
+    def get_window_size(self):
+        self.execute("getWindowRect")
+        return {"width": 1280, "height": 900}
+
+    def set_window_size(self, width, height):
+        self.execute("setWindowRect")
+
+    def save_screenshot(self, path):
+        self.execute("screenshot")
+        with open(path, "wb") as f:
+            f.write(base64.b64decode(_PNG))
+        return True
+
+    def get_cookies(self):
+        self.execute("getAllCookies")
+        return [dict(c) for c in self.cookies]
+
+    def add_cookie(self, cookie):
+        self.execute("addCookie")
+        self.cookies = [c for c in self.cookies if c["name"] != cookie["name"]] + [dict(cookie)]
+
+    def delete_all_cookies(self):
+        self.execute("deleteAllCookies")
+        self.cookies = []
+
+    @property
+    def capabilities(self):
+        return {"browserName": "fake", "goog:chromeOptions": {"debuggerAddress": ""}}
+
+    # --- DOM behaviour ------------------------------------------------------------
+
+    def next_ref(self):
+        self._ref_counter += 1
+        return str(self._ref_counter)
+
+    def click_node(self, node):
+        """Default browser click behaviour followed by the site's action handlers"""
+        if node.tag == "label":
+            target = None
+            if node.attrs.get("for"):
+                target = next((n for n in self.document.iter() if n.attrs.get("id") == node.attrs["for"]), None)
+            if target is None:
+                target = fake_dom.select_one(node, "input")
+            if target is not None:
+                self.click_node(target)
+                return
+        self.active_element = node
+        if node.tag == "input" and node.attrs.get("type") == "checkbox" and "disabled" not in node.attrs:
+            node.checked = not node.checked
+        elif node.tag == "input" and node.attrs.get("type") == "radio" and "disabled" not in node.attrs:
+            name = node.attrs.get("name")
+            scope = next((a for a in node.ancestors() if a.tag in ("fieldset", "form")), self.document)
+            for other in fake_dom.select(scope, "input[type='radio']"):
+                if other is not node and (name is None or other.attrs.get("name") == name):
+                    other.checked = False
+            node.checked = True
+        elif node.tag == "option" and node.parent is not None:
+            select = next((a for a in node.ancestors() if a.tag == "select"), None)
+            if select is not None:
+                for option in fake_dom.select(select, "option"):
+                    option.selected = option is node
+
+        self.site.on_click(self, node)
+        for target in [node] + list(node.ancestors()):
+            action = target.attrs.get("data-fake-action") if target.tag != "#document" else None
+            if action:
+                self.site.on_action(self, action, target, node)
+                break
+
+
+def _wrap(driver, value):
+    """Turn nodes returned by script emulations into FakeElements like Selenium does"""
+    if isinstance(value, fake_dom.Node):
+        return FakeElement(driver, value)
+    if isinstance(value, list):
+        return [_wrap(driver, v) for v in value]
+    return value
+
+
+# --- emulations of the project's injected scripts ------------------------------------
+
+MODAL = ".jobs-easy-apply-modal, div[role='dialog']"
+
+
+def _text(node):
+    return node.inner_text() if node is not None else ""
+
+
+def _ref(driver, node):
+    if "data-jaa-ref" not in node.attrs:
+        node.attrs["data-jaa-ref"] = driver.next_ref()
+    return node.attrs["data-jaa-ref"]
+
+
+def _modal_root(driver):
+    return fake_dom.select_one(driver.document, MODAL) or driver.document
+
+
+def _label_for(root, node):
+    if node.attrs.get("aria-label"):
+        return node.attrs["aria-label"]
+    if node.attrs.get("id"):
+        label = next((n for n in fake_dom.select(root, "label") if n.attrs.get("for") == node.attrs["id"]), None)
+        if label is not None and _text(label):
+            return _text(label)
+    legend = fake_dom.select_one(node, "legend")
+    if legend is not None and _text(legend):
+        return _text(legend)
+    return _text(node.previous_element())
+
+
+def snapshot_fields(driver):
+    """Python twin of form_snapshot.SNAPSHOT_JS"""
+    root = _modal_root(driver)
+    fields = []
+    country_code = "Phone country code" in root.inner_text()
+
+    for el in fake_dom.select(root, "input[type='text'], input[type='number'], input[type='email'], input[type='tel']"):
+        fields.append({"ref": _ref(driver, el), "kind": "text", "label": _label_for(root, el), "value": el.value,
+                       "selected": False, "enabled": "disabled" not in el.attrs, "options": [],
+                       "input_type": el.attrs.get("type", "text")})
+    for el in fake_dom.select(root, "input[type='checkbox']"):
+        fields.append({"ref": _ref(driver, el), "kind": "checkbox", "label": el.attrs.get("aria-label", ""),
+                       "value": el.value, "selected": el.checked, "enabled": "disabled" not in el.attrs,
+                       "options": []})
+    for group in fake_dom.select(root, "fieldset, div[role='radiogroup']"):
+        legend = fake_dom.select_one(group, "legend")
+        options = [{"ref": _ref(driver, opt),
+                    "label": opt.attrs.get("aria-label") or opt.attrs.get("value") or _text(opt),
+                    "selected": opt.checked}
+                   for opt in fake_dom.select(group, "input[type='radio'], label[data-test-text-selectable-option__label]")]
+        fields.append({"ref": _ref(driver, group), "kind": "radio",
+                       "label": _text(legend) if legend is not None else _text(group.previous_element()),
+                       "value": "", "selected": bool(fake_dom.select(group, "input[type='radio']:checked")),
+                       "enabled": True, "options": options})
+    for el in fake_dom.select(root, "select"):
+        options = fake_dom.select(el, "option")
+        current = _selected_option(el)
+        fields.append({"ref": _ref(driver, el),
+                       "kind": "country_code" if country_code and "country" in el.attrs.get("id", "") else "select",
+                       "label": _label_for(root, el), "value": _text(current),
+                       "selected": current is not None, "enabled": "disabled" not in el.attrs,
+                       "options": [o.text_content().strip() for o in options],
+                       "option_values": [o.attrs.get("value", o.text_content().strip()) for o in options]})
+    for el in fake_dom.select(root, "button.artdeco-dropdown__trigger, div[role='combobox']"):
+        fields.append({"ref": _ref(driver, el), "kind": "combobox", "label": el.attrs.get("aria-label", ""),
+                       "value": _text(el), "selected": False,
+                       "enabled": "disabled" not in el.attrs and el.attrs.get("aria-disabled") != "true",
+                       "options": [], "controls": el.attrs.get("aria-controls") or el.attrs.get("aria-owns") or ""})
+    return json.dumps(fields)
+
+
+def apply_fill_plan(driver, plan_json):
+    """Python twin of fill_plan.APPLY_PLAN_JS"""
+    results = []
+    for step in json.loads(plan_json):
+        try:
+            el = fake_dom.select_one(driver.document, step["locator"])
+            if el is None:
+                raise ValueError("element not found")
+            action = step["action"]
+            if action == "type":
+                el.value = step["value"]
+                driver.site.on_input(driver, el)
+            elif action == "click":
+                driver.click_node(el)
+            elif action == "click_option":
+                opt = fake_dom.select_one(driver.document, f"[data-jaa-ref='{step['value']}']")
+                if opt is None:
+                    raise ValueError("option not found")
+                driver.click_node(opt)
+            elif action in ("select", "select_value"):
+                options = fake_dom.select(el, "option")
+                match = next((o for o in options if (o.text_content().strip() == step["value"] if action == "select"
+                                                     else o.attrs.get("value") == step["value"])), None)
+                if match is None:
+                    raise ValueError("option not found")
+                for o in options:
+                    o.selected = o is match
+            else:
+                raise ValueError(f"unsupported action {action}")
+            results.append({"locator": step["locator"], "ok": True, "error": ""})
+        except Exception as e:
+            results.append({"locator": step["locator"], "ok": False, "error": str(e)})
+    return json.dumps(results)
+
+
+def step_signature(driver):
+    modal = fake_dom.select_one(driver.document, MODAL)
+    if modal is None:
+        return ""
+    heading = fake_dom.select_one(modal, "h3, h2")
+    progress = fake_dom.select_one(modal, "progress, [role='progressbar']")
+    return "|".join(str(part) for part in [
+        (progress.attrs.get("value") or progress.attrs.get("aria-valuenow") or "") if progress is not None else "",
+        heading.text_content().strip() if heading is not None else "",
+        len(fake_dom.select(modal, "input, select, textarea")),
+        len(fake_dom.select(modal, "[data-jaa-ref]")),
+        len(fake_dom.select(modal, ".artdeco-inline-feedback--error")),
+    ])
+
+
+def _listbox_of(driver, combobox):
+    def by_ids(el):
+        ids = f"{el.attrs.get('aria-controls', '')} {el.attrs.get('aria-owns', '')}".split()
+        return next((n for n in (fake_dom.get_element_by_id(driver.document, i) for i in ids) if n is not None), None)
+
+    inner = fake_dom.select_one(combobox, "[aria-controls], [aria-owns]")
+    container = next((a for a in combobox.ancestors()
+                      if fake_dom.matches(a, ".artdeco-dropdown, .basic-typeahead, [data-test-form-element]")),
+                     combobox.parent)
+    return (by_ids(combobox) or (inner is not None and by_ids(inner))
+            or (container is not None and fake_dom.select_one(
+                container, "[role='listbox'], .basic-typeahead__triggered-content")) or None)
+
+
+def listbox_options(driver, combobox, index=None, expected=None):
+    listbox = _listbox_of(driver, combobox)
+    if listbox is None or not listbox.is_displayed():
+        return None
+    options = [o for o in fake_dom.select(listbox, "[role='option'], .basic-typeahead__option")
+               if o.attrs.get("aria-disabled") != "true"]
+    if index is None:
+        return json.dumps([o.text_content().strip() for o in options])
+    if index >= len(options) or options[index].text_content().strip() != expected:
+        return None
+    return options[index]
+
+
+def typeahead_input(driver, combobox):
+    selector = "input[type='text'], input[type='search']"
+    if fake_dom.matches(combobox, selector):
+        return combobox
+    container = next((a for a in combobox.ancestors()
+                      if fake_dom.matches(a, ".artdeco-dropdown, .basic-typeahead, [data-test-form-element]")),
+                     combobox.parent)
+    return fake_dom.select_one(combobox, selector) or (
+        fake_dom.select_one(container, selector) if container is not None else None)
+
+
+def harvest_cards(driver, pane_selectors):
+    seen, cards = set(), []
+    for el in fake_dom.select(driver.document, "[data-occludable-job-id], [data-job-id]"):
+        job_id = el.attrs.get("data-occludable-job-id") or el.attrs.get("data-job-id")
+        if not job_id or job_id in seen:
+            continue
+        title = fake_dom.select_one(el, ".job-card-list__title, .job-card-container__link strong, .job-card-container__link")
+        if title is None or not _text(title):
+            continue
+        seen.add(job_id)
+        company = fake_dom.select_one(el, ".job-card-container__primary-description, .artdeco-entity-lockup__subtitle")
+        location = fake_dom.select_one(el, ".job-card-container__metadata-item, .artdeco-entity-lockup__caption")
+        cards.append({"job_id": job_id, "title": _text(title), "company": _text(company), "location": _text(location)})
+    return json.dumps({"cards": cards, "exhausted": driver.site.scroll_results(driver)})
+
+
+def job_details_shown(driver, job_id, pane_selector):
+    pane = fake_dom.select_one(driver.document, pane_selector)
+    if pane is None:
+        return False
+    ids = [el.attrs.get("data-job-id") or next(iter(re.findall(r"/jobs/view/(\d+)", el.attrs.get("href", ""))), None)
+           for el in fake_dom.select(pane, "a[href*='/jobs/view/'], [data-job-id]")]
+    ids = [i for i in ids if i]
+    if ids:
+        return job_id in ids
+    return parse_qs(urlparse(driver.current_url).query).get("currentJobId", [None])[0] == job_id
+
+
+def first_card(driver):
+    el = fake_dom.select_one(driver.document, "[data-occludable-job-id], [data-job-id]")
+    return (el.attrs.get("data-occludable-job-id") or el.attrs.get("data-job-id")) if el is not None else ""
+
+
+def resolve_card(driver, job_id):
+    holder = fake_dom.select_one(driver.document, f"[data-occludable-job-id='{job_id}'], [data-job-id='{job_id}']")
+    if holder is None:
+        return None
+    if fake_dom.matches(holder, ".job-card-container--clickable"):
+        return holder
+    return fake_dom.select_one(holder, ".job-card-container--clickable") or holder
+
+
+def next_page(driver):
+    button = fake_dom.select_one(driver.document,
+                                 "button[aria-label='View next page'], .jobs-search-pagination__button--next")
+    if button is None or "disabled" in button.attrs:
+        return False
+    driver.click_node(button)
+    return True
+
+
+def results_count(driver):
+    return len(fake_dom.select(driver.document, ".job-card-container--clickable"))
+
+
+def modal_html(driver):
+    modal = fake_dom.select_one(driver.document, MODAL)
+    if modal is None:
+        return ""
+    return re.sub(r'\s(?:data-jaa-ref|on\w+)="[^"]*"', "", modal.outer_html(strip_scripts=True))
+
+
+def prefetch_start(driver, ids, template, description_selector):
+    """In-page fetch emulation: the site answers instantly, so results are ready on the next collect"""
+    store = driver.window.setdefault("__jaaPrefetch", {})
+    for job_id in ids:
+        if job_id in store:
+            continue
+        html = driver.site.fetch(driver, template.replace("{job_id}", job_id))
+        if html is None:
+            store[job_id] = {"state": "error", "error": "Error: HTTP 404", "ms": 0}
+            continue
+        doc = fake_dom.parse_document(html)
+        description = fake_dom.select_one(doc, description_selector)
+        button = fake_dom.select_one(doc, ".jobs-apply-button, .jobs-apply-button--top-card")
+        easy_apply = "easy apply" in button.text_content().lower() if button is not None else None
+        store[job_id] = {"state": "done", "easy_apply": easy_apply,
+                         "description": description.text_content().strip() if description is not None else "",
+                         "ms": 0}
+    return len(ids)
+
+
+def prefetch_collect(driver):
+    store = driver.window.get("__jaaPrefetch", {})
+    finished = {job_id: result for job_id, result in store.items() if result["state"] != "pending"}
+    for job_id in finished:
+        del store[job_id]
+    return json.dumps(finished)
+
+
+def local_storage_read(driver):
+    return json.dumps(driver.local_storage)
+
+
+def local_storage_write(driver, items_json):
+    items = json.loads(items_json)
+    driver.local_storage.update(items)
+    return len(items)
+
+
+def session_check(driver, url):
+    """fetch(url, {redirect: 'manual'}): the site's page when it serves one, else an opaque redirect"""
+    if driver.site.fetch(driver, url) is None:
+        return {"status": 0, "type": "opaqueredirect"}
+    return {"status": 200, "type": "basic"}
+
+
+def set_value(driver, node, value):
+    """Python twin of text_entry.SET_VALUE_JS"""
+    node.value = value
+    driver.site.on_input(driver, node)
+    return node.value == value
+
+
+def page_stats(driver):
+    """The fake fetches nothing but the document, which is ready as soon as it is parsed"""
+    size = len(driver.document.outer_html().encode("utf-8"))
+    return json.dumps({"dom_ready_ms": 0, "load_ms": 0, "bytes": size, "requests": 1})
+
+
+def element_rect(driver, selector):
+    return {"x": 0, "y": 0, "width": 800, "height": 600} if fake_dom.select_one(driver.document, selector) else None
+
+
+SCRIPTS = {
+    "form-snapshot": snapshot_fields,
+    "apply-fill-plan": apply_fill_plan,
+    "step-signature": step_signature,
+    "dom-quiet": lambda driver, *args: True,
+    "listbox-options": listbox_options,
+    "typeahead-input": typeahead_input,
+    "results-count": results_count,
+    "harvest-cards": harvest_cards,
+    "job-details-shown": job_details_shown,
+    "first-card": first_card,
+    "resolve-card": resolve_card,
+    "next-page": next_page,
+    "element-rect": element_rect,
+    "modal-html": modal_html,
+    "prefetch-start": prefetch_start,
+    "prefetch-collect": prefetch_collect,
+    "local-storage-read": local_storage_read,
+    "local-storage-write": local_storage_write,
+    "session-check": session_check,
+    "set-value": set_value,
+    "page-stats": page_stats,
+}
+
+
+class FakeSite:
+    """Behaviour model behind a FakeDriver: navigation, click actions and CDP replies"""
+
+    def attach(self, driver):
+        pass
+
+    def navigate(self, driver, url):
+        pass
+
+    def fetch(self, driver, url):
+        """Body of an in-page fetch() of url, or None for a 404"""
+        return None
+
+    def on_click(self, driver, node):
+        """Every click, before data-fake-action handlers run"""
+
+    def on_action(self, driver, action, target, clicked):
+        pass
+
+    def on_input(self, driver, node):
+        pass
+
+    def scroll_results(self, driver):
+        """Called per harvest; returns True once the results pane is fully scrolled"""
+        return True
+
+    def cdp(self, driver, cmd, params):
+        if cmd == "Page.getLayoutMetrics":
+            return {"cssContentSize": {"width": 1280, "height": 2000}}
+        if cmd == "Page.captureScreenshot":
+            return {"data": _PNG}
+        if cmd == "Input.insertText":
+            node = driver.active_element
+            if node is not None and node.tag in ("input", "textarea"):
+                node.value += params["text"]
+                self.on_input(driver, node)
+            return {}
+        if cmd == "Performance.getMetrics":
+            metrics = {"JSHeapUsedSize": driver.heap_bytes, "JSHeapTotalSize": driver.heap_bytes * 1.25,
+                       "Nodes": sum(1 for _ in driver.document.iter()) + driver.detached_nodes,
+                       "JSEventListeners": driver.listeners, "Documents": 1}
+            return {"metrics": [{"name": name, "value": value} for name, value in metrics.items()]}
+        return {}
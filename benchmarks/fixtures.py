@@ -0,0 +1,331 @@
+"""Synthetic LinkedIn pages for the offline benchmarks.
+
+EasyApplySite serves a job search results page whose cards open a details pane
+and a multi-step Easy Apply modal built from generated form fields. The markup
+mirrors the selectors linkedin_api, form_snapshot and job_feed rely on.
+"""
+import re
+import time
+from html import escape
+
+from benchmarks import fake_dom
+from benchmarks.fake_driver import FakeSite
+
+# (label, options) — labels drawn from question_database.json keys plus some it won't know
+TEXT_QUESTIONS = [
+    "How many years of work experience do you have with Python?",
+    "Mobile phone number",
+    "Email address",
+    "What is your expected salary?",
+    "City",
+    "How many years of experience do you have with Django?",
+    "LinkedIn profile URL",
+    "Notice period in days",
+]
+RADIO_QUESTIONS = [
+    "Will you now or in the future require visa sponsorship?",
+    "Are you legally authorized to work in the United States?",
+    "Are you comfortable working remotely?",
+    "Do you have a bachelor's degree?",
+    "Are you willing to relocate?",
+]
+SELECT_QUESTIONS = [
+    ("What is your level of proficiency in English?", ["Select an option", "Native or bilingual", "Professional", "Conversational"]),
+    ("Highest level of education completed", ["Select an option", "High school", "Bachelor's Degree", "Master's Degree"]),
+    ("Preferred work arrangement", ["Select an option", "Remote", "Hybrid", "On-site"]),
+]
+COMBOBOX_QUESTIONS = [
+    ("Location (city)", ["Addis Ababa, Ethiopia", "Berlin, Germany", "Remote", "New York, United States"]),
+    ("How did you hear about us?", ["LinkedIn", "Referral", "Company website", "Other"]),
+]
+
+# name -> (text, radio, select, combobox, country code) fields per step, and number of steps
+FORM_SIZES = {
+    "small": ((2, 1, 1, 0, 0), 2),
+    "medium": ((6, 3, 2, 1, 1), 3),
+    "large": ((16, 8, 6, 3, 1), 4),
+}
+
+
+def _cycle(items, i):
+    return items[i % len(items)]
+
+
+def text_field(uid, label):
+    return (f'<div class="fb-dash-form-element"><label for="{uid}">{escape(label)}</label>'
+            f'<input id="{uid}" type="text" aria-label="{escape(label)}"></div>')
+
+
+def radio_field(uid, label, options=("Yes", "No")):
+    inputs = "".join(
+        f'<div><input id="{uid}-{i}" type="radio" name="{uid}" value="{escape(opt)}">'
+        f'<label for="{uid}-{i}" data-test-text-selectable-option__label="{escape(opt)}">{escape(opt)}</label></div>'
+        for i, opt in enumerate(options))
+    return f'<fieldset id="{uid}"><legend><span>{escape(label)}</span></legend>{inputs}</fieldset>'
+
+
+def select_field(uid, label, options):
+    opts = "".join(f'<option value="{escape(o)}">{escape(o)}</option>' for o in options)
+    return (f'<div><label for="{uid}">{escape(label)}</label>'
+            f'<select id="{uid}" aria-label="{escape(label)}">{opts}</select></div>')
+
+
+def combobox_field(uid, label, options):
+    opts = "".join(f'<div role="option" id="{uid}-opt{i}" data-fake-action="option"><span>{escape(o)}</span></div>'
+                   for i, o in enumerate(options))
+    return (f'<div><div role="combobox" tabindex="0" aria-label="{escape(label)}" aria-controls="{uid}-listbox" '
+            f'aria-expanded="false" data-fake-action="combobox">Select an option</div>'
+            f'<div role="listbox" id="{uid}-listbox" hidden>{opts}</div></div>')
+
+
+def country_code_field(uid):
+    options = [("", "Select an option"), ("US", "United States (+1)"), ("ET", "Ethiopia (+251)"),
+               ("DE", "Germany (+49)"), ("GB", "United Kingdom (+44)")]
+    opts = "".join(f'<option value="{v}">{escape(t)}</option>' for v, t in options)
+    return (f'<div><label for="country-code-{uid}">Phone country code</label>'
+            f'<select id="country-code-{uid}" aria-label="Phone country code">{opts}</select></div>')
+
+
+def form_step(counts, prefix):
+    """HTML for one Easy Apply step with the given (text, radio, select, combobox, country) field counts"""
+    n_text, n_radio, n_select, n_combo, n_country = counts
+    parts = [country_code_field(f"{prefix}") for _ in range(n_country)]
+    parts += [text_field(f"{prefix}-t{i}", _cycle(TEXT_QUESTIONS, i)) for i in range(n_text)]
+    parts += [radio_field(f"{prefix}-r{i}", _cycle(RADIO_QUESTIONS, i)) for i in range(n_radio)]
+    parts += [select_field(f"{prefix}-s{i}", *_cycle(SELECT_QUESTIONS, i)) for i in range(n_select)]
+    parts += [combobox_field(f"{prefix}-c{i}", *_cycle(COMBOBOX_QUESTIONS, i)) for i in range(n_combo)]
+    return "".join(parts)
+
+
+def job_form(size, job_id):
+    """List of step bodies for a job's Easy Apply form"""
+    counts, steps = FORM_SIZES[size]
+    return [form_step(counts, f"j{job_id}-s{n}") for n in range(steps)]
+
+
+class FakeJob:
+    def __init__(self, job_id, title, company, location, steps=None):
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.location = location
+        self.steps = steps  # None: no Easy Apply button
+
+    @property
+    def easy_apply(self):
+        return self.steps is not None
+
+
+def make_jobs(count, size="medium", easy_apply_every=1, start_id=4000000):
+    """Jobs with generated forms; every easy_apply_every-th job lacks Easy Apply when > 1"""
+    jobs = []
+    for i in range(count):
+        job_id = str(start_id + i)
+        has_easy_apply = easy_apply_every <= 1 or i % easy_apply_every != easy_apply_every - 1
+        jobs.append(FakeJob(job_id, f"Python Developer {i + 1}", f"Company {i % 37}",
+                            "Remote" if i % 3 else "Addis Ababa, Ethiopia",
+                            job_form(size, job_id) if has_easy_apply else None))
+    return jobs
+
+
+def open_listbox(driver, combobox):
+    listbox = fake_dom.get_element_by_id(driver.document, combobox.attrs["aria-controls"])
+    if listbox is not None:
+        listbox.attrs.pop("hidden", None)
+        combobox.attrs["aria-expanded"] = "true"
+
+
+def pick_option(driver, option):
+    listbox = option.parent
+    combobox = listbox.previous_element()  # combobox_field renders the listbox right after its combobox
+    if combobox is None or combobox.attrs.get("aria-controls") != listbox.attrs.get("id"):
+        combobox = next((n for n in driver.document.iter()
+                         if n.attrs.get("aria-controls") == listbox.attrs.get("id")), None)
+    if combobox is not None:
+        combobox.set_inner_html(escape(option.text_content().strip()))
+        combobox.attrs["aria-expanded"] = "false"
+    listbox.attrs["hidden"] = ""
+
+
+class ListboxSite(FakeSite):
+    """A job page with custom dropdowns: one target combobox with a long listbox among decoy ones.
+
+    The decoy listboxes reuse the target's option texts, so a page-wide lookup
+    by text finds a decoy before the option the target actually controls.
+    filler adds that many nodes of unrelated page content (a job page is large).
+    """
+
+    def __init__(self, options=2000, decoys=5000, decoy_lists=10, filler=20000):
+        self.labels = [f"Option {i:05d}" for i in range(options)] + ["Bachelor's Degree", "Master's Degree"]
+        self.decoys = decoys
+        self.decoy_lists = decoy_lists
+        self.filler = filler
+
+    def navigate(self, driver, url):
+        per_list = max(self.decoys // max(self.decoy_lists, 1), 1)
+        fields = [combobox_field(f"decoy{n}", f"Decoy question {n}",
+                                 [self.labels[(n * per_list + i) % len(self.labels)] for i in range(per_list)])
+                  for n in range(self.decoy_lists)]
+        fields.append(combobox_field("target", "Target question", self.labels))
+        filler = "".join(f'<li class="feed-item"><span>Related job {i}</span></li>' for i in range(self.filler // 2))
+        driver.load(f'<html><body><ul>{filler}</ul><form>{"".join(fields)}</form></body></html>', url)
+
+    def on_action(self, driver, action, target, clicked):
+        if action == "combobox":
+            open_listbox(driver, target)
+        elif action == "option":
+            pick_option(driver, target)
+
+
+class EasyApplySite(FakeSite):
+    """Search results, job details and the Easy Apply modal as a small state machine.
+
+    With require_login, the feed and job pages redirect to the login page unless
+    the browser holds a session cookie issued by a login on this site.
+    """
+
+    def __init__(self, jobs, page_size=25, cards_per_scroll=7, require_login=False):
+        self.jobs = {job.job_id: job for job in jobs}
+        self.page_size = page_size
+        self.pages = [jobs[i:i + page_size] for i in range(0, len(jobs), page_size)] or [[]]
+        self.cards_per_scroll = cards_per_scroll
+        self.page = 0
+        self.rendered = 0
+        self.current_job = None
+        self.step = 0
+        self.submitted = []
+        self.require_login = require_login
+        self.session_tokens = set()
+
+    def signed_in(self, driver):
+        return any(c["name"] == "li_at" and c["value"] in self.session_tokens for c in driver.cookies)
+
+    def expire_sessions(self):
+        self.session_tokens.clear()
+
+    # --- pages ---------------------------------------------------------------
+
+    def navigate(self, driver, url):
+        if self.require_login and ("/jobs/" in url or "/feed" in url) and not self.signed_in(driver):
+            url = "https://www.linkedin.com/login"  # authwall
+            driver.current_url = url
+        if "/jobs/search" in url:
+            start = re.search(r"[?&]start=(\d+)", url)
+            self.page = min(int(start.group(1)) // self.page_size, len(self.pages) - 1) if start else 0
+            driver.load(self.results_html(), url)
+            driver.title = "Jobs | LinkedIn"
+        elif "/login" in url:
+            driver.load('<html><body><form><input id="username" type="text"><input id="password" type="password">'
+                        '<input id="rememberMeOptIn-checkbox" type="checkbox" checked>'
+                        '<button type="submit" data-fake-action="login">Sign in</button></form></body></html>', url)
+            driver.title = "LinkedIn Login"
+        else:
+            driver.load("<html><body><main>Feed</main></body></html>", url)
+            driver.title = "Feed | LinkedIn"
+
+    def results_html(self):
+        self.rendered = self.cards_per_scroll
+        return ('<html><body><div class="scaffold-layout__list">'
+                f'<ul class="jobs-search-results-list">{self._cards_html()}</ul>'
+                '<button aria-label="View next page" data-fake-action="next-page"'
+                f'{" disabled" if self.page >= len(self.pages) - 1 else ""}><span class="icon"></span></button>'
+                '</div><div class="jobs-search__job-details--container"></div>'
+                '<div id="artdeco-modal-outlet"></div></body></html>')
+
+    def _cards_html(self):
+        cards = []
+        for index, job in enumerate(self.pages[self.page]):
+            if index >= self.rendered:
+                # Occluded placeholder: id present, content not rendered yet
+                cards.append(f'<li data-occludable-job-id="{job.job_id}"></li>')
+                continue
+            cards.append(
+                f'<li data-occludable-job-id="{job.job_id}">'
+                f'<div class="job-card-container job-card-container--clickable" data-job-id="{job.job_id}" '
+                f'data-fake-action="open-job"><a class="job-card-container__link"><strong>{escape(job.title)}</strong></a>'
+                f'<div class="artdeco-entity-lockup__subtitle">{escape(job.company)}</div>'
+                f'<div class="artdeco-entity-lockup__caption">{escape(job.location)}</div></div></li>')
+        return "".join(cards)
+
+    def scroll_results(self, driver):
+        exhausted = self.rendered >= len(self.pages[self.page])
+        if not exhausted:
+            self.rendered += self.cards_per_scroll
+            pane = fake_dom.select_one(driver.document, ".jobs-search-results-list")
+            pane.set_inner_html(self._cards_html())
+        return exhausted
+
+    def fetch(self, driver, url):
+        if self.require_login and not self.signed_in(driver):
+            return None
+        if "/feed" in url:
+            return "<html><body><main>Feed</main></body></html>"
+        match = re.search(r"/jobs/view/(\d+)", url)
+        job = self.jobs.get(match.group(1)) if match else None
+        return f"<html><body>{self.details_html(job)}</body></html>" if job else None
+
+    def details_html(self, job):
+        button = ('<button class="jobs-apply-button artdeco-button" data-fake-action="apply">'
+                  '<span>Easy Apply</span></button>') if job.easy_apply else \
+            '<button class="jobs-apply-button--top-card artdeco-button"><span>Apply</span></button>'
+        return (f'<div class="jobs-details"><h2><a href="/jobs/view/{job.job_id}/">{escape(job.title)}</a></h2>{button}'
+                f'<div class="jobs-description">We are hiring a {escape(job.title)} at {escape(job.company)}.'
+                ' Python, Django, REST APIs, SQL and cloud experience required.</div></div>')
+
+    def modal_html(self):
+        job = self.jobs[self.current_job]
+        last = len(job.steps) - 1
+        if self.step > last:
+            body, button = "<p>Your application was sent</p>", ""
+        else:
+            body = f'<form>{job.steps[self.step]}</form>'
+            label, action = (("Submit application", "submit") if self.step == last else
+                             ("Review", "next") if self.step == last - 1 else ("Next", "next"))
+            button = f'<button class="artdeco-button" data-fake-action="{action}"><span>{label}</span></button>'
+        progress = int(100 * min(self.step, last + 1) / (last + 1))
+        return (f'<div class="jobs-easy-apply-modal artdeco-modal" role="dialog">'
+                f'<button aria-label="Dismiss" class="artdeco-modal__dismiss" data-fake-action="dismiss"></button>'
+                f'<h3>Apply to {escape(job.company)}</h3><progress value="{progress}" max="100"></progress>'
+                f'{body}{button}</div>')
+
+    # --- behaviour -------------------------------------------------------------
+
+    def _outlet(self, driver):
+        return fake_dom.select_one(driver.document, "#artdeco-modal-outlet")
+
+    def on_action(self, driver, action, target, clicked):
+        if action == "login":
+            token = f"AQEDAR{len(self.session_tokens) + 1:06d}"
+            self.session_tokens.add(token)
+            driver.cookies = [c for c in driver.cookies if c["name"] not in ("li_at", "JSESSIONID")] + [
+                {"name": "li_at", "value": token, "domain": ".www.linkedin.com", "path": "/", "secure": True,
+                 "httpOnly": True, "expiry": int(time.time()) + 365 * 86400},
+                {"name": "JSESSIONID", "value": f"ajax:{token}", "domain": ".www.linkedin.com", "path": "/"}]
+            driver.local_storage["voyager-web:session"] = token
+            driver.current_url = "https://www.linkedin.com/feed/"
+            self.navigate(driver, driver.current_url)
+        elif action == "open-job":
+            job = self.jobs[target.attrs["data-job-id"]]
+            self.current_job = job.job_id
+            pane = fake_dom.select_one(driver.document, ".jobs-search__job-details--container")
+            pane.set_inner_html(self.details_html(job))
+        elif action == "apply":
+            self.step = 0
+            self._outlet(driver).set_inner_html(self.modal_html())
+        elif action == "next":
+            self.step += 1
+            self._outlet(driver).set_inner_html(self.modal_html())
+        elif action == "submit":
+            self.submitted.append(self.current_job)
+            self.step += 1
+            self._outlet(driver).set_inner_html(self.modal_html())
+        elif action == "dismiss":
+            self._outlet(driver).set_inner_html("")
+        elif action == "next-page":
+            if self.page < len(self.pages) - 1:
+                self.page += 1
+                driver.load(self.results_html(), driver.current_url)
+        elif action == "combobox":
+            open_listbox(driver, target)
+        elif action == "option":
+            pick_option(driver, target)
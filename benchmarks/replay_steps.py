@@ -0,0 +1,131 @@
+"""Replay recorded Easy Apply steps offline: fill throughput and decision changes.
+
+Record with JAA_RECORD_STEPS=1 during a normal run, then from the repository root:
+    python -m benchmarks.replay_steps [--store data/step_snapshots]
+
+Each recorded modal is loaded into the fake driver and _fill_all_fields runs on
+it with the current matcher and fill engine. Decisions are compared position by
+position with the ones recorded live, so matcher or fill changes show up as a
+diff instead of as failed applications.
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+import config
+from benchmarks.bench_easy_apply import SleepMeter, isolate_state, make_bot
+from benchmarks.fake_driver import FakeDriver, FakeSite
+from form_snapshot import take_form_snapshot
+from step_recorder import SnapshotStore, diff_decisions
+from structured_logging import setup_logging
+
+
+class ReplaySite(FakeSite):
+    """Serves one recorded modal at a time, with just enough ARIA listbox behaviour to pick options"""
+
+    def __init__(self):
+        self.html = "<div></div>"
+
+    def navigate(self, driver, url):
+        driver.load(f"<html><body>{self.html}</body></html>", url)
+
+    def on_click(self, driver, node):
+        owner = node.attrs.get("aria-controls") or node.attrs.get("aria-owns")
+        if owner:
+            listbox = next((n for n in driver.document.iter() if n.attrs.get("id") == owner), None)
+            if listbox is not None:
+                listbox.attrs.pop("hidden", None)
+                node.attrs["aria-expanded"] = "true"
+            return
+        option = next((n for n in [node] + list(node.ancestors()) if n.attrs.get("role") == "option"), None)
+        listbox = option.parent if option is not None else None
+        if listbox is not None and listbox.attrs.get("id"):
+            combobox = next((n for n in driver.document.iter()
+                             if listbox.attrs["id"] in (n.attrs.get("aria-controls"), n.attrs.get("aria-owns"))), None)
+            if combobox is not None:
+                combobox.children = [option.text_content().strip()]
+                combobox.attrs["aria-expanded"] = "false"
+            listbox.attrs["hidden"] = ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--store", default=config.RECORDER_CONFIG['directory'])
+    parser.add_argument("--repeat", type=int, default=1, help="replays per recorded step")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per WebDriver command")
+    parser.add_argument("--timeout", type=float, default=0.5,
+                        help="wait timeout (seconds) offline, where listboxes that load remotely never appear")
+    parser.add_argument("--use-cache", action="store_true",
+                        help="let the fill cache answer repeated forms (hides matcher changes)")
+    parser.add_argument("--ai", action="store_true", help="keep the spaCy/TF-IDF fuzzy matcher enabled")
+    parser.add_argument("--show", type=int, default=20, help="changed steps to print")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.store)
+    entries = store.entries()
+    if not entries:
+        print(f"No recorded steps in {args.store}; record some with JAA_RECORD_STEPS=1")
+        return
+
+    workdir = tempfile.mkdtemp(prefix="replay_steps_")
+    setup_logging(os.path.join(workdir, "logs"), level=logging.ERROR)
+    isolate_state(workdir)
+    config.WAIT_CONFIG['timeouts'] = {phase: args.timeout for phase in config.WAIT_CONFIG['timeouts']}
+
+    site = ReplaySite()
+    bot = make_bot(site, args.latency, args.ai)
+    html_cache = {}
+    changed, fields_changed, commands, elapsed, replays = [], 0, 0, 0.0, 0
+    try:
+        with SleepMeter(skip=True):
+            for entry in entries:
+                if entry['digest'] not in html_cache:
+                    html_cache[entry['digest']] = store.get(entry['digest'])
+                site.html = html_cache[entry['digest']]
+                for _ in range(args.repeat):
+                    bot.driver.get("https://replay.invalid/step")
+                    if not args.use_cache:
+                        bot.fill_cache.entries.clear()
+                    before = bot.driver.commands
+                    start = time.perf_counter()
+                    bot._fill_all_fields()
+                    elapsed += time.perf_counter() - start
+                    commands += bot.driver.commands - before
+                    replays += 1
+
+                if entry.get('decisions') is None or bot.last_fill_decisions is None:
+                    continue  # recorded (or replayed) through the per-element path: nothing to diff
+                diff = diff_decisions(entry['decisions'], bot.last_fill_decisions)
+                if diff:
+                    changed.append((entry, diff))
+                    fields_changed += len(diff)
+    finally:
+        bot.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"steps recorded   : {len(entries)} ({len(html_cache)} distinct snapshots)")
+    print(f"replays          : {replays} in {elapsed:.2f}s = {replays / elapsed if elapsed else 0:.1f} steps/s")
+    print(f"driver commands  : {commands / replays:.1f} per step")
+    print(f"changed steps    : {len(changed)} ({fields_changed} field decisions)")
+    for entry, diff in changed[:args.show]:
+        print(f"  job {entry['job_id']} step {entry['step']} ({entry['digest'][:12]})")
+        fields = _field_labels(html_cache[entry['digest']])
+        for key, (was, now) in diff.items():
+            label = fields[int(key)] if int(key) < len(fields) else "?"
+            print(f"    #{key} {label[:60]!r}: {was} -> {now}")
+
+
+def _field_labels(html):
+    """Labels by snapshot position, for readable diffs"""
+    site = ReplaySite()
+    site.html = html
+    driver = FakeDriver(site)
+    driver.get("https://replay.invalid/labels")
+    return [field.label for field in take_form_snapshot(driver)]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import logging
+import time
+
+from config import WATCHDOG_CONFIG
+
+MB = 1024 * 1024
+
+
+class BrowserWatchdog:
+    """Samples the browser's memory and DOM size every few jobs and says when it should be recycled.
+
+    Samples come from CDP Performance.getMetrics (JS heap, DOM nodes, event
+    listeners) and are logged as a time series together with the throughput
+    since the previous sample.
+    """
+
+    def __init__(self, every_jobs=None, max_heap_mb=None, max_nodes=None, max_listeners=None):
+        self.every_jobs = every_jobs or WATCHDOG_CONFIG['every_jobs']
+        self.limits = {
+            'heap_mb': max_heap_mb or WATCHDOG_CONFIG['max_heap_mb'],
+            'nodes': max_nodes or WATCHDOG_CONFIG['max_nodes'],
+            'listeners': max_listeners or WATCHDOG_CONFIG['max_listeners'],
+        }
+        self.jobs = 0
+        self.recycles = 0
+        self.samples = []  # dicts: jobs, elapsed_s, heap_mb, nodes, listeners, jobs_per_min
+        self.started = time.perf_counter()
+        self._last = (0, self.started)
+        self._enabled_on = None  # driver that Performance.enable was sent to
+
+    def job_done(self, driver):
+        """Count one opened job; every every_jobs jobs, sample and return True if the browser needs recycling"""
+        self.jobs += 1
+        if self.jobs % self.every_jobs:
+            return False
+        sample = self.sample(driver)
+        if sample is None:
+            return False
+        over = [f"{key} {sample[key]:.0f} > {limit}" for key, limit in self.limits.items()
+                if limit and sample[key] > limit]
+        if over:
+            logging.warning(f"Browser over its limits after {self.jobs} jobs ({', '.join(over)}) - recycling it")
+            self.recycles += 1
+            return True
+        return False
+
+    def sample(self, driver):
+        """One Performance.getMetrics reading, logged and kept; None if CDP is unavailable"""
+        try:
+            if self._enabled_on is not driver:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                self._enabled_on = driver
+            reply = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            metrics = {m['name']: m['value'] for m in reply.get('metrics', [])}
+        except Exception as e:
+            logging.debug(f"Browser metrics unavailable: {str(e)}")
+            return None
+
+        now = time.perf_counter()
+        last_jobs, last_time = self._last
+        self._last = (self.jobs, now)
+        sample = {
+            'jobs': self.jobs,
+            'elapsed_s': round(now - self.started, 2),
+            'heap_mb': round(metrics.get('JSHeapUsedSize', 0) / MB, 1),
+            'nodes': int(metrics.get('Nodes', 0)),
+            'listeners': int(metrics.get('JSEventListeners', 0)),
+            'jobs_per_min': round((self.jobs - last_jobs) * 60 / max(now - last_time, 1e-9), 1),
+        }
+        self.samples.append(sample)
+        logging.info(f"Browser after {sample['jobs']} jobs: heap {sample['heap_mb']} MB, {sample['nodes']} nodes, "
+                     f"{sample['listeners']} listeners, {sample['jobs_per_min']} jobs/min",
+                     extra={'browser_metrics': sample})
+        return sample
+
+    def log_report(self):
+        if not self.samples:
+            return
+        first, peak = self.samples[0], max(self.samples, key=lambda s: s['heap_mb'])
+        rates = [s['jobs_per_min'] for s in self.samples]
+        logging.info(f"Browser watchdog: {len(self.samples)} samples, heap {first['heap_mb']} MB first / "
+                     f"{peak['heap_mb']} MB peak, {min(rates)}-{max(rates)} jobs/min, {self.recycles} recycle(s)")
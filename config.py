@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv  # pip install python-dotenv
 
@@ -11,4 +12,202 @@ LINKEDIN_CREDS = {
 QUESTION_DATABASE = {
     "years of experience": "2",
     "visa sponsorship": "No"
-}
\ No newline at end of file
+}
+
+# Answers maintained in question_database.json extend/override the defaults above
+QUESTION_DATABASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "question_database.json")
+if os.path.exists(QUESTION_DATABASE_FILE):
+    with open(QUESTION_DATABASE_FILE, encoding="utf-8") as f:
+        QUESTION_DATABASE.update(json.load(f))
+
+# What the job ranking scores postings against (title + description)
+CANDIDATE_PROFILE = {
+    'titles': ["python developer", "backend developer", "software engineer", "django developer"],
+    'skills': ["python", "django", "flask", "fastapi", "rest api", "sql", "postgresql", "docker", "aws",
+               "git", "linux", "celery", "redis"],
+    # Postings mentioning any of these are never applied to
+    'exclusions': ["principal", "staff engineer", "unpaid", "security clearance", "internship"]
+}
+
+RANKING_CONFIG = {
+    # Rank each results page against CANDIDATE_PROFILE and apply best-first
+    'enabled': True,
+    # Postings scoring below this are skipped (score = weighted cosine similarity)
+    'min_score': 0.05,
+    'weights': {'titles': 2.0, 'skills': 1.0},
+    # Fetch every posting's description in-page before ranking (titles only when False)
+    'fetch_descriptions': True
+}
+
+AI_CONFIG = {
+    # Minimum cosine similarity for a fuzzy question match to be trusted
+    'similarity_threshold': 0.5,
+    'default_answer': "",
+    # spaCy pipeline used to lemmatize questions; the index is refitted when it (or its version) changes
+    'spacy_model': "en_core_web_sm",
+    # Fitted TF-IDF index, rebuilt automatically when the question base or spaCy model changes
+    'index_dir': os.path.join("cache", "tfidf_index")
+}
+
+FILL_CONFIG = {
+    # Read each Easy Apply step with one snapshot script instead of per-element calls;
+    # set to False to compare driver command counts against the per-element path
+    'use_snapshot': True,
+    # Label -> answer results kept by the compiled question matcher
+    'match_cache_size': 1024,
+    # Easy Apply steps walked before an application is recorded as failed
+    'max_steps': 12,
+    # Minimum difflib ratio for a custom dropdown option to count as the answer
+    'option_match_threshold': 0.6
+}
+
+WAIT_CONFIG = {
+    # Per-phase upper bounds (seconds); waits return as soon as the page is ready
+    'timeouts': {
+        'default': 10,
+        'page_load': 15,
+        'login_submit': 20,
+        'search': 15,
+        'job_details': 8,
+        'overlay_close': 3,
+        'apply_button': 8,
+        'modal_open': 8,
+        'step_change': 8,
+        'submit': 10,
+        'options': 4,
+        'modal_close': 4
+    },
+    'poll_frequency': 0.1,
+    # How long the DOM must stay unchanged to count as settled (milliseconds)
+    'quiet_ms': 250,
+    # Human-like pause between applications (seconds, uniform range)
+    'between_jobs': (2, 4)
+}
+
+JOB_FEED_CONFIG = {
+    # Search result pages the job feed may follow before it stops
+    'max_pages': 40,
+    # Harvest calls per results page before it is left as is, in case the pane never reports its end
+    'max_scrolls': 50
+}
+
+PREFETCH_CONFIG = {
+    # Upcoming jobs whose detail pages are fetched in-page while the current one is filled;
+    # jobs found without Easy Apply are skipped without being opened (0 disables)
+    'lookahead': 2,
+    'job_url': "https://www.linkedin.com/jobs/view/{job_id}/"
+}
+
+LEDGER_CONFIG = {
+    # SQLite record of every job touched, used to skip finished jobs and resume runs
+    'path': os.path.join("data", "applications.sqlite3"),
+    # Failed/interrupted jobs are retried until they have been opened this many times
+    'max_attempts': 2,
+    # Most queued writes committed per transaction by the background writer
+    'batch_size': 50
+}
+
+FILL_CACHE_CONFIG = {
+    # Resolved answers per form structure, reused when an employer repeats a question set
+    'path': os.path.join("cache", "fill_plans.json"),
+    'max_entries': 500
+}
+
+SCREENSHOT_CONFIG = {
+    'directory': "screenshots",
+    # Captures waiting to be written; further captures are dropped rather than blocking
+    'queue_size': 8,
+    # Oldest screenshots are deleted once the directory grows past this size
+    'max_bytes': 200 * 1024 * 1024
+}
+
+INSTRUMENTATION_CONFIG = {
+    # Record every WebDriver command (name, calling method, phase, latency) and report
+    # per job/run; adds a little overhead, so it is off by default
+    'enabled': os.getenv("JAA_INSTRUMENT", "") == "1",
+    # Where the collapsed-stack export (flamegraph.pl / speedscope) is written
+    'export_dir': "logs"
+}
+
+RECORDER_CONFIG = {
+    # Store every Easy Apply step's modal DOM plus the fill decisions made on it, for
+    # offline replay (python -m benchmarks.replay_steps); off by default
+    'enabled': os.getenv("JAA_RECORD_STEPS", "") == "1",
+    # Content-addressed store: objects/<sha256>.html.zst (or .gz) and a steps.jsonl manifest
+    'directory': "data/step_snapshots"
+}
+
+SESSION_CONFIG = {
+    # Reuse the signed-in browser session between runs instead of logging in each time
+    'enabled': os.getenv("JAA_SESSION", "1") != "0",
+    # Cookies + localStorage, Fernet-encrypted; set JAA_SESSION_KEY (a Fernet key, e.g. in .env)
+    # to keep the key off disk, otherwise a key file with owner-only permissions is created
+    'path': os.path.join("data", "session.bin"),
+    'key_path': os.path.join("data", "session.key"),
+    'key_env': "JAA_SESSION_KEY",
+    # Saved sessions older than this are discarded without being tried
+    'max_age_days': 7,
+    # Light same-origin page loaded before setting cookies, and the URL fetched to validate them
+    'origin_url': "https://www.linkedin.com/robots.txt",
+    'check_url': "https://www.linkedin.com/feed/"
+}
+
+WATCHDOG_CONFIG = {
+    # Sample the browser's memory (CDP Performance.getMetrics) every N opened jobs and
+    # restart it between jobs once a limit is crossed; the session and results page are restored
+    'enabled': os.getenv("JAA_WATCHDOG", "1") != "0",
+    'every_jobs': 10,
+    'max_heap_mb': 512,
+    'max_nodes': 150000,
+    'max_listeners': 60000
+}
+
+TEXT_ENTRY_CONFIG = {
+    # How text gets into each kind of field (login credentials, then the input's type attribute):
+    # "per_char" (one send_keys per character with human-like pauses), "bulk" (one send_keys),
+    # "insert_text" (CDP Input.insertText) or "native" (value setter + input/change events)
+    'policy': {
+        'username': 'bulk',
+        'password': 'bulk',
+        'email': 'native',
+        'tel': 'native',
+        'number': 'native',
+        'text': 'native',
+        'default': 'bulk'
+    },
+    # Force one strategy for every field, e.g. JAA_TEXT_ENTRY=per_char for the old behaviour
+    'strategy': os.getenv("JAA_TEXT_ENTRY") or None,
+    # per_char pauses (seconds): after focusing the field, and between keystrokes
+    'focus_pause': (0.2, 1.5),
+    'key_pause': (0.05, 0.15)
+}
+
+PAGE_LOAD_CONFIG = {
+    # "lean": driver.get returns at DOMContentLoaded (pageLoadStrategy=eager) and the
+    # request groups in 'block' are never fetched; "full": Chrome's defaults.
+    # Opt in with JAA_PAGE_LOAD=lean (not yet the default: still to be checked against live LinkedIn)
+    'profile': os.getenv("JAA_PAGE_LOAD", "full"),
+    # Network.setBlockedURLs patterns ('*' wildcards) per group
+    'blocked_urls': {
+        'images': ["*media.licdn.com/dms/image/*", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico"],
+        'media': ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist/*"],
+        'fonts': ["*.woff", "*.woff2", "*.ttf", "*.otf"],
+        'analytics': ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                      "*px.ads.linkedin.com*", "*snap.licdn.com/li.lms-analytics*", "*linkedin.com/li/track*",
+                      "*bat.bing.com*", "*connect.facebook.net*"]
+    },
+    'block': ['images', 'media', 'fonts', 'analytics'],
+    # Bypass the HTTP cache (Network.setCacheDisabled), keeping long runs' memory flat at the cost of re-downloads
+    'disable_cache': False,
+    'headless': os.getenv("JAA_HEADLESS", "0") == "1",
+    # Log bytes transferred and page-ready time after every navigation (one extra script call each)
+    'report': True
+}
+
+DRIVER_CONFIG = {
+    # Page backend for bulk element operations (field states, overlay dismissal):
+    # "selenium" (one WebDriver round trip each) or "cdp" (pipelined over the DevTools websocket)
+    'backend': os.getenv("JAA_BACKEND", "selenium"),
+    # Seconds to wait for a batch of DevTools replies
+    'cdp_timeout': 10
+}
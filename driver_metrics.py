@@ -0,0 +1,190 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from structured_logging import span_path
+
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class CommandCounter:
+    """Counts the WebDriver commands (HTTP round trips) issued through a driver"""
+
+    def __init__(self, driver):
+        self.total = 0
+        self.attach(driver)
+
+    def attach(self, driver):
+        """Count through driver from now on (also used when the browser is replaced)"""
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, driver_command, params=None):
+        self.total += 1
+        return self._execute(driver_command, params)
+
+    @contextmanager
+    def measure(self):
+        """Yield a window object whose ``commands`` is the count issued inside the block"""
+        window = CommandWindow(self.total)
+        try:
+            yield window
+        finally:
+            window.commands = self.total - window.start
+
+
+class CommandWindow:
+    def __init__(self, start):
+        self.start = start
+        self.commands = 0
+
+
+class DriverInstrumentation:
+    """Opt-in profiler for WebDriver round trips.
+
+    Wraps the driver's command executor to record each command's name, the
+    LinkedInAutomator method and project call site that issued it, the open span
+    path and its latency. time.sleep is wrapped as well, until uninstall(), so
+    driver time, sleep time and remaining Python time can be separated per job
+    and per run; only the bot's own pauses count (main thread, called from a
+    project file), not Selenium's polling or the background writers' idling.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.records = []  # (span path, method, site, command, seconds)
+        self.sleeps = []   # (span path, method, site, seconds)
+        self.started = time.perf_counter()
+        self._window = (0, 0, self.started)
+
+        driver.command_executor = _InstrumentedExecutor(driver.command_executor, self)
+        self._sleep = time.sleep
+        time.sleep = self._instrumented_sleep
+
+    def attach(self, driver):
+        """Follow a replacement browser, keeping everything recorded so far"""
+        if isinstance(self.driver.command_executor, _InstrumentedExecutor):
+            self.driver.command_executor = self.driver.command_executor.wrapped
+        self.driver = driver
+        driver.command_executor = _InstrumentedExecutor(driver.command_executor, self)
+
+    def uninstall(self):
+        if isinstance(self.driver.command_executor, _InstrumentedExecutor):
+            self.driver.command_executor = self.driver.command_executor.wrapped
+        if time.sleep == self._instrumented_sleep:  # not if someone patched it again since
+            time.sleep = self._sleep
+
+    def _instrumented_sleep(self, seconds):
+        if (threading.current_thread() is not threading.main_thread()
+                or not _in_project(sys._getframe(1).f_code.co_filename)):
+            self._sleep(seconds)
+            return
+        start = time.perf_counter()
+        try:
+            self._sleep(seconds)
+        finally:
+            method, site = _call_site()
+            self.sleeps.append((tuple(span_path()), method, site, time.perf_counter() - start))
+
+    def record(self, command, seconds):
+        method, site = _call_site()
+        self.records.append((tuple(span_path()), method, site, command, seconds))
+
+    # --- reports -----------------------------------------------------------
+
+    def begin_job(self):
+        """Start a new per-job window for job_report()"""
+        self._window = (len(self.records), len(self.sleeps), time.perf_counter())
+
+    def job_report(self):
+        first_record, first_sleep, started = self._window
+        return self._report(self.records[first_record:], self.sleeps[first_sleep:],
+                            time.perf_counter() - started)
+
+    def run_report(self):
+        return self._report(self.records, self.sleeps, time.perf_counter() - self.started)
+
+    @staticmethod
+    def _report(records, sleeps, wall, top=10):
+        driver_time = sum(r[4] for r in records)
+        sleep_time = sum(s[3] for s in sleeps)
+        per_phase = defaultdict(lambda: [0, 0.0])
+        per_site = defaultdict(lambda: [0, 0.0])
+        for path, method, site, command, seconds in records:
+            phase = path[-1] if path else "(none)"
+            per_phase[phase][0] += 1
+            per_phase[phase][1] += seconds
+            per_site[f"{method} @ {site}"][0] += 1
+            per_site[f"{method} @ {site}"][1] += seconds
+        return {
+            'commands': len(records),
+            'wall_s': round(wall, 3),
+            'driver_s': round(driver_time, 3),
+            'sleep_s': round(sleep_time, 3),
+            'python_s': round(max(0.0, wall - driver_time - sleep_time), 3),
+            'per_phase': {k: {'commands': n, 'seconds': round(t, 3)} for k, (n, t) in per_phase.items()},
+            'top_sites': [{'site': k, 'commands': n, 'seconds': round(t, 3)}
+                          for k, (n, t) in sorted(per_site.items(), key=lambda item: -item[1][1])[:top]],
+        }
+
+    def log_report(self, report, label):
+        logging.info(f"Driver profile {label}: {report['commands']} commands, wall {report['wall_s']}s = "
+                     f"driver {report['driver_s']}s + sleep {report['sleep_s']}s + python {report['python_s']}s",
+                     extra={'driver_profile': label, **report})
+
+    def export_folded(self, path):
+        """Write collapsed stacks (span;...;method;command microseconds) for flamegraph.pl / speedscope"""
+        folded = defaultdict(float)
+        for path_, method, site, command, seconds in self.records:
+            folded[";".join(path_ + (method, command))] += seconds
+        for path_, method, site, seconds in self.sleeps:
+            folded[";".join(path_ + (method, "sleep"))] += seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, seconds in sorted(folded.items()):
+                f.write(f"{stack} {int(seconds * 1_000_000)}\n")
+        return path
+
+
+class _InstrumentedExecutor:
+    """Delegating proxy around selenium's RemoteConnection that times execute()"""
+
+    def __init__(self, wrapped, instrumentation):
+        self.wrapped = wrapped
+        self._instrumentation = instrumentation
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        try:
+            return self.wrapped.execute(command, params)
+        finally:
+            self._instrumentation.record(command, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+
+_SKIP_FILES = ("driver_metrics.py",)
+
+
+def _in_project(filename):
+    return filename.startswith(_PROJECT_DIR) and "site-packages" not in filename and not filename.endswith(_SKIP_FILES)
+
+
+def _call_site():
+    """(LinkedInAutomator method, first project file:function) that led to the current call"""
+    method = site = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if site is None and _in_project(filename):
+            site = f"{os.path.basename(filename)}:{frame.f_code.co_name}"
+        if filename.endswith("linkedin_api.py"):
+            method = frame.f_code.co_name
+            break
+        frame = frame.f_back
+    return method or "(outside LinkedInAutomator)", site or "(unknown)"
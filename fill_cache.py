@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+
+from config import FILL_CACHE_CONFIG
+
+
+def form_fingerprint(fields):
+    """Stable hash of a form step's structure: field kinds, labels and option sets (not values)"""
+    shape = []
+    for field in fields:
+        options = [o['label'] if isinstance(o, dict) else o for o in field.options]
+        shape.append([field.kind, field.label, options])
+    return hashlib.sha1(json.dumps(shape, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def answers_fingerprint(question_db, username, ai_settings=None):
+    """Stable hash of what cached decisions were derived from besides the form: answers, login email, AI matching"""
+    payload = json.dumps([question_db, username, ai_settings], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def encode_decisions(fields, decisions):
+    """Turn {ref: (action, value)} into a position-based form that survives new element refs.
+
+    A None decision (field deliberately left unanswered) is kept as null, so a hit
+    knows the field was already considered.
+    """
+    entries = {}
+    for index, field in enumerate(fields):
+        if field.ref not in decisions:
+            continue
+        decision = decisions[field.ref]
+        if decision is None:
+            entries[str(index)] = None
+            continue
+        action, value = decision
+        if action == 'click_option':
+            value = next(i for i, o in enumerate(field.options) if o['ref'] == value)
+        entries[str(index)] = [action, value]
+    return entries
+
+
+def decode_decisions(fields, entries):
+    """Map cached position-based decisions back onto this snapshot's fields"""
+    decisions = {}
+    for key, entry in entries.items():
+        field = fields[int(key)]
+        if entry is None:
+            decisions[field.ref] = None
+            continue
+        action, value = entry
+        if action == 'click_option':
+            value = field.options[value]['ref']
+        decisions[field.ref] = (action, value)
+    return decisions
+
+
+class FillCache:
+    """Persistent LRU cache of form fingerprint -> resolved field answers.
+
+    The file also records the answers fingerprint the decisions were made with;
+    when the question base, username or AI settings change, the whole cache is
+    dropped so edited answers take effect.
+    """
+
+    def __init__(self, path=None, max_entries=None, answers=""):
+        self.path = path or FILL_CACHE_CONFIG['path']
+        self.max_entries = max_entries or FILL_CACHE_CONFIG['max_entries']
+        self.answers = answers
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('answers') != self.answers:
+                logging.info("Answers changed since the fill cache was written - starting with an empty cache")
+                return
+            self.entries = OrderedDict(data['entries'])
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable fill cache {self.path}: {str(e)}")
+
+    def get(self, fingerprint):
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(fingerprint)
+        return entry
+
+    def put(self, fingerprint, entry):
+        self.entries[fingerprint] = entry
+        self.entries.move_to_end(fingerprint)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({'answers': self.answers, 'entries': self.entries}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logging.warning(f"Could not save fill cache: {str(e)}")
+
+    def log_report(self):
+        logging.info(f"Fill cache: {self.hits} hits, {self.misses} misses "
+                     f"({self.hit_rate:.0%} hit rate), {len(self.entries)} cached forms")
@@ -0,0 +1,121 @@
+import json
+
+# Applies a whole fill plan in one injected script. Values are written through the
+# native setters and followed by input/change events so LinkedIn's validation
+# (React-controlled inputs) sees them exactly as if they had been typed.
+APPLY_PLAN_JS = r"""
+// @jaa:apply-fill-plan
+const plan = JSON.parse(arguments[0]);
+const results = [];
+
+function fire(el, names) {
+    names.forEach(name => el.dispatchEvent(new Event(name, {bubbles: true})));
+}
+
+function setNative(el, proto, value) {
+    const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    setter.call(el, value);
+}
+
+for (const step of plan) {
+    try {
+        const el = document.querySelector(step.locator);
+        if (!el) throw new Error('element not found');
+
+        if (step.action === 'type') {
+            el.focus();
+            setNative(el, HTMLInputElement.prototype, step.value);
+            fire(el, ['input', 'change', 'blur']);
+            if (el.value !== step.value) throw new Error('value not accepted');
+        } else if (step.action === 'click') {
+            el.click();
+        } else if (step.action === 'click_option') {
+            const opt = document.querySelector("[data-jaa-ref='" + step.value + "']");
+            if (!opt) throw new Error('option not found');
+            opt.click();
+        } else if (step.action === 'select' || step.action === 'select_value') {
+            const match = Array.from(el.options).find(o => step.action === 'select'
+                ? (o.innerText || o.textContent || '').trim() === step.value
+                : o.value === step.value);
+            if (!match) throw new Error('option not found');
+            setNative(el, HTMLSelectElement.prototype, match.value);
+            fire(el, ['input', 'change']);
+        } else {
+            throw new Error('unsupported action ' + step.action);
+        }
+        results.push({locator: step.locator, ok: true, error: ''});
+    } catch (e) {
+        results.push({locator: step.locator, ok: false, error: String(e && e.message || e)});
+    }
+}
+return JSON.stringify(results);
+"""
+
+# Custom dropdowns need a click, a render and a second click, so they can't be applied blind
+SCRIPTABLE_ACTIONS = ('type', 'click', 'click_option', 'select', 'select_value')
+
+
+class FillStep:
+    """One planned action: field locator -> action -> value"""
+
+    def __init__(self, field, action, value=None):
+        self.field = field
+        self.locator = field.selector
+        self.action = action
+        self.value = value
+        self.ok = False
+        self.error = ""
+
+    def to_dict(self):
+        return {'locator': self.locator, 'action': self.action, 'value': self.value}
+
+    def __repr__(self):
+        return f"FillStep({self.locator!r}, {self.action!r}, {self.value!r})"
+
+
+class FillPlan:
+    """Ordered set of answers for one Easy Apply step"""
+
+    def __init__(self):
+        self.steps = []
+
+    def add(self, field, action, value=None):
+        step = FillStep(field, action, value)
+        self.steps.append(step)
+        return step
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+
+def execute_fill_plan(driver, plan, scriptable=None):
+    """Apply every scriptable step in one driver call and return the steps that failed.
+
+    scriptable(step) can hold back further steps (e.g. text the policy wants typed);
+    they are returned as not scriptable, for the caller's per-element path.
+    """
+    def in_script(step):
+        return step.action in SCRIPTABLE_ACTIONS and (scriptable is None or scriptable(step))
+
+    scripted = [step for step in plan if in_script(step)]
+    failed = [step for step in plan if not in_script(step)]
+    for step in failed:
+        step.error = "not scriptable"
+
+    if scripted:
+        try:
+            raw = driver.execute_script(APPLY_PLAN_JS, json.dumps([s.to_dict() for s in scripted]))
+            results = json.loads(raw or "[]")
+        except Exception as e:
+            results = [{'ok': False, 'error': str(e)}] * len(scripted)
+
+        for step, result in zip(scripted, results):
+            step.ok = bool(result.get('ok'))
+            step.error = result.get('error', "")
+            if not step.ok:
+                failed.append(step)
+
+    return sorted(failed, key=plan.steps.index)
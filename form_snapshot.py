@@ -0,0 +1,129 @@
+import json
+
+# Walks the Easy Apply modal once and returns a JSON model of every field, so
+# the fill decisions can run in Python without a round trip per attribute.
+SNAPSHOT_JS = r"""
+// @jaa:form-snapshot
+const root = document.querySelector('.jobs-easy-apply-modal, div[role="dialog"]') || document;
+window.__jaaRef = window.__jaaRef || 0;
+
+function ref(el) {
+    let r = el.getAttribute('data-jaa-ref');
+    if (!r) {
+        r = String(++window.__jaaRef);
+        el.setAttribute('data-jaa-ref', r);
+    }
+    return r;
+}
+
+function text(el) {
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+}
+
+function labelFor(el) {
+    const aria = el.getAttribute('aria-label');
+    if (aria) return aria;
+    if (el.id) {
+        const lbl = root.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (lbl && text(lbl)) return text(lbl);
+    }
+    const legend = el.querySelector ? el.querySelector('legend') : null;
+    if (legend && text(legend)) return text(legend);
+    return text(el.previousElementSibling);
+}
+
+const fields = [];
+const countryCode = text(root).indexOf('Phone country code') !== -1;
+
+root.querySelectorAll("input[type='text'], input[type='number'], input[type='email'], input[type='tel']")
+    .forEach(el => fields.push({
+        ref: ref(el), kind: 'text', label: labelFor(el), value: el.value || '',
+        selected: false, enabled: !el.disabled, options: [], input_type: el.type
+    }));
+
+root.querySelectorAll("input[type='checkbox']").forEach(el => fields.push({
+    ref: ref(el), kind: 'checkbox', label: el.getAttribute('aria-label') || '', value: el.value || '',
+    selected: el.checked, enabled: !el.disabled, options: []
+}));
+
+root.querySelectorAll("fieldset, div[role='radiogroup']").forEach(group => {
+    const legend = group.querySelector('legend');
+    const options = [];
+    group.querySelectorAll("input[type='radio'], label[data-test-text-selectable-option__label]")
+        .forEach(opt => options.push({
+            ref: ref(opt),
+            label: opt.getAttribute('aria-label') || opt.getAttribute('value') || text(opt),
+            selected: !!opt.checked
+        }));
+    fields.push({
+        ref: ref(group), kind: 'radio',
+        label: legend ? text(legend) : text(group.previousElementSibling),
+        value: '', selected: !!group.querySelector("input[type='radio']:checked"),
+        enabled: true, options: options
+    });
+});
+
+root.querySelectorAll('select').forEach(el => {
+    const current = el.options[el.selectedIndex];
+    fields.push({
+        ref: ref(el),
+        kind: countryCode && (el.id || '').indexOf('country') !== -1 ? 'country_code' : 'select',
+        label: labelFor(el), value: current ? text(current) : '',
+        selected: el.selectedIndex >= 0, enabled: !el.disabled,
+        options: Array.from(el.options).map(o => text(o)),
+        option_values: Array.from(el.options).map(o => o.value)
+    });
+});
+
+root.querySelectorAll("button.artdeco-dropdown__trigger, div[role='combobox']").forEach(el => fields.push({
+    ref: ref(el), kind: 'combobox', label: el.getAttribute('aria-label') || '', value: text(el),
+    selected: false, enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true',
+    options: [], controls: el.getAttribute('aria-controls') || el.getAttribute('aria-owns') || ''
+}));
+
+return JSON.stringify(fields);
+"""
+
+PLACEHOLDERS = ["select an option", "please make a selection", "please enter a valid answer"]
+
+
+class FormField:
+    """A single Easy Apply field as captured by the snapshot script"""
+
+    def __init__(self, data):
+        self.ref = data['ref']
+        self.kind = data['kind']
+        self.label = (data.get('label') or '').strip().lower()
+        self.value = (data.get('value') or '').strip()
+        self.selected = bool(data.get('selected'))
+        self.enabled = bool(data.get('enabled', True))
+        self.options = data.get('options') or []
+        self.option_values = data.get('option_values') or []
+        self.controls = data.get('controls') or ''
+        self.input_type = data.get('input_type') or ''
+
+    @property
+    def selector(self):
+        """CSS selector that re-resolves this field in the live DOM"""
+        return ref_selector(self.ref)
+
+    @property
+    def has_value(self):
+        """Whether the field already carries a real (non-placeholder) answer"""
+        if self.kind in ('checkbox', 'radio'):
+            return self.selected
+        return bool(self.value) and self.value.lower() not in PLACEHOLDERS
+
+    def __repr__(self):
+        return f"FormField({self.kind!r}, {self.label!r}, ref={self.ref})"
+
+
+def ref_selector(ref):
+    """CSS selector for an element tagged by the snapshot script"""
+    return f"[data-jaa-ref='{ref}']"
+
+
+def take_form_snapshot(driver):
+    """Capture every field of the current Easy Apply step in one driver call"""
+    raw = driver.execute_script(SNAPSHOT_JS)
+    return [FormField(item) for item in json.loads(raw or "[]")]
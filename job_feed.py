@@ -0,0 +1,182 @@
+import json
+import logging
+
+from config import JOB_FEED_CONFIG
+
+RESULTS_PER_PAGE = 25
+# Candidates for the scrolling results pane, most specific first; the first one that
+# actually overflows is scrolled (querySelector on the joined list would pick whichever
+# comes first in the document, i.e. the outer .scaffold-layout__list)
+RESULTS_PANE_SELECTORS = [".jobs-search-results-list", ".scaffold-layout__list > div", ".scaffold-layout__list"]
+RESULTS_PANE_SELECTOR = ", ".join(RESULTS_PANE_SELECTORS)
+
+# Reads every rendered job card in one call (id, title, company, location), then
+# scrolls the results pane one screen so the next batch gets rendered. The pane
+# counts as exhausted once a scroll no longer moves it.
+HARVEST_JS = r"""
+// @jaa:harvest-cards
+const panes = arguments[0].map(selector => document.querySelector(selector)).filter(Boolean);
+const pane = panes.find(el => el.scrollHeight > el.clientHeight) || panes[0];
+const seen = new Set();
+const cards = [];
+
+function text(root, selector) {
+    const el = root.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim().split('\n')[0].trim() : '';
+}
+
+document.querySelectorAll('[data-occludable-job-id], [data-job-id]').forEach(el => {
+    const id = el.getAttribute('data-occludable-job-id') || el.getAttribute('data-job-id');
+    if (!id || seen.has(id)) return;
+    const title = text(el, '.job-card-list__title, .job-card-container__link strong, .job-card-container__link');
+    if (!title) return;  // occluded card, picked up once scrolled into range
+    seen.add(id);
+    cards.push({
+        job_id: id,
+        title: title,
+        company: text(el, '.job-card-container__primary-description, .artdeco-entity-lockup__subtitle'),
+        location: text(el, '.job-card-container__metadata-item, .artdeco-entity-lockup__caption')
+    });
+});
+
+let exhausted = true;
+if (pane) {
+    const before = pane.scrollTop;
+    pane.scrollTop += pane.clientHeight;
+    exhausted = Math.abs(pane.scrollTop - before) < 1;
+}
+return JSON.stringify({cards: cards, exhausted: exhausted});
+"""
+
+NEXT_PAGE_JS = r"""
+// @jaa:next-page
+const next = document.querySelector("button[aria-label='View next page'], .jobs-search-pagination__button--next")
+    || (() => {
+        const active = document.querySelector('li.artdeco-pagination__indicator--number.active, li.active[data-test-pagination-page-btn]');
+        return active && active.nextElementSibling ? active.nextElementSibling.querySelector('button') : null;
+    })();
+if (!next || next.disabled) return false;
+next.click();
+return true;
+"""
+
+FIRST_CARD_JS = r"""
+// @jaa:first-card
+const el = document.querySelector('[data-occludable-job-id], [data-job-id]');
+return el ? (el.getAttribute('data-occludable-job-id') || el.getAttribute('data-job-id')) : '';
+"""
+
+RESOLVE_CARD_JS = r"""
+// @jaa:resolve-card
+const id = arguments[0];
+const holder = document.querySelector("[data-occludable-job-id='" + id + "'], [data-job-id='" + id + "']");
+if (!holder) return null;
+const card = holder.matches('.job-card-container--clickable') ? holder
+    : (holder.querySelector('.job-card-container--clickable') || holder);
+card.scrollIntoView({block: 'center'});
+return card;
+"""
+
+
+class JobRecord:
+    """Lightweight job card data; the live element is re-resolved by id before clicking"""
+
+    __slots__ = ("job_id", "title", "company", "location", "page", "description")
+
+    def __init__(self, job_id, title="", company="", location="", page=1, description=""):
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.location = location
+        self.page = page
+        self.description = description
+
+    def __repr__(self):
+        return f"JobRecord({self.job_id!r}, {self.title!r}, {self.company!r})"
+
+
+class JobFeed:
+    """Streams de-duplicated job records by scrolling the results pane and following pagination"""
+
+    def __init__(self, driver, waits, max_pages=None):
+        self.driver = driver
+        self.waits = waits
+        self.max_pages = max_pages or JOB_FEED_CONFIG['max_pages']
+        self.max_scrolls = JOB_FEED_CONFIG['max_scrolls']
+        self.seen = set()
+        self.page = 1
+
+    def __iter__(self):
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self):
+        """Yield lists of newly seen job records, one list per harvest call"""
+        while True:
+            yield from self._page_batches()
+            if not self._advance():
+                return
+
+    def pages(self):
+        """Yield all new job records of one results page at a time, while that page is still loaded"""
+        while True:
+            yield [record for batch in self._page_batches() for record in batch]
+            if not self._advance():
+                return
+
+    def _page_batches(self):
+        """Harvest the current page, scrolling until its results pane is exhausted"""
+        for _ in range(self.max_scrolls):
+            batch = self._harvest()
+            new = [card for card in batch['cards'] if card['job_id'] not in self.seen]
+            for card in new:
+                self.seen.add(card['job_id'])
+            if new:
+                yield [JobRecord(page=self.page, **card) for card in new]
+                continue
+            if not batch['exhausted']:
+                # Let the cards that just scrolled into range render before re-reading
+                self.waits.dom_quiet('feed_scroll', RESULTS_PANE_SELECTOR)
+                continue
+            return
+        logging.warning(f"Results page {self.page} still scrolling after {self.max_scrolls} harvests - moving on")
+
+    def reattach(self, driver, pending_ids=()):
+        """Continue on a replacement browser showing the same results page.
+
+        Scrolls until the cards still to be processed are rendered again; cards
+        not seen before are left for the next harvest.
+        """
+        self.driver = driver
+        pending = set(pending_ids)
+        for _ in range(self.max_scrolls):
+            if not pending:
+                return
+            batch = self._harvest()
+            pending -= {card['job_id'] for card in batch['cards']}
+            if batch['exhausted']:
+                return
+            if pending:
+                self.waits.dom_quiet('feed_scroll', RESULTS_PANE_SELECTOR)
+
+    def _advance(self):
+        if self.page >= self.max_pages or not self._next_page():
+            logging.info(f"Job feed exhausted after {self.page} page(s), {len(self.seen)} jobs")
+            return False
+        return True
+
+    def _harvest(self):
+        raw = self.driver.execute_script(HARVEST_JS, RESULTS_PANE_SELECTORS)
+        return json.loads(raw or '{"cards": [], "exhausted": true}')
+
+    def _next_page(self):
+        first = self.driver.execute_script(FIRST_CARD_JS)
+        if not self.driver.execute_script(NEXT_PAGE_JS):
+            return False
+        self.page += 1
+        changed = self.waits.until('search', lambda d: d.execute_script(FIRST_CARD_JS) not in ("", first))
+        return bool(changed)
+
+    def resolve_card(self, job_id):
+        """Find the current card element for a job id, scrolled into view, or None"""
+        return self.driver.execute_script(RESOLVE_CARD_JS, job_id)
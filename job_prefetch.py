@@ -0,0 +1,170 @@
+import json
+import logging
+import time
+
+from config import PREFETCH_CONFIG, WAIT_CONFIG
+
+DESCRIPTION_SELECTOR = (".jobs-description__content, .jobs-box__html-content, .jobs-description, "
+                        ".show-more-less-html__markup, .description__text")
+
+# Starts an in-page fetch of each job's detail page and returns immediately; the
+# browser downloads and parses them while the bot keeps driving the current form.
+# easy_apply is true/false when the fetched HTML has an apply button, null when it
+# has none: LinkedIn often draws the button client-side, so a missing one proves nothing.
+PREFETCH_START_JS = r"""
+// @jaa:prefetch-start
+const ids = arguments[0], template = arguments[1], descriptionSelector = arguments[2];
+const store = window.__jaaPrefetch = window.__jaaPrefetch || {};
+ids.forEach(id => {
+    if (store[id]) return;
+    const started = performance.now();
+    store[id] = {state: 'pending'};
+    fetch(template.replace('{job_id}', id), {credentials: 'include'})
+        .then(r => r.ok ? r.text() : Promise.reject(new Error('HTTP ' + r.status)))
+        .then(html => {
+            const doc = new DOMParser().parseFromString(html, 'text/html');
+            const description = doc.querySelector(descriptionSelector);
+            const button = doc.querySelector('.jobs-apply-button, .jobs-apply-button--top-card');
+            const easyApply = button ? /easy apply/i.test(button.textContent) : null;
+            store[id] = {
+                state: 'done', easy_apply: easyApply,
+                description: description ? description.textContent.trim() : '',
+                ms: performance.now() - started
+            };
+        })
+        .catch(e => { store[id] = {state: 'error', error: String(e), ms: performance.now() - started}; });
+});
+return ids.length;
+"""
+
+# Hands over (and forgets) every prefetch that has finished.
+PREFETCH_COLLECT_JS = r"""
+// @jaa:prefetch-collect
+const store = window.__jaaPrefetch || {};
+const finished = {};
+Object.keys(store).forEach(id => {
+    if (store[id].state !== 'pending') {
+        finished[id] = store[id];
+        delete store[id];
+    }
+});
+return JSON.stringify(finished);
+"""
+
+
+class JobDetails:
+    __slots__ = ("job_id", "easy_apply", "description", "fetch_ms", "error")
+
+    def __init__(self, job_id, easy_apply=None, description="", fetch_ms=0.0, error=""):
+        self.job_id = job_id
+        self.easy_apply = easy_apply
+        self.description = description
+        self.fetch_ms = fetch_ms
+        self.error = error
+
+
+class JobPrefetcher:
+    """Fetches the next jobs' detail pages in the background and filters out those without Easy Apply"""
+
+    def __init__(self, driver, lookahead=None, job_url=None):
+        self.driver = driver
+        self.lookahead = PREFETCH_CONFIG['lookahead'] if lookahead is None else lookahead
+        self.job_url = job_url or PREFETCH_CONFIG['job_url']
+        self.scheduled = set()
+        self.ready = {}
+        self.hits = 0
+        self.misses = 0
+        self.filtered = 0
+        self.saved = 0.0
+        self.overhead = 0.0
+        self._visits = []  # seconds spent on jobs that turned out to have no Easy Apply
+
+    @property
+    def enabled(self):
+        return self.lookahead > 0
+
+    def schedule(self, records, limit=None):
+        """Start fetching the given upcoming jobs (fire-and-forget, one driver call)"""
+        ids = [r.job_id for r in records if r.job_id not in self.scheduled][:limit or self.lookahead]
+        if not ids:
+            return
+        start = time.perf_counter()
+        try:
+            self.driver.execute_script(PREFETCH_START_JS, ids, self.job_url, DESCRIPTION_SELECTOR)
+            self.scheduled.update(ids)
+        except Exception as e:
+            logging.debug(f"Prefetch could not start: {str(e)}")
+        finally:
+            self.overhead += time.perf_counter() - start
+
+    def _collect(self):
+        start = time.perf_counter()
+        try:
+            finished = json.loads(self.driver.execute_script(PREFETCH_COLLECT_JS) or "{}")
+        except Exception as e:
+            logging.debug(f"Prefetch results unavailable: {str(e)}")
+            finished = {}
+        finally:
+            self.overhead += time.perf_counter() - start
+        for job_id, result in finished.items():
+            self.ready[job_id] = JobDetails(job_id, result.get('easy_apply'), result.get('description', ""),
+                                            result.get('ms', 0.0), result.get('error', ""))
+
+    def fetch_all(self, records, waits):
+        """Fetch every record's details at once and wait for them; fills in record.description"""
+        self.schedule(records, limit=len(records))
+
+        def collected(driver):
+            self._collect()
+            return all(r.job_id in self.ready or r.job_id not in self.scheduled for r in records)
+
+        waits.until('job_details', collected)
+        for record in records:
+            details = self.ready.get(record.job_id)
+            if details and not details.error:
+                record.description = details.description
+
+    def reattach(self, driver):
+        """Continue on a replacement browser; fetches still running in the old page are dropped"""
+        self.driver = driver
+        self.scheduled = set(self.ready)
+
+    def take(self, job_id):
+        """Prefetched details for job_id, or None if they were not scheduled or are not back yet"""
+        if job_id not in self.scheduled:
+            return None
+        if job_id not in self.ready:
+            self._collect()
+        details = self.ready.pop(job_id, None)
+        if details is None or details.error:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return details
+
+    def observe_visit(self, seconds):
+        """Record what opening a job without Easy Apply actually cost"""
+        self._visits.append(seconds)
+
+    def visit_cost(self):
+        """Seconds a job without Easy Apply costs when opened: measured, or the timeout plus pacing"""
+        if self._visits:
+            return sum(self._visits) / len(self._visits)
+        return WAIT_CONFIG['timeouts']['apply_button'] + sum(WAIT_CONFIG['between_jobs']) / 2
+
+    def skipped(self, job_id):
+        """Account a job filtered out before any click; returns the estimated seconds saved"""
+        saved = self.visit_cost()
+        self.filtered += 1
+        self.saved += saved
+        logging.info(f"Job {job_id} has no Easy Apply (prefetched) - skipped without opening it, "
+                     f"~{saved:.1f}s saved", extra={'job_id': job_id, 'prefetch_saved_s': round(saved, 2)})
+        return saved
+
+    def log_report(self, jobs):
+        if not self.enabled or not (self.hits or self.misses):
+            return
+        net = self.saved - self.overhead
+        logging.info(f"Prefetch: {self.hits} ready, {self.misses} not ready, {self.filtered} filtered without "
+                     f"Easy Apply; saved {self.saved:.1f}s for {self.overhead:.2f}s of driver calls "
+                     f"({net / max(jobs, 1):.2f}s net per job)")
@@ -0,0 +1,99 @@
+import logging
+import re
+
+from config import CANDIDATE_PROFILE, RANKING_CONFIG
+from lazy_imports import LazyImport
+
+np = LazyImport("numpy")
+TfidfVectorizer = LazyImport("sklearn.feature_extraction.text", "TfidfVectorizer")
+
+TOKEN_PATTERN = r"(?u)\b\w+\b"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+
+class JobRanker:
+    """Scores job postings against the candidate profile with one sparse TF-IDF product.
+
+    The vocabulary is the profile itself: every title, skill and exclusion term
+    (one or more words, e.g. "rest api"). Postings (title weighted double, plus
+    description) become rows of a TF-IDF matrix over those terms, with IDF fitted
+    on the batch, and the profile's titles and skills are two query rows in the
+    same space. Each text is first reduced to the profile terms it contains, by
+    one compiled regex per term length (overlapping matches, so every n-gram
+    of that length is seen), with phrases joined into single tokens
+    ("rest_api"); the vectorizer's built-in analyzer then only counts those.
+    One (n x V) @ (V x 2) product gives all similarities, and exclusion,
+    scoring and ordering are array operations.
+    """
+
+    def __init__(self, profile=None, min_score=None, weights=None):
+        self.profile = profile or CANDIDATE_PROFILE
+        self.min_score = RANKING_CONFIG['min_score'] if min_score is None else min_score
+        self.weights = weights or RANKING_CONFIG['weights']
+
+        self.terms = {key: [self._normalize(t) for t in self.profile.get(key, [])]
+                      for key in ('titles', 'skills', 'exclusions')}
+        terms = {t for terms in self.terms.values() for t in terms if t}
+        self.vocabulary = sorted(self._token(t) for t in terms)
+        words = sorted(t for t in terms if " " not in t)
+        self._word_re = re.compile(rf"\b(?:{'|'.join(map(re.escape, words))})\b") if words else None
+        by_length = {}
+        for term in terms - set(words):
+            by_length.setdefault(len(term.split()), []).append(r"\W+".join(map(re.escape, term.split())))
+        # Phrases are matched in a lookahead so that overlapping ones are all found
+        self._phrase_res = [re.compile(rf"\b(?=((?:{'|'.join(sorted(alternatives))})\b))")
+                            for n, alternatives in sorted(by_length.items())]
+
+    @staticmethod
+    def _normalize(term):
+        return " ".join(TOKEN_RE.findall(term.lower()))
+
+    @staticmethod
+    def _token(term):
+        """Vocabulary token of a normalized profile term: its words joined by '_'"""
+        return term.replace(" ", "_")
+
+    def _profile_terms(self, text):
+        """The profile terms occurring in text, as space-separated tokens; every other word is dropped"""
+        text = text.lower()
+        found = self._word_re.findall(text) if self._word_re else []
+        found += ["_".join(TOKEN_RE.findall(match)) for regex in self._phrase_res for match in regex.findall(text)]
+        return " ".join(found)
+
+    @staticmethod
+    def _document(record):
+        return f"{record.title} {record.title} {record.description or ''}"
+
+    def scores(self, documents):
+        """(scores, excluded) arrays for a list of posting texts"""
+        vectorizer = TfidfVectorizer(vocabulary=self.vocabulary, token_pattern=TOKEN_PATTERN, sublinear_tf=True)
+        postings = vectorizer.fit_transform([self._profile_terms(document) for document in documents])
+        queries = vectorizer.transform([self._profile_terms(" ".join(self.profile.get(key, [])))
+                                        for key in ('titles', 'skills')])
+        similarity = (postings @ queries.T).toarray()
+
+        score = self.weights['titles'] * similarity[:, 0] + self.weights['skills'] * similarity[:, 1]
+        excluded = self._exclusion_hits(vectorizer, postings)
+        return np.where(excluded, -1.0, score), excluded
+
+    def _exclusion_hits(self, vectorizer, postings):
+        """Postings containing any exclusion term, read off the matrix columns"""
+        columns = sorted({vectorizer.vocabulary_[self._token(t)] for t in self.terms['exclusions'] if t})
+        if not columns:
+            return np.zeros(postings.shape[0], dtype=bool)
+        return np.asarray(postings[:, columns].sum(axis=1)).ravel() > 0
+
+    def rank(self, records):
+        """Records at or above min_score, best first, as (record, score) pairs"""
+        if not records:
+            return []
+        try:
+            scores, excluded = self.scores([self._document(r) for r in records])
+        except ValueError as e:  # a profile without any terms
+            logging.warning(f"Could not rank jobs, keeping feed order: {str(e)}")
+            return [(record, 0.0) for record in records]
+        order = np.argsort(-scores, kind="stable")
+        keep = order[scores[order] >= self.min_score]
+        logging.info(f"Ranked {len(records)} jobs: {len(keep)} at or above {self.min_score}, "
+                     f"{int(excluded.sum())} excluded by profile, {len(records) - len(keep)} skipped")
+        return [(records[i], float(scores[i])) for i in keep]
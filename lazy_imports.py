@@ -0,0 +1,36 @@
+import importlib
+import sys
+import time
+
+from startup_profile import PROFILER
+
+
+class LazyImport:
+    """Stand-in for a module, or an attribute of one, that is imported on first use"""
+
+    def __init__(self, module, attr=None):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def resolve(self):
+        if self._target is None:
+            already_loaded = self._module in sys.modules
+            start = time.perf_counter()
+            target = importlib.import_module(self._module)
+            if not already_loaded:
+                PROFILER.record(f"lazy import {self._module}", time.perf_counter() - start)
+            if self._attr:
+                target = getattr(target, self._attr)
+            self._target = target
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        return f"<lazy {name}{'' if self._target is None else ' (loaded)'}>"
@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+from config import LEDGER_CONFIG
+
+STARTED = "started"
+SUBMITTED = "submitted"
+NO_EASY_APPLY = "no_easy_apply"
+FAILED = "failed"
+
+# Outcomes that never need another visit
+FINAL_OUTCOMES = (SUBMITTED, NO_EASY_APPLY)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    job_id      TEXT PRIMARY KEY,
+    run_id      TEXT,
+    title       TEXT,
+    company     TEXT,
+    location    TEXT,
+    outcome     TEXT NOT NULL,
+    failed_step INTEGER,
+    detail      TEXT,
+    answers     TEXT,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    first_seen  REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_outcome ON applications (outcome);
+CREATE INDEX IF NOT EXISTS idx_applications_run ON applications (run_id);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    keyword     TEXT,
+    location    TEXT,
+    max_jobs    INTEGER,
+    status      TEXT NOT NULL,
+    started_at  REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status, started_at);
+"""
+
+
+class ApplicationLedger:
+    """SQLite record of every job touched, so later runs skip finished work and can resume.
+
+    Reads happen on the caller's connection; writes are queued and committed in
+    batches by a background thread (WAL mode), so the browser loop never blocks on disk.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or LEDGER_CONFIG['path']
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = self._connect()
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="ledger-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # --- reads -------------------------------------------------------------
+
+    def already_processed(self, job_ids):
+        """Return the subset of job_ids that are finished or out of retry attempts"""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return set()
+        placeholders = ",".join("?" * len(job_ids))
+        rows = self._conn.execute(
+            f"SELECT job_id FROM applications WHERE job_id IN ({placeholders}) "
+            f"AND (outcome IN (?, ?) OR attempts >= ?)",
+            job_ids + list(FINAL_OUTCOMES) + [LEDGER_CONFIG['max_attempts']]
+        ).fetchall()
+        return {row['job_id'] for row in rows}
+
+    def last_unfinished_run(self):
+        """The most recent run that never reached finish_run (e.g. after a crash), or None"""
+        row = self._conn.execute(
+            "SELECT * FROM runs WHERE status = 'running' ORDER BY started_at DESC LIMIT 1"
+        ).fetchone()
+        return dict(row) if row else None
+
+    def finished_in_run(self, run_id):
+        """How many jobs a run has opened and taken to a final or failed outcome (what counts against max_jobs)"""
+        row = self._conn.execute(
+            "SELECT COUNT(*) AS n FROM applications WHERE run_id = ? AND outcome != ?", (run_id, STARTED)
+        ).fetchone()
+        return row['n']
+
+    def summary(self):
+        rows = self._conn.execute("SELECT outcome, COUNT(*) AS n FROM applications GROUP BY outcome").fetchall()
+        return {row['outcome']: row['n'] for row in rows}
+
+    # --- writes (queued) ---------------------------------------------------
+
+    def start_run(self, keyword, location, max_jobs):
+        run_id = uuid.uuid4().hex[:12]
+        self._conn.execute(
+            "INSERT INTO runs (run_id, keyword, location, max_jobs, status, started_at) VALUES (?, ?, ?, ?, 'running', ?)",
+            (run_id, keyword, location, max_jobs, time.time()))
+        self._conn.commit()
+        return run_id
+
+    def finish_run(self, run_id):
+        self._submit("UPDATE runs SET status = 'finished', finished_at = ? WHERE run_id = ?",
+                     (time.time(), run_id))
+        self.flush()
+
+    def record_start(self, record, run_id):
+        """Checkpoint: a job is about to be opened (counts as an attempt)"""
+        now = time.time()
+        self._submit(
+            "INSERT INTO applications (job_id, run_id, title, company, location, outcome, attempts, first_seen, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET run_id = excluded.run_id, outcome = excluded.outcome, "
+            "attempts = attempts + 1, updated_at = excluded.updated_at",
+            (record.job_id, run_id, record.title, record.company, record.location, STARTED, now, now))
+
+    def record_outcome(self, job_id, outcome, failed_step=None, detail="", answers=None):
+        self._submit(
+            "UPDATE applications SET outcome = ?, failed_step = ?, detail = ?, answers = ?, updated_at = ? "
+            "WHERE job_id = ?",
+            (outcome, failed_step, detail, json.dumps(answers or {}, default=str), time.time(), job_id))
+
+    def _submit(self, sql, params):
+        self._queue.put((sql, params))
+
+    def flush(self):
+        """Block until every queued write has been committed"""
+        self._queue.join()
+
+    def close(self):
+        self.flush()
+        self._queue.put(None)
+        self._writer.join(timeout=5)
+        self._conn.close()
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            # Drain whatever else is queued so it all lands in one transaction
+            while len(batch) < LEDGER_CONFIG['batch_size']:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._queue.put(None)
+                    self._queue.task_done()
+                    break
+                batch.append(nxt)
+            try:
+                with conn:
+                    for sql, params in batch:
+                        conn.execute(sql, params)
+            except sqlite3.Error as e:
+                logging.error(f"Ledger write failed: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
@@ -1,25 +1,96 @@
 import random
 import time
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.support import expected_conditions as EC
 import os
-import datetime
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from ai_processor import AIQuestionProcessor
+from config import (AI_CONFIG, FILL_CONFIG, INSTRUMENTATION_CONFIG, RANKING_CONFIG, RECORDER_CONFIG, SESSION_CONFIG,
+                    WAIT_CONFIG, WATCHDOG_CONFIG)
+from browser_watchdog import BrowserWatchdog
+from driver_metrics import CommandCounter, DriverInstrumentation
+from fill_cache import FillCache, answers_fingerprint, decode_decisions, encode_decisions, form_fingerprint
+from fill_plan import FillPlan, execute_fill_plan
+from job_feed import RESULTS_PER_PAGE, JobFeed
+from job_prefetch import JobPrefetcher
+from job_ranker import JobRanker
+from ledger import FAILED, NO_EASY_APPLY, SUBMITTED, ApplicationLedger
+from form_snapshot import PLACEHOLDERS, ref_selector, take_form_snapshot
+from lazy_imports import LazyImport
+from option_resolver import OptionResolver
+from page_backend import make_backend
+from page_load import PageLoader, configure_options
+from question_matcher import QuestionMatcher
+from screenshots import ScreenshotPipeline
+from session_store import SessionStore
+from startup_profile import PROFILER
+from step_recorder import StepRecorder
+from text_entry import TextEntry
+from structured_logging import setup_logging, span
+from waits import (MODAL_SELECTOR, WaitEngine, job_details_shown, results_populated, step_changed,
+                   step_signature)
+
+JOB_DETAILS_SELECTOR = ".jobs-search__job-details--container, .jobs-details"
+# Easy Apply and external "Apply" buttons of the job details top card
+APPLY_BUTTONS_SELECTOR = ".jobs-apply-button, .jobs-apply-button--top-card"
+OVERLAY_CLOSE_SELECTOR = ("button[aria-label='Dismiss'], button[data-test-modal-close-btn], "
+                          "button.artdeco-modal__dismiss")
+
+# The selenium.webdriver package pulls in every browser backend; defer it until first use
+webdriver = LazyImport("selenium.webdriver")
+By = LazyImport("selenium.webdriver.common.by", "By")
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+Select = LazyImport("selenium.webdriver.support.ui", "Select")
+ActionChains = LazyImport("selenium.webdriver.common.action_chains", "ActionChains")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
 
 
 class LinkedInAutomator:
-    def __init__(self, username, password, question_db):
-        self.driver = self._init_stealth_driver()  # Now this will work
+    def __init__(self, username, password, question_db, driver=None, driver_factory=None):
+        with PROFILER.phase("init.logging"):
+            self._setup_logging()
+        with PROFILER.phase("init.question_matcher"):
+            self.question_db = question_db
+            self.question_matcher = QuestionMatcher(question_db, FILL_CONFIG['match_cache_size'])
+            self.ai_processor = self._init_ai_processor(question_db)
+        self.instrumentation = None
+        with PROFILER.phase("init.driver"):
+            # An already-running driver (e.g. the offline benchmarks' fake) can be injected;
+            # driver_factory is what the watchdog uses to start a replacement browser
+            self._driver_factory = driver_factory or self._init_stealth_driver
+            self.driver = driver or self._driver_factory()
         self.username = username
         self.password = password
-        self._setup_logging()
-        self.question_db = question_db
+        self.sessions = SessionStore(username) if SESSION_CONFIG['enabled'] else None
+        self.session_source = None
+        self.backend = make_backend(self.driver)
+        self.pages = PageLoader(self.driver)
         self.wait = WebDriverWait(self.driver, 15)
-
+        self.command_counter = CommandCounter(self.driver)
+        self.waits = WaitEngine(self.driver)
+        self.option_resolver = OptionResolver(self.driver, self.waits)
+        self.text_entry = TextEntry(self.driver)
+        self.ledger = ApplicationLedger()
+        self.fill_cache = FillCache(answers=answers_fingerprint(
+            question_db, username, AI_CONFIG if self.ai_processor is not None else None))
+        self.screenshots = ScreenshotPipeline(self.driver)
+        self.recorder = StepRecorder() if RECORDER_CONFIG['enabled'] else None
+        self.prefetcher = JobPrefetcher(self.driver)
+        self.ranker = JobRanker() if RANKING_CONFIG['enabled'] else None
+        self.watchdog = BrowserWatchdog() if WATCHDOG_CONFIG['enabled'] else None
+        self.search = (None, None)
+        self.answers_used = {}
+        self.last_fill_decisions = None
+
+
+    def _init_ai_processor(self, question_db):
+        """Build the fuzzy matcher used when no question_db key appears in a label.
+
+        Index and spaCy load in the background while Chrome starts and we log in; if
+        either fails the processor disables itself and labels keep their defaults.
+        """
+        processor = AIQuestionProcessor(question_db)
+        processor.warm_up()
+        return processor
 
     def _init_stealth_driver(self):
         """Initialize a stealthy Chrome driver to avoid detection"""
@@ -31,8 +102,8 @@ class LinkedInAutomator:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
 
-        # If you want headless mode (optional)
-        # options.add_argument("--headless=new")
+        # Page-load strategy and headless mode per PAGE_LOAD_CONFIG
+        configure_options(options)
 
         driver = webdriver.Chrome(options=options)
 
@@ -44,18 +115,20 @@ class LinkedInAutomator:
             });
             """
         })
+
+        if INSTRUMENTATION_CONFIG['enabled']:
+            # Opt-in: time every WebDriver command and attribute it to a method and phase
+            if self.instrumentation:
+                self.instrumentation.attach(driver)  # replacement browser after a recycle
+            else:
+                self.instrumentation = DriverInstrumentation(driver)
         return driver
 
-    def _human_interaction(self, element, text=None):
-        """Simulate human-like interaction with elements"""
+    def _human_interaction(self, element):
+        """Click an element, then pause like a person would (text goes through self.text_entry)"""
         try:
-            element.click()  # focus the input field
+            element.click()
             time.sleep(random.uniform(0.2, 1.5))
-
-            if text:
-                for char in text:
-                    element.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.15))  # shorter delay for realism
             return True
         except Exception as e:
             logging.error(f"Human interaction failed: {str(e)}")
@@ -63,15 +136,34 @@ class LinkedInAutomator:
 
     # ... (keep existing _init_stealth_driver and _human_interaction methods) ...
 
+    def start_session(self):
+        """Reuse the saved session if LinkedIn still accepts it, otherwise log in and save the new one"""
+        PROFILER.mark_first_action()
+        if self.sessions:
+            with span("session.restore") as fields:
+                restored = self.sessions.restore(self.driver, self.pages)
+                fields.update(restored=restored)
+            if restored:
+                self.session_source = "restored session"
+                return True
+        self.session_source = "login"
+        if not self.login():
+            return False
+        if self.sessions:
+            self.sessions.save(self.driver)
+        return True
+
+    @span("login")
     def login(self):
         """Handle LinkedIn login and reliably uncheck 'Keep me logged in'"""
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(random.uniform(1, 2))  # Wait for page to load
+            PROFILER.mark_first_action()
+            self.pages.get("https://www.linkedin.com/login")
+            self.waits.until('page_load', EC.presence_of_element_located((By.ID, "password")))
 
             # Fill in credentials
-            self._human_interaction(self.driver.find_element(By.ID, "username"), self.username)
-            self._human_interaction(self.driver.find_element(By.ID, "password"), self.password)
+            self.text_entry.type(self.driver.find_element(By.ID, "username"), self.username, 'username')
+            self.text_entry.type(self.driver.find_element(By.ID, "password"), self.password, 'password')
 
             # 1. First try: Direct JavaScript approach (most reliable)
             try:
@@ -79,7 +171,6 @@ class LinkedInAutomator:
                     document.getElementById('rememberMeOptIn-checkbox').click();
                 """)
                 logging.info("Used JavaScript to uncheck checkbox")
-                time.sleep(0.5)
             except Exception as js_e:
                 logging.warning(f"JavaScript click failed, trying alternative methods: {str(js_e)}")
 
@@ -88,10 +179,8 @@ class LinkedInAutomator:
                     label = self.wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for='rememberMeOptIn-checkbox']")))
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", label)
-                    time.sleep(0.3)
                     label.click()
                     logging.info("Clicked the label to uncheck checkbox")
-                    time.sleep(0.5)
                 except Exception as label_e:
                     logging.warning(f"Label click failed: {str(label_e)}")
 
@@ -102,14 +191,13 @@ class LinkedInAutomator:
                         actions = ActionChains(self.driver)
                         actions.move_to_element(checkbox).click().perform()
                         logging.info("Used Actions to click checkbox")
-                        time.sleep(0.5)
                     except Exception as action_e:
                         logging.warning(f"All checkbox uncheck methods failed: {str(action_e)}")
 
                         # Click submit button
                         submit_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
                         self._human_interaction(submit_button)
-                        time.sleep(3)
+                        self.waits.until('login_submit', lambda d: "/login" not in d.current_url)
 
                         # Check for security challenge
                         if "security check" in self.driver.title.lower() or self.driver.find_elements(By.XPATH,
@@ -137,12 +225,19 @@ class LinkedInAutomator:
             self.take_screenshot("login_failed")
             return False
 
-    def search_jobs(self, keyword, location="Remote"):
-        """Search for jobs with filters"""
+    @span("search")
+    def search_jobs(self, keyword, location="Remote", start=0):
+        """Search for jobs with filters (start: index of the first result, to open a later page)"""
         try:
+            self.search = (keyword, location)
             url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}&f_AL=true"
-            self.driver.get(url)
-            time.sleep(3)
+            if start:
+                url += f"&start={start}"
+            self.pages.get(url)
+            self.waits.until('search', results_populated(), required=True)
+            if PROFILER.mark_first_search():
+                logging.info(f"Time to first search: {PROFILER.first_search:.1f}s "
+                             f"({self.session_source or 'no sign-in step'})")
             return True
         except Exception as e:
             logging.error(f"Job search failed: {str(e)}")
@@ -151,66 +246,342 @@ class LinkedInAutomator:
     def _close_overlays(self):
         """Close any popup overlays that might be blocking interactions"""
         try:
-            # Try to close signup prompts
-            close_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                                                      "button[aria-label='Dismiss'], " +
-                                                      "button[data-test-modal-close-btn], " +
-                                                      "button.artdeco-modal__dismiss")
-
-            for btn in close_buttons:
-                try:
-                    if btn.is_displayed():
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(0.5)
-                except:
-                    pass
+            # Try to close signup prompts (all at once on the CDP backend)
+            closed = self.backend.dismiss_overlays(OVERLAY_CLOSE_SELECTOR)
+            if closed:
+                self.waits.dom_quiet('overlay_close')
 
         except:
             pass
 
-    def process_applications(self, max_jobs=2):
-        """Process job applications with better handling of overlays"""
+    def process_applications(self, max_jobs=2, run_id=None):
+        """Apply to up to max_jobs new jobs streamed from the results pane (all pages).
+
+        Jobs the ledger already finished are skipped in bulk before any card is
+        opened. With ranking enabled each results page is scored against the
+        candidate profile and applied to best-first, down to the cutoff. The next
+        jobs' details are prefetched while the current one is filled so those
+        without Easy Apply are never opened. Pass the run_id of an interrupted run
+        to resume it.
+        """
         try:
             # First wait for jobs to load
-            jobs = self.wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".job-card-container--clickable"))
-            )[:max_jobs]
+            self.waits.until('search', results_populated(), required=True)
+
+            keyword, location = self.search
+            if run_id:
+                processed = self.ledger.finished_in_run(run_id)
+                logging.info(f"Resuming run {run_id}: {processed}/{max_jobs} jobs already done")
+            else:
+                run_id = self.ledger.start_run(keyword, location, max_jobs)
+                processed = 0
+
+            feed = JobFeed(self.driver, self.waits)
+            for batch in feed.pages() if self.ranker else feed.batches():
+                if processed >= max_jobs:
+                    break
+                done = self.ledger.already_processed(record.job_id for record in batch)
+                if done:
+                    logging.info(f"Skipping {len(done)} job(s) already in the ledger")
+
+                pending = [record for record in batch if record.job_id not in done]
+                if self.ranker and pending:
+                    if RANKING_CONFIG['fetch_descriptions']:
+                        # One in-page fetch for the whole page; take() below then hits for every job
+                        self.prefetcher.fetch_all(pending, self.waits)
+                    pending = [record for record, score in self.ranker.rank(pending)]
+                for i, record in enumerate(pending):
+                    if processed >= max_jobs:
+                        break
+                    # The next jobs download in the page while this one is being filled
+                    if self.prefetcher.enabled:
+                        self.prefetcher.schedule(pending[i + 1:i + 1 + self.prefetcher.lookahead])
+                    details = self.prefetcher.take(record.job_id)
+                    if details:
+                        record.description = details.description
+                        if details.easy_apply is False:
+                            # Never opened, so recorded outside the run: like ledger skips it counts
+                            # neither against max_jobs here nor in finished_in_run on --resume
+                            self.ledger.record_start(record, None)
+                            self.ledger.record_outcome(record.job_id, NO_EASY_APPLY, None,
+                                                       "no Easy Apply (prefetched)")
+                            self.prefetcher.skipped(record.job_id)
+                            continue
+                    if self._process_job(feed, record, run_id):
+                        processed += 1
+                        if processed < max_jobs and self.watchdog and self.watchdog.job_done(self.driver):
+                            self._recycle_driver(feed, [r.job_id for r in pending[i + 1:]])
+                if processed >= max_jobs:
+                    break  # before the feed scrolls or pages on
+
+            self.ledger.finish_run(run_id)
+            self.fill_cache.save()
+            self.fill_cache.log_report()
+            self.prefetcher.log_report(processed)
+            logging.info(f"Ledger totals: {self.ledger.summary()}")
+            self.waits.log_report()
+            self.pages.log_report()
+            if self.watchdog:
+                self.watchdog.log_report()
+            if self.recorder:
+                self.recorder.log_report()
+            self._report_instrumentation()
+            return True
 
-            for job in jobs:
-                try:
-                    # Scroll to the job card first
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", job)
-                    time.sleep(random.uniform(0.5, 1.5))
+        except Exception as e:
+            logging.error(f"Application processing failed: {str(e)}")
+            return False
 
-                    # Check for and close any overlays that might be blocking
-                    self._close_overlays()
+    def _recycle_driver(self, feed, pending_ids):
+        """Replace the browser between jobs: save the session, restart, restore it and reopen the results page.
 
-                    # Try to click with JavaScript as a fallback
-                    try:
-                        job.click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", job)
+        Raises if the new browser cannot be signed in or cannot reach the results page; the run then
+        ends unfinished and --resume picks it up.
+        """
+        with span("driver.recycle") as fields:
+            saved = self.sessions.save(self.driver) if self.sessions else False
+            self.backend.close()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logging.debug(f"Old browser did not quit cleanly: {str(e)}")
+
+            driver = self._driver_factory()
+            self.driver = driver
+            self.backend = make_backend(driver)
+            self.pages.attach(driver)
+            self.wait = WebDriverWait(driver, 15)
+            self.command_counter.attach(driver)
+            self.waits.driver = driver
+            self.option_resolver = OptionResolver(driver, self.waits)
+            self.text_entry.driver = driver
+            self.screenshots.driver = driver
+            self.prefetcher.reattach(driver)
+
+            restored = saved and self.sessions.restore(driver, self.pages)
+            if not restored and not self.login():
+                raise RuntimeError("could not sign in the replacement browser")
+            keyword, location = self.search
+            if not self.search_jobs(keyword, location, start=(feed.page - 1) * RESULTS_PER_PAGE):
+                raise RuntimeError(f"could not reopen results page {feed.page} after the browser restart")
+            feed.reattach(driver, pending_ids)
+            fields.update(restored=restored, page=feed.page)
+        logging.info(f"Browser recycled ({'session restored' if restored else 'logged in again'}), "
+                     f"resuming on results page {feed.page}")
+
+    def _process_job(self, feed, record, run_id):
+        """Open one job card and apply; returns False if the card could not be opened"""
+        started = time.perf_counter()
+        try:
+            # Re-resolve the card right before clicking; earlier elements may be stale
+            job = feed.resolve_card(record.job_id)
+            if job is None:
+                logging.warning(f"Job card {record.job_id} no longer rendered - skipping")
+                return False
+            logging.info(f"Processing job {record.job_id}: {record.title} at {record.company}")
+            if self.instrumentation:
+                self.instrumentation.begin_job()
+            self.ledger.record_start(record, run_id)
+
+            # Check for and close any overlays that might be blocking
+            self._close_overlays()
+
+            with span("job.open", job_id=record.job_id):
+                # Try to click with JavaScript as a fallback
+                try:
+                    job.click()
+                except:
+                    self.driver.execute_script("arguments[0].click();", job)
 
-                    time.sleep(random.uniform(1, 2))
+                # The previous job's pane (and its apply button) stays rendered until this one replaces it
+                if not self.waits.until('job_details', job_details_shown(record.job_id, JOB_DETAILS_SELECTOR)):
+                    raise RuntimeError(f"details pane never showed job {record.job_id}")
+                self.waits.dom_quiet('job_details', JOB_DETAILS_SELECTOR)
 
-                    # Apply to the job
-                    self._apply_to_job()
+            # Apply to the job
+            with span("apply.job", job_id=record.job_id) as fields:
+                outcome, step, detail = self._apply_to_job(record.job_id)
+                fields.update(outcome=outcome, steps=step)
+            self.ledger.record_outcome(record.job_id, outcome, step if outcome == FAILED else None,
+                                       detail, self.answers_used)
 
-                    # Wait a bit before next job
-                    time.sleep(random.uniform(2, 4))
+            if self.instrumentation:
+                self.instrumentation.log_report(self.instrumentation.job_report(), f"job {record.job_id}")
 
-                except Exception as e:
-                    logging.warning(f"Failed to process job: {str(e)}")
-                    continue
+            # Human-like pause before the next job (pacing, not page loading)
+            time.sleep(random.uniform(*WAIT_CONFIG['between_jobs']))
+            if outcome == NO_EASY_APPLY:
+                self.prefetcher.observe_visit(time.perf_counter() - started)
 
-            return True
+        except Exception as e:
+            logging.warning(f"Failed to process job {record.job_id}: {str(e)}")
+            self.ledger.record_outcome(record.job_id, FAILED, None, str(e), self.answers_used)
+        return True
 
+    def _fill_all_fields(self):
+        """Fill the current Easy Apply step from a single-call form snapshot"""
+        mode = "snapshot" if FILL_CONFIG['use_snapshot'] else "per-element"
+        self.last_fill_decisions = None
+        with self.command_counter.measure() as step:
+            if FILL_CONFIG['use_snapshot']:
+                self._fill_from_snapshot()
+            else:
+                self._fill_all_fields_per_element()
+        logging.info(f"Form step filled using {step.commands} driver commands ({mode})")
+
+    def _fill_from_snapshot(self):
+        """Decide every answer in Python against one snapshot, then apply them"""
+        try:
+            fields = take_form_snapshot(self.driver)
         except Exception as e:
-            logging.error(f"Application processing failed: {str(e)}")
-            return False
+            logging.warning(f"Form snapshot failed, using per-element path: {str(e)}")
+            self._fill_all_fields_per_element()
+            return
+
+        # Employers reuse question sets: a known form structure skips matching and NLP
+        fingerprint = form_fingerprint(fields)
+        cached = self.fill_cache.get(fingerprint)
+        decisions = decode_decisions(fields, cached) if cached else {}
+
+        # Fields the cache has never seen go through matching (and one batched NLP lookup)
+        pending = [field for field in fields if field.ref not in decisions]
+        fuzzy_answers = self._fuzzy_answers(pending)
+        ai_down = self.ai_processor is not None and self.ai_processor.disabled
+        for field in pending:
+            action = self._decide_field(field, fuzzy_answers.get(field.ref))
+            if action or (not field.has_value and field.enabled and not ai_down):
+                # None: an empty field with no answer, cached so hits skip it too (unless
+                # the AI was down, when it may have an answer once the model loads)
+                decisions[field.ref] = action
+
+        plan = FillPlan()
+        for field in fields:
+            action = decisions.get(field.ref)
+            if action and (field.kind == 'country_code' or not field.has_value):
+                plan.add(field, *action)
+
+        # One round trip for everything scriptable; failures and text the entry policy
+        # wants typed (anything but 'native') take the Selenium path
+        failed = execute_fill_plan(self.driver, plan, self._scriptable)
+        errors = 0
+        for step in failed:
+            try:
+                self._apply_field_action(step.field, step.action, step.value)
+            except Exception as e:
+                errors += 1
+                logging.debug(f"Could not fill {step.field}: {str(e)}")
+        if not errors:
+            self.fill_cache.put(fingerprint, encode_decisions(fields, decisions))
+        if plan:
+            logging.info(f"Fill plan applied {len(plan) - len(failed)}/{len(plan)} fields in one call")
+        self.last_fill_decisions = encode_decisions(fields, {step.field.ref: (step.action, step.value)
+                                                             for step in plan})
+        for step in plan:
+            self.answers_used[step.field.label or step.locator] = step.value
+
+    def _scriptable(self, step):
+        return step.action != 'type' or self.text_entry.strategy_for(step.field.input_type) == 'native'
+
+    def _match_answer(self, label_text):
+        """Return the answer of the most specific question_db key found in the label"""
+        return self.question_matcher.match(label_text)
+
+    def _fuzzy_answers(self, fields):
+        """Resolve every label the exact matcher misses with one batched AI lookup"""
+        if self.ai_processor is None or self.ai_processor.disabled:
+            return {}
+        pending = [f for f in fields
+                   if f.kind in ('text', 'radio', 'select', 'combobox') and f.label
+                   and not f.has_value and self._match_answer(f.label) is None]
+        if not pending:
+            return {}
+        answers = self.ai_processor.find_best_answers([f.label for f in pending], default=None)
+        return {f.ref: ans for f, ans in zip(pending, answers) if ans is not None}
+
+    def _decide_field(self, field, fallback=None):
+        """Return (action, value) for a snapshot field, or None to leave it alone"""
+        if field.kind == 'country_code':
+            return ('select_value', "US")  # Default to US
+
+        if field.kind == 'checkbox':
+            value = self._match_answer(field.label)
+            if value is None:
+                value = True
+            if bool(value) and not field.selected and field.enabled:
+                return ('click', None)
+            return None
+
+        if field.has_value:
+            return None
 
+        value = self._match_answer(field.label)
+        if value is None:
+            value = fallback
+
+        if field.kind == 'text':
+            if value is None:
+                if "email" in field.label:
+                    value = self.username  # Use the login email
+                elif "phone" in field.label or "mobile" in field.label:
+                    value = "1234567890"  # Default phone number
+                elif "year" in field.label or "experience" in field.label:
+                    value = "3"  # Default experience
+                else:
+                    return None
+            return ('type', str(value))
+
+        if field.kind == 'radio':
+            # Default if no match (for sponsorship questions)
+            if value is None and ("sponsorship" in field.label or "visa" in field.label):
+                value = "No"
+            if value is None:
+                return None
+            for option in field.options:
+                if str(value).lower() in (option['label'] or "").lower():
+                    return ('click_option', option['ref'])
+            return None
 
-    def _fill_all_fields(self):
+        if field.kind == 'select':
+            options = [o for o in (opt.strip() for opt in field.options) if o]
+            if value and value in options:
+                return ('select', value)
+            if options:
+                # Skip the first option if it's a placeholder
+                if options[0].lower() in PLACEHOLDERS and len(options) > 1:
+                    return ('select', options[1])
+                return ('select', options[0])
+            return None
+
+        if field.kind == 'combobox':
+            return ('choose', value)
+
+        return None
+
+    def _apply_field_action(self, field, action, value):
+        """Apply one decided action to the live element behind a snapshot field"""
+        if action == 'click_option':
+            radio = self.driver.find_element(By.CSS_SELECTOR, ref_selector(value))
+            radio.click()
+            return
+
+        element = self.driver.find_element(By.CSS_SELECTOR, field.selector)
+        if action == 'type':
+            self.text_entry.type(element, value, field.input_type)
+        elif action == 'click':
+            element.click()
+        elif action == 'select':
+            Select(element).select_by_visible_text(value)
+        elif action == 'select_value':
+            Select(element).select_by_value(value)
+        elif action == 'choose':
+            self._choose_custom_option(element, value)
+
+    def _choose_custom_option(self, dropdown, value):
+        """Open a custom LinkedIn dropdown and pick the best-matching option (or the first one)"""
+        if self.option_resolver.choose(dropdown, value) is None:
+            raise NoSuchElementException(f"No dropdown option for {value!r}")
+
+    def _fill_all_fields_per_element(self):
         """Fill all fields in Easy Apply forms: text, dropdown, checkbox (native + custom), skipping prefilled ones."""
         try:
             # --- TEXT / NUMBER / EMAIL ---
@@ -225,11 +596,7 @@ class LinkedInAutomator:
                         continue
 
                     label_text = (field.get_attribute("aria-label") or "").lower()
-                    value = None
-                    for key, ans in self.question_db.items():
-                        if key.lower() in label_text:
-                            value = ans
-                            break
+                    value = self._match_answer(label_text)
 
                     if value is None:
                         if "email" in label_text:
@@ -241,8 +608,7 @@ class LinkedInAutomator:
                         else:
                             continue
 
-                    field.clear()
-                    field.send_keys(str(value))
+                    self.text_entry.type(field, value, field.get_attribute("type"))
                     time.sleep(0.2)
                 except:
                     pass
@@ -253,11 +619,7 @@ class LinkedInAutomator:
                 try:
                     label_text = (cb.get_attribute("aria-label") or "").lower()
 
-                    value = None
-                    for key, ans in self.question_db.items():
-                        if key.lower() in label_text:
-                            value = ans
-                            break
+                    value = self._match_answer(label_text)
 
                     if value is None:
                         value = True
@@ -292,11 +654,7 @@ class LinkedInAutomator:
                         continue
 
                     # Match from DB
-                    value = None
-                    for key, ans in self.question_db.items():
-                        if key.lower() in question_text:
-                            value = ans
-                            break
+                    value = self._match_answer(question_text)
 
                     # Default if no match (for sponsorship questions)
                     if value is None and ("sponsorship" in question_text or "visa" in question_text):
@@ -334,11 +692,7 @@ class LinkedInAutomator:
                     label_text = (sel.get_attribute("aria-label") or "").lower()
                     options = [o.text.strip() for o in sel.find_elements(By.TAG_NAME, "option") if o.text.strip()]
 
-                    value = None
-                    for key, ans in self.question_db.items():
-                        if key.lower() in label_text:
-                            value = ans
-                            break
+                    value = self._match_answer(label_text)
 
                     if value and value in options:
                         Select(sel).select_by_visible_text(value)
@@ -367,34 +721,9 @@ class LinkedInAutomator:
                         continue
 
                     label_text = (dropdown.get_attribute("aria-label") or "").lower()
-                    value = None
-                    for key, ans in self.question_db.items():
-                        if key.lower() in label_text:
-                            value = ans
-                            break
-
-                    dropdown.click()
-                    time.sleep(0.3)
+                    value = self._match_answer(label_text)
 
-                    # Handle different dropdown styles
-                    try:
-                        if value:
-                            # Try to find exact match
-                            option = self.driver.find_element(By.XPATH, f"//span[contains(text(), '{value}')]")
-                        else:
-                            # Default to first option
-                            option = self.driver.find_element(By.XPATH,
-                                                              "//div[@role='option'][1] | //li[@role='option'][1] | //div[contains(@class, 'basic-typeahead__option')][1]")
-                        option.click()
-                    except:
-                        # If clicking didn't work, try sending keys
-                        if value:
-                            input_field = self.driver.find_element(By.CSS_SELECTOR,
-                                                                   "input[type='text'], input[type='search']")
-                            input_field.send_keys(value)
-                            time.sleep(0.5)
-                            first_option = self.driver.find_element(By.XPATH, "//div[@role='option'][1]")
-                            first_option.click()
+                    self._choose_custom_option(dropdown, value)
 
                     time.sleep(0.2)
                 except:
@@ -413,95 +742,118 @@ class LinkedInAutomator:
         except Exception as e:
             logging.error(f"Error filling fields: {str(e)}")
 
-    def _apply_to_job(self):
+    def _only_external_apply(self):
+        """True if the job details rendered apply buttons and none of them is Easy Apply"""
+        try:
+            texts = [b.text.lower() for b in self.driver.find_elements(By.CSS_SELECTOR, APPLY_BUTTONS_SELECTOR)]
+        except Exception:
+            return False
+        return bool(texts) and not any("easy apply" in text for text in texts)
+
+    def _apply_to_job(self, job_id=None):
+        """Walk the Easy Apply modal; returns (outcome, last step number, detail)"""
+        self.answers_used = {}
+        outcome, step, detail = FAILED, 0, ""
         try:
-            apply_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".jobs-apply-button"))
+            apply_button = self.waits.until(
+                'apply_button', EC.element_to_be_clickable((By.CSS_SELECTOR, ".jobs-apply-button")), required=True
             )
             self.driver.execute_script("arguments[0].scrollIntoView(true);", apply_button)
             apply_button.click()
-            time.sleep(1)
-
-            while True:
-                self._fill_all_fields()  # << Fill whatever fields are on this step
-
-                # Click Next, Review, or Submit
-                for btn_text in ["Next", "Review", "Submit application"]:
-                    try:
-                        btn = self.driver.find_element(By.XPATH, f"//button[contains(., '{btn_text}')]")
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-                        btn.click()
-                        time.sleep(1)
-                        if btn_text == "Submit application":
-                            logging.info("Application submitted successfully!")
-                            raise StopIteration  # Break out of both loops
-                        break
-                    except:
-                        continue
-                else:
-                    break  # No matching button found → exit
-
-        except StopIteration:
-            pass
-        except NoSuchElementException:
-            logging.warning("Easy Apply button not found - skipping job")
+            self.waits.until('modal_open', EC.presence_of_element_located((By.CSS_SELECTOR, MODAL_SELECTOR)))
+
+            while step < FILL_CONFIG['max_steps']:
+                step += 1
+                with span("apply.step", job_id=job_id, step=step):
+                    recorded = self.recorder.capture(self.driver) if self.recorder else None
+                    self._fill_all_fields()  # << Fill whatever fields are on this step
+                    if recorded:
+                        self.recorder.record(recorded, job_id, step,
+                                             "snapshot" if FILL_CONFIG['use_snapshot'] else "per-element",
+                                             self.last_fill_decisions)
+
+                    # Click Next, Review, or Submit
+                    for btn_text in ["Next", "Review", "Submit application"]:
+                        buttons = self.driver.find_elements(By.XPATH, f"//button[contains(., '{btn_text}')]")
+                        if buttons:
+                            break
+                    else:
+                        detail = "no Next/Review/Submit button"
+                        break  # No matching button found → exit
+
+                    btn = buttons[0]
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
+                    before = step_signature(self.driver)
+
+                with span("apply.submit" if btn_text == "Submit application" else "apply.next",
+                          job_id=job_id, step=step):
+                    btn.click()
+                    advanced = self.waits.until('submit' if btn_text == "Submit application" else 'step_change',
+                                                step_changed(before))
+                if btn_text == "Submit application" and advanced:
+                    logging.info("Application submitted successfully!")
+                    outcome = SUBMITTED
+                    break
+                if not advanced:
+                    detail = f"'{btn_text}' did not advance the form"
+                    break
+            else:
+                detail = f"gave up after {step} steps"
+
+        except TimeoutException:
+            # Only the apply button wait is required; a slow page is retried on a later run
+            if self._only_external_apply():
+                logging.warning("Job has no Easy Apply button - skipping job")
+                outcome, detail = NO_EASY_APPLY, "no Easy Apply button"
+            else:
+                detail = f"Easy Apply button not clickable after {self.waits.timeout_for('apply_button')}s"
         except Exception as e:
             logging.error(f"Error applying to job: {str(e)}")
+            detail = str(e)
+
+        if outcome == FAILED:
+            logging.warning(f"Application failed at step {step}: {detail}")
+            self.take_screenshot(f"apply_failed_step{step}", MODAL_SELECTOR)
 
         # Always close modal after submission
         try:
-            close_btn = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Dismiss']"))
+            close_btn = self.waits.until(
+                'modal_close', EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Dismiss']"))
             )
-            close_btn.click()
-            time.sleep(1)
+            if close_btn:
+                close_btn.click()
+                self.waits.until('modal_close', EC.invisibility_of_element_located((By.CSS_SELECTOR, MODAL_SELECTOR)))
         except:
             pass
 
-    def take_screenshot(self, filename):
-        """Capture screenshots for debugging with better error handling and organization"""
+        return outcome, step, detail
+
+    def take_screenshot(self, filename, selector=None):
+        """Queue a full-page (or element-clipped) screenshot; encoding and writing happen off-thread"""
         try:
-            # Create screenshots directory if it doesn't exist
-            os.makedirs("screenshots", exist_ok=True)
-
-            # Add timestamp to filename
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{filename}_{timestamp}.png"
-            path = os.path.join("screenshots", filename)
-
-            # Take full page screenshot (requires Chrome 80+)
-            original_size = self.driver.get_window_size()
-            required_width = self.driver.execute_script('return document.body.parentNode.scrollWidth')
-            required_height = self.driver.execute_script('return document.body.parentNode.scrollHeight')
-            self.driver.set_window_size(required_width, required_height)
-            self.driver.save_screenshot(path)  # Save screenshot
-            self.driver.set_window_size(original_size['width'], original_size['height'])
-
-            logging.info(f"Screenshot saved: {path}")
-            return path
+            return self.screenshots.capture(filename, selector)
         except Exception as e:
             logging.error(f"Failed to take screenshot: {str(e)}")
             return None
 
+    def _report_instrumentation(self):
+        """Log the whole-run driver profile and export it as collapsed stacks"""
+        if not self.instrumentation:
+            return
+        self.instrumentation.log_report(self.instrumentation.run_report(), "run")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(INSTRUMENTATION_CONFIG['export_dir'], f"driver_profile_{timestamp}.folded")
+        logging.info(f"Driver profile exported: {self.instrumentation.export_folded(path)}")
+
+    def close(self):
+        """Flush background writers (screenshots, ledger), close the page backend and unhook the profiler"""
+        self.screenshots.close()
+        self.ledger.close()
+        self.backend.close()
+        if self.instrumentation:
+            self.instrumentation.uninstall()
+
 
     def _setup_logging(self):
-        """Configure logging to both console and file"""
-        # Create logs directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
-
-        # Set up log filename with timestamp
-        timestamp = datetime.datetime.now().strftime("%Y%m%d")
-        log_file = os.path.join("logs", f"linkedin_bot_{timestamp}.log")
-
-        # Clear previous handlers if any
-        logging.getLogger().handlers = []
-
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
\ No newline at end of file
+        """Configure non-blocking JSON-lines logging to file plus console"""
+        setup_logging("logs")
@@ -1,26 +1,71 @@
-from linkedin_api import LinkedInAutomator
-from config import LINKEDIN_CREDS, QUESTION_DATABASE
+import time
+from startup_profile import PROFILER
+
+with PROFILER.phase("import linkedin_api"):
+    from linkedin_api import LinkedInAutomator
+with PROFILER.phase("import config"):
+    from config import LINKEDIN_CREDS, QUESTION_DATABASE
+import argparse
 import logging
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="LinkedIn Easy Apply automator")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="sign in and search once, then print an import/initialization time breakdown")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the last run that did not finish, skipping jobs it already handled")
+    return parser.parse_args()
+
+
+def profile_startup(bot):
+    """Run up to the first search and print where the startup time went"""
+    with PROFILER.phase("start_session"):
+        bot.start_session()
+    with PROFILER.phase("search_jobs"):
+        bot.search_jobs("Python Developer", location="Remote")
+
+    # Include the background NLP warm-up in the breakdown
+    if bot.ai_processor and bot.ai_processor.warmup_thread:
+        start = time.perf_counter()
+        bot.ai_processor.warmup_thread.join()
+        PROFILER.record("wait for ai warm-up after search", time.perf_counter() - start)
+
+    print(PROFILER.report())
+
+
 def main():
+    args = parse_args()
+
     # Initialize
-    bot = LinkedInAutomator(
-        username=LINKEDIN_CREDS['email'],
-        password=LINKEDIN_CREDS['password'],
-        question_db=QUESTION_DATABASE
-    )
+    with PROFILER.phase("LinkedInAutomator()"):
+        bot = LinkedInAutomator(
+            username=LINKEDIN_CREDS['email'],
+            password=LINKEDIN_CREDS['password'],
+            question_db=QUESTION_DATABASE
+        )
 
     try:
+        if args.profile_startup:
+            profile_startup(bot)
+            return
+
+        keyword, location, max_jobs, run_id = "Python Developer", "Remote", 2, None
+        run = bot.ledger.last_unfinished_run() if args.resume else None
+        if run:
+            keyword, location, max_jobs, run_id = run['keyword'], run['location'], run['max_jobs'], run['run_id']
+
         # Execute workflow
-        bot.login()
-        bot.search_jobs("Python Developer", location="Remote")
-        bot.process_applications(max_jobs=2)
+        bot.start_session()
+        bot.search_jobs(keyword, location=location)
+        bot.process_applications(max_jobs=max_jobs, run_id=run_id)
 
     except Exception as e:
         logging.error(f"Critical failure: {str(e)}")
         bot.take_screenshot("critical_error.png")
+    finally:
+        bot.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
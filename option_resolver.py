@@ -0,0 +1,152 @@
+import difflib
+import json
+import logging
+import re
+
+from config import FILL_CONFIG
+from form_snapshot import PLACEHOLDERS
+
+# Finds the listbox a combobox controls (aria-controls / aria-owns on it or on its
+# inner input, else the nearest listbox in its container). Without an index it
+# returns the text of every rendered option in one call, or null while the
+# listbox is missing or hidden; with one it returns that option's element, but
+# only if its text still matches (the list may have re-rendered in between).
+LISTBOX_OPTIONS_JS = r"""
+// @jaa:listbox-options
+const combobox = arguments[0], index = arguments[1], expected = arguments[2];
+
+function byIds(el) {
+    const ids = ((el.getAttribute('aria-controls') || '') + ' ' + (el.getAttribute('aria-owns') || '')).split(/\s+/);
+    for (const id of ids) {
+        const box = id ? document.getElementById(id) : null;
+        if (box) return box;
+    }
+    return null;
+}
+
+function listboxOf(el) {
+    const inner = el.querySelector('[aria-controls], [aria-owns]');
+    const container = el.closest('.artdeco-dropdown, .basic-typeahead, [data-test-form-element]') || el.parentElement;
+    return byIds(el) || (inner && byIds(inner))
+        || (container && container.querySelector("[role='listbox'], .basic-typeahead__triggered-content"));
+}
+
+function text(el) {
+    return (el.innerText || el.textContent || '').trim();
+}
+
+const listbox = listboxOf(combobox);
+if (!listbox || listbox.hidden || !listbox.getClientRects().length) return null;
+const options = Array.from(listbox.querySelectorAll("[role='option'], .basic-typeahead__option"))
+    .filter(o => o.getAttribute('aria-disabled') !== 'true');
+if (index === null || index === undefined) return JSON.stringify(options.map(text));
+const option = options[index];
+if (!option || text(option) !== expected) return null;
+option.scrollIntoView({block: 'nearest'});
+return option;
+"""
+
+# The text box of a typeahead combobox: the combobox itself, an input inside it
+# or the one in its container; never a page-wide input lookup.
+TYPEAHEAD_INPUT_JS = r"""
+// @jaa:typeahead-input
+const combobox = arguments[0];
+const selector = "input[type='text'], input[type='search']";
+if (combobox.matches(selector)) return combobox;
+const container = combobox.closest('.artdeco-dropdown, .basic-typeahead, [data-test-form-element]')
+    || combobox.parentElement;
+return combobox.querySelector(selector) || (container ? container.querySelector(selector) : null);
+"""
+
+
+def normalize_option(text):
+    """Casefolded words only, so "Bachelor’s degree" and "bachelor's Degree " compare equal"""
+    return " ".join(re.sub(r"[^\w+#]+", " ", str(text).casefold()).split())
+
+
+def best_option(value, options, threshold=None):
+    """Index of the option that best matches value, the first real option when value is empty, or None.
+
+    Exact (normalized) match wins, then the shortest option containing the value
+    as whole words (or contained in it), then the closest difflib match above
+    threshold. Placeholders such as "Select an option" are never picked.
+    """
+    threshold = FILL_CONFIG['option_match_threshold'] if threshold is None else threshold
+    candidates = {}
+    for i, option in enumerate(options):
+        normalized = normalize_option(option)
+        if normalized and normalized not in PLACEHOLDERS:
+            candidates.setdefault(normalized, i)
+    if not candidates:
+        return None
+
+    target = normalize_option(value) if value is not None else ""
+    if not target:
+        return min(candidates.values())
+    if target in candidates:
+        return candidates[target]
+
+    contained = [(len(option), i) for option, i in candidates.items()
+                 if f" {target} " in f" {option} " or f" {option} " in f" {target} "]
+    if contained:
+        return min(contained)[1]
+
+    close = difflib.get_close_matches(target, list(candidates), n=1, cutoff=threshold)
+    return candidates[close[0]] if close else None
+
+
+class OptionResolver:
+    """Picks options of custom dropdowns from the listbox the dropdown controls, never from the whole page"""
+
+    def __init__(self, driver, waits):
+        self.driver = driver
+        self.waits = waits
+
+    def options(self, combobox):
+        """Texts of the combobox's rendered options (one driver call), or None while none are shown"""
+        raw = self.driver.execute_script(LISTBOX_OPTIONS_JS, combobox, None, None)
+        return json.loads(raw) if raw else None
+
+    def _rendered(self, combobox, previous=None):
+        """Condition: the listbox shows options (different from previous, when given)"""
+        def condition(driver):
+            options = self.options(combobox)
+            return options if options and options != previous else False
+        return condition
+
+    def choose(self, combobox, value):
+        """Open combobox and click the option best matching value; returns the chosen text or None"""
+        combobox.click()
+        options = self.waits.until('options', self._rendered(combobox)) or []
+        index = best_option(value, options)
+
+        if index is None and value:
+            # Typeahead: type the answer and take the best (or first) suggestion
+            options = self._search(combobox, str(value), options)
+            index = best_option(value, options)
+            if index is None:
+                index = best_option(None, options)
+
+        if index is None:
+            logging.debug(f"No option matching {value!r} among {len(options)} option(s)")
+            return None
+        return self._click(combobox, index, options[index])
+
+    def _search(self, combobox, value, previous):
+        field = self.driver.execute_script(TYPEAHEAD_INPUT_JS, combobox)
+        if field is None:
+            return previous
+        field.clear()
+        field.send_keys(value)
+        return self.waits.until('options', self._rendered(combobox, previous or None)) or previous
+
+    def _click(self, combobox, index, text):
+        option = self.driver.execute_script(LISTBOX_OPTIONS_JS, combobox, index, text)
+        if option is None:
+            logging.debug(f"Option {text!r} was re-rendered before it could be clicked")
+            return None
+        try:
+            option.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", option)
+        return text
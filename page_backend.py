@@ -0,0 +1,197 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import urllib.request
+
+from config import DRIVER_CONFIG
+from lazy_imports import LazyImport
+
+By = LazyImport("selenium.webdriver.common.by", "By")
+ws_connect = LazyImport("websockets.asyncio.client", "connect")
+
+OBJECT_GROUP = "jaa"
+
+# Per-element functions for Runtime.callFunctionOn; the tags let the stand-in CDP
+# server in benchmarks/ recognise them.
+DISMISS_IF_VISIBLE_FN = r"""function() {
+// @jaa:dismiss-if-visible
+if (!(this.offsetWidth || this.offsetHeight || this.getClientRects().length)) return false;
+this.click();
+return true;
+}"""
+
+
+class SeleniumBackend:
+    """Default backend: one blocking WebDriver round trip per element operation"""
+
+    name = "selenium"
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def dismiss_overlays(self, selector):
+        closed = 0
+        for btn in self.driver.find_elements(By.CSS_SELECTOR, selector):
+            try:
+                if btn.is_displayed():
+                    self.driver.execute_script("arguments[0].click();", btn)
+                    closed += 1
+            except Exception:
+                pass
+        return closed
+
+    def close(self):
+        pass
+
+
+class CdpError(Exception):
+    pass
+
+
+class CdpSession:
+    """One persistent DevTools websocket driven by an asyncio loop on a background thread.
+
+    Commands are written as soon as they are issued and matched to responses by id,
+    so independent commands can be in flight together: ``await asyncio.gather(...)``
+    inside the loop, or ``pipeline([...])`` from synchronous code.
+    """
+
+    def __init__(self, ws_url, timeout=None):
+        self.ws_url = ws_url
+        self.timeout = timeout or DRIVER_CONFIG['cdp_timeout']
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._ws = None
+        self._reader = None
+        self._background = set()
+        self.round_trips = 0
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="cdp-session", daemon=True)
+        self._thread.start()
+        self.run(self._connect())
+
+    def run(self, coro):
+        """Run a coroutine on the session loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(self.timeout)
+
+    async def _connect(self):
+        self._ws = await ws_connect(self.ws_url, max_size=None)
+        self._reader = asyncio.ensure_future(self._read_loop())
+
+    async def _read_loop(self):
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                future = self._pending.pop(message.get('id'), None)
+                if future is None or future.done():
+                    continue  # events and late replies
+                if 'error' in message:
+                    future.set_exception(CdpError(message['error'].get('message', str(message['error']))))
+                else:
+                    future.set_result(message.get('result', {}))
+        except Exception as e:
+            logging.debug(f"CDP connection closed: {str(e)}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("CDP connection closed"))
+            self._pending.clear()
+
+    async def send(self, method, params=None):
+        """Issue one command; await the returned coroutine for its result"""
+        command_id = next(self._ids)
+        future = self.loop.create_future()
+        self._pending[command_id] = future
+        self.round_trips += 1
+        await self._ws.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+        return await future
+
+    def send_nowait(self, method, params=None):
+        """Issue a command whose reply nobody waits for (e.g. releasing handles); call on the loop"""
+        task = asyncio.ensure_future(self.send(method, params))
+        self._background.add(task)
+        task.add_done_callback(lambda t: (self._background.discard(t), t.cancelled() or t.exception()))
+
+    def call(self, method, params=None):
+        return self.run(self.send(method, params))
+
+    def pipeline(self, commands):
+        """Send [(method, params), ...] back to back and return their results in order"""
+        async def gather():
+            return await asyncio.gather(*(self.send(method, params) for method, params in commands))
+        return self.run(gather())
+
+    def close(self):
+        async def shutdown():
+            await asyncio.gather(*self._background, return_exceptions=True)
+            if self._ws is not None:
+                await self._ws.close()
+            if self._reader is not None:
+                await self._reader
+        try:
+            self.run(shutdown())
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+class CdpBackend:
+    """DevTools-protocol backend: element operations are pipelined over one websocket"""
+
+    name = "cdp"
+
+    def __init__(self, ws_url):
+        self.session = CdpSession(ws_url)
+
+    @classmethod
+    def from_driver(cls, driver):
+        """Attach to the tab this WebDriver session controls (chromedriver window handles are target ids)"""
+        address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        handle = driver.current_window_handle
+        with urllib.request.urlopen(f"http://{address}/json/list", timeout=5) as response:
+            targets = json.load(response)
+        page = next((t for t in targets if t.get('type') == 'page' and t.get('id', '').upper() == handle.upper()), None)
+        if page is None:
+            raise CdpError(f"No DevTools target for window {handle}")
+        return cls(page['webSocketDebuggerUrl'])
+
+    async def _query(self, selector):
+        """objectIds of every element matching selector (three pipelined stages, not one per element)"""
+        root = await self.session.send("DOM.getDocument", {'depth': 0})
+        found = await self.session.send("DOM.querySelectorAll",
+                                        {'nodeId': root['root']['nodeId'], 'selector': selector})
+        resolved = await asyncio.gather(*(self.session.send("DOM.resolveNode",
+                                                            {'nodeId': node_id, 'objectGroup': OBJECT_GROUP})
+                                          for node_id in found['nodeIds']))
+        return [r['object']['objectId'] for r in resolved]
+
+    async def _call_each(self, selector, function):
+        object_ids = await self._query(selector)
+        results = await asyncio.gather(*(
+            self.session.send("Runtime.callFunctionOn", {
+                'objectId': object_id, 'functionDeclaration': function, 'returnByValue': True
+            }) for object_id in object_ids))
+        # Release the handles without waiting for the reply
+        self.session.send_nowait("Runtime.releaseObjectGroup", {'objectGroup': OBJECT_GROUP})
+        return [r.get('result', {}).get('value') for r in results]
+
+    def dismiss_overlays(self, selector):
+        return sum(1 for clicked in self.session.run(self._call_each(selector, DISMISS_IF_VISIBLE_FN)) if clicked)
+
+    def close(self):
+        self.session.close()
+
+
+def make_backend(driver, name=None):
+    """The configured page backend; falls back to Selenium if the DevTools socket is unavailable"""
+    name = name or DRIVER_CONFIG['backend']
+    if name == "cdp":
+        try:
+            return CdpBackend.from_driver(driver)
+        except Exception as e:
+            logging.warning(f"CDP backend unavailable, using Selenium: {str(e)}")
+    return SeleniumBackend(driver)
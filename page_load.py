@@ -0,0 +1,93 @@
+import json
+import logging
+import time
+
+from config import PAGE_LOAD_CONFIG
+
+# What the current page has cost so far, from the Navigation and Resource Timing
+# entries. transferSize is 0 for cached responses and for cross-origin ones that
+# don't send Timing-Allow-Origin, so bytes is a lower bound on third-party pages.
+PAGE_STATS_JS = r"""
+// @jaa:page-stats
+const nav = performance.getEntriesByType('navigation')[0] || {};
+const resources = performance.getEntriesByType('resource');
+return JSON.stringify({
+    dom_ready_ms: Math.round(nav.domContentLoadedEventEnd || 0),
+    load_ms: Math.round(nav.loadEventEnd || 0),
+    bytes: (nav.transferSize || 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    requests: resources.length + 1
+});
+"""
+
+
+def lean():
+    return PAGE_LOAD_CONFIG['profile'] == "lean"
+
+
+def blocked_urls():
+    """Network.setBlockedURLs patterns of the groups PAGE_LOAD_CONFIG['block'] names"""
+    return [pattern for group in PAGE_LOAD_CONFIG['block'] for pattern in PAGE_LOAD_CONFIG['blocked_urls'][group]]
+
+
+def configure_options(options):
+    """Apply the loading profile's startup settings to ChromeOptions"""
+    if lean():
+        options.page_load_strategy = "eager"
+    if PAGE_LOAD_CONFIG['headless']:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")  # --start-maximized has no screen to fill
+    return options
+
+
+class PageLoader:
+    """Navigates with the configured loading profile and logs what each page load cost.
+
+    In the lean profile the browser never requests images, media, fonts or the
+    listed analytics endpoints, and driver.get returns once the DOM is ready;
+    the waits that follow each navigation already wait for the elements needed.
+    """
+
+    def __init__(self, driver):
+        self.navigations = []  # dicts: url, ready_s, dom_ready_ms, load_ms, bytes, requests
+        self.attach(driver)
+
+    def attach(self, driver):
+        """Send the profile's CDP settings to driver (also used when the browser is replaced)"""
+        self.driver = driver
+        if not lean():
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls()})
+            if PAGE_LOAD_CONFIG['disable_cache']:
+                driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        except Exception as e:
+            logging.warning(f"Lean page loading unavailable, loading everything: {str(e)}")
+
+    def get(self, url):
+        """driver.get(url), then log how long it blocked and what the page transferred"""
+        start = time.perf_counter()
+        self.driver.get(url)
+        ready_s = time.perf_counter() - start
+        if not PAGE_LOAD_CONFIG['report']:
+            return None
+        try:
+            stats = json.loads(self.driver.execute_script(PAGE_STATS_JS) or "{}")
+        except Exception as e:
+            logging.debug(f"Page load stats unavailable: {str(e)}")
+            return None
+        stats.update(url=url.split("?")[0], ready_s=round(ready_s, 3))
+        self.navigations.append(stats)
+        logging.info(f"Loaded {stats['url']} in {ready_s:.2f}s: {stats.get('bytes', 0) / 1024:.0f} KB "
+                     f"in {stats.get('requests', 0)} requests, DOM ready at {stats.get('dom_ready_ms', 0)} ms",
+                     extra={'page_load': stats})
+        return stats
+
+    def log_report(self):
+        if not self.navigations:
+            return
+        count = len(self.navigations)
+        total = sum(n.get('bytes', 0) for n in self.navigations)
+        ready = sum(n['ready_s'] for n in self.navigations) / count
+        logging.info(f"Page loads ({PAGE_LOAD_CONFIG['profile']}): {count} navigations, "
+                     f"{total / 1024:.0f} KB transferred, {ready:.2f}s average until ready")
@@ -0,0 +1,80 @@
+import re
+from collections import deque
+from functools import lru_cache
+
+_NON_WORD = re.compile(r"[^a-z0-9']+")
+
+
+def normalize(text):
+    """Lowercase and collapse punctuation/whitespace so keys and labels compare cleanly"""
+    return " ".join(_NON_WORD.sub(" ", str(text).lower()).split())
+
+
+class QuestionMatcher:
+    """Aho-Corasick automaton over the question_db keys.
+
+    Finds every key contained in a label in one pass over the label and resolves
+    to the most specific (longest) one; ties go to the key listed first.
+    """
+
+    def __init__(self, question_db, cache_size=1024):
+        self.answers = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]  # key indices ending at each state
+
+        for key, answer in question_db.items():
+            pattern = normalize(key)
+            if not pattern:
+                continue
+            self._insert(pattern, len(self.answers))
+            self.answers.append((pattern, answer))
+
+        self._build_failure_links()
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+
+    def _insert(self, pattern, index):
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, label):
+        """Return the indices of every key that occurs in the label"""
+        found = set()
+        state = 0
+        for char in normalize(label):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._out[state])
+        return found
+
+    def _match(self, label):
+        found = self.find_all(label)
+        if not found:
+            return None
+        best = min(found, key=lambda i: (-len(self.answers[i][0]), i))
+        return self.answers[best][1]
+
+    def cache_info(self):
+        return self.match.cache_info()
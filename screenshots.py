@@ -0,0 +1,119 @@
+import base64
+import datetime
+import hashlib
+import logging
+import os
+import queue
+import threading
+
+from config import SCREENSHOT_CONFIG
+
+ELEMENT_RECT_JS = r"""
+// @jaa:element-rect
+const el = document.querySelector(arguments[0]);
+if (!el) return null;
+const r = el.getBoundingClientRect();
+return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+"""
+
+
+class ScreenshotPipeline:
+    """Captures through CDP and encodes/writes PNGs on a background thread.
+
+    Capturing never resizes the window. Frames identical to the previous one are
+    skipped, and the directory is kept under a size budget by deleting the
+    oldest files first.
+    """
+
+    def __init__(self, driver, directory=None, queue_size=None, max_bytes=None):
+        self.driver = driver
+        self.directory = directory or SCREENSHOT_CONFIG['directory']
+        self.max_bytes = max_bytes or SCREENSHOT_CONFIG['max_bytes']
+        self._queue = queue.Queue(maxsize=queue_size or SCREENSHOT_CONFIG['queue_size'])
+        self._last_hash = None
+        self._files = []  # (path, size), oldest first
+        self._total = 0
+        self.dropped = 0
+        self.skipped = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan_existing()
+        self._worker = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+        self._worker.start()
+
+    def _scan_existing(self):
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith(".png")]
+        for path in sorted(paths, key=os.path.getmtime):
+            size = os.path.getsize(path)
+            self._files.append((path, size))
+            self._total += size
+
+    def capture(self, filename, selector=None):
+        """Capture the full page (or just the element matching selector); returns the target path"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join(self.directory, f"{filename}_{timestamp}.png")
+
+        clip = None
+        if selector:
+            clip = self.driver.execute_script(ELEMENT_RECT_JS, selector)
+        if not clip:
+            size = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})["cssContentSize"]
+            clip = {"x": 0, "y": 0, "width": size["width"], "height": size["height"]}
+        clip["scale"] = 1
+
+        shot = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "png", "captureBeyondViewport": True, "clip": clip
+        })
+        try:
+            self._queue.put_nowait((path, shot["data"]))
+        except queue.Full:
+            self.dropped += 1
+            logging.warning(f"Screenshot queue full, dropped {filename}")
+            return None
+        return path
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                logging.error(f"Failed to write screenshot: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, data):
+        digest = hashlib.sha1(data.encode("ascii")).hexdigest()
+        if digest == self._last_hash:
+            self.skipped += 1
+            logging.info(f"Screenshot unchanged, skipped: {path}")
+            return
+        self._last_hash = digest
+
+        png = base64.b64decode(data)
+        with open(path, "wb") as f:
+            f.write(png)
+        self._files.append((path, len(png)))
+        self._total += len(png)
+        self._enforce_retention()
+        logging.info(f"Screenshot saved: {path}")
+
+    def _enforce_retention(self):
+        while self._total > self.max_bytes and len(self._files) > 1:
+            path, size = self._files.pop(0)
+            self._total -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        self.flush()
+        self._queue.put(None)
+        self._worker.join(timeout=5)
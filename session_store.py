@@ -0,0 +1,155 @@
+import importlib.util
+import json
+import logging
+import os
+import time
+
+from config import SESSION_CONFIG
+from lazy_imports import LazyImport
+
+# Optional; without it sessions are never written to disk. Loaded on first use, not at startup
+Fernet = LazyImport("cryptography.fernet", "Fernet")
+InvalidToken = LazyImport("cryptography.fernet", "InvalidToken")
+
+LOCAL_STORAGE_READ_JS = r"""
+// @jaa:local-storage-read
+const items = {};
+for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    items[key] = localStorage.getItem(key);
+}
+return JSON.stringify(items);
+"""
+
+LOCAL_STORAGE_WRITE_JS = r"""
+// @jaa:local-storage-write
+const items = JSON.parse(arguments[0]);
+Object.keys(items).forEach(key => localStorage.setItem(key, items[key]));
+return Object.keys(items).length;
+"""
+
+# One same-origin request that does not render anything: a signed-in session gets
+# the page (200), an expired one is redirected to the login/authwall, which
+# redirect: 'manual' reports as an opaque redirect without following it.
+SESSION_CHECK_JS = r"""
+// @jaa:session-check
+const url = arguments[0], done = arguments[arguments.length - 1];
+fetch(url, {credentials: 'include', redirect: 'manual', cache: 'no-store'})
+    .then(r => done({status: r.status, type: r.type}))
+    .catch(e => done({status: 0, type: 'error', error: String(e)}));
+"""
+
+
+class SessionStore:
+    """Keeps the signed-in browser session (cookies + localStorage) encrypted at rest between runs.
+
+    The file is a Fernet token (AES-128-CBC + HMAC-SHA256) whose embedded
+    timestamp also enforces max_age_days. The key comes from JAA_SESSION_KEY or
+    a key file created next to it with owner-only permissions.
+    """
+
+    def __init__(self, username, path=None, key_path=None):
+        self.username = username
+        self.path = path or SESSION_CONFIG['path']
+        self.key_path = key_path or SESSION_CONFIG['key_path']
+        self._fernet = None
+
+    @property
+    def available(self):
+        return importlib.util.find_spec("cryptography") is not None
+
+    def _cipher(self):
+        if self._fernet is None:
+            key = os.getenv(SESSION_CONFIG['key_env'])
+            if not key:
+                if not os.path.exists(self.key_path):
+                    os.makedirs(os.path.dirname(self.key_path) or ".", exist_ok=True)
+                    fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(Fernet.generate_key())
+                with open(self.key_path, "rb") as f:
+                    key = f.read().strip()
+            self._fernet = Fernet(key)
+        return self._fernet
+
+    def save(self, driver):
+        """Encrypt and write the current session; call right after a successful login"""
+        if not self.available:
+            logging.info("Session not saved: install 'cryptography' to keep sessions between runs")
+            return False
+        try:
+            state = {'username': self.username, 'saved_at': time.time(), 'cookies': driver.get_cookies(),
+                     'local_storage': json.loads(driver.execute_script(LOCAL_STORAGE_READ_JS) or "{}")}
+            token = self._cipher().encrypt(json.dumps(state).encode("utf-8"))
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp, self.path)
+            logging.info(f"Saved session ({len(state['cookies'])} cookies, "
+                         f"{len(state['local_storage'])} localStorage items)")
+            return True
+        except Exception as e:
+            logging.warning(f"Could not save session: {str(e)}")
+            return False
+
+    def load(self):
+        """The saved session for this user, or None if missing, too old, tampered with or someone else's"""
+        if not self.available or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                token = f.read()
+            state = json.loads(self._cipher().decrypt(token, ttl=int(SESSION_CONFIG['max_age_days'] * 86400)))
+        except Exception as e:
+            if isinstance(e, InvalidToken.resolve()):
+                logging.info("Saved session is expired or unreadable - discarding it")
+                self.clear()
+            else:
+                logging.warning(f"Could not read saved session: {str(e)}")
+            return None
+        if state.get('username') != self.username:
+            logging.info("Saved session belongs to another account - ignoring it")
+            return None
+        return state
+
+    def restore(self, driver, pages=None):
+        """Put the saved session into the browser and check it with one request; True if signed in.
+
+        pages is the PageLoader to navigate with, so the origin page load is measured like the others.
+        """
+        state = self.load()
+        if state is None:
+            return False
+        try:
+            # Cookies can only be set for the site currently loaded; any light same-origin page will do
+            (pages.get if pages else driver.get)(SESSION_CONFIG['origin_url'])
+            now = time.time()
+            for cookie in state['cookies']:
+                if cookie.get('expiry') and cookie['expiry'] < now:
+                    continue
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    logging.debug(f"Cookie {cookie.get('name')} not restored: {str(e)}")
+            if state['local_storage']:
+                driver.execute_script(LOCAL_STORAGE_WRITE_JS, json.dumps(state['local_storage']))
+
+            check = driver.execute_async_script(SESSION_CHECK_JS, SESSION_CONFIG['check_url']) or {}
+            if check.get('status') == 200:
+                age = (now - state['saved_at']) / 3600
+                logging.info(f"Restored session saved {age:.1f}h ago - skipping login")
+                return True
+            logging.info(f"Saved session was rejected ({check.get('type')} {check.get('status')}) - logging in")
+        except Exception as e:
+            logging.warning(f"Could not restore session: {str(e)}")
+        driver.delete_all_cookies()
+        self.clear()
+        return False
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,51 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Collects import and initialization timings up to the bot's first browser action"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []  # (name, seconds, thread name)
+        self.first_action = None
+        self.first_search = None
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.phases.append((name, seconds, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def mark_first_action(self):
+        """Call right before the first real browser action (e.g. opening the login page)"""
+        if self.first_action is None:
+            self.first_action = time.perf_counter() - self.started
+
+    def mark_first_search(self):
+        """Call once search results are shown; returns True the first time"""
+        if self.first_search is not None:
+            return False
+        self.first_search = time.perf_counter() - self.started
+        return True
+
+    def report(self):
+        lines = [f"{'phase':<48}{'ms':>10}  thread"]
+        for name, seconds, thread in self.phases:
+            lines.append(f"{name:<48}{seconds * 1000:>10.1f}  {thread}")
+        if self.first_action is not None:
+            lines.append(f"{'time to first action':<48}{self.first_action * 1000:>10.1f}")
+        if self.first_search is not None:
+            lines.append(f"{'time to first search':<48}{self.first_search * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+PROFILER = StartupProfiler()
@@ -0,0 +1,143 @@
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from config import RECORDER_CONFIG
+
+try:
+    import zstandard
+except ImportError:  # optional; gzip is used without it
+    zstandard = None
+
+# Serializes the Easy Apply modal with its live form state copied into attributes.
+# Scripts, inline handlers and the fill engine's own ref tags are dropped so that
+# identical steps produce identical bytes.
+MODAL_HTML_JS = r"""
+// @jaa:modal-html
+const modal = document.querySelector(".jobs-easy-apply-modal, div[role='dialog']");
+if (!modal) return '';
+const clone = modal.cloneNode(true);
+const live = modal.querySelectorAll('input, select, textarea, option');
+const copies = clone.querySelectorAll('input, select, textarea, option');
+live.forEach((el, i) => {
+    const copy = copies[i];
+    if (el.tagName === 'OPTION') {
+        el.selected ? copy.setAttribute('selected', '') : copy.removeAttribute('selected');
+    } else if (el.type === 'checkbox' || el.type === 'radio') {
+        el.checked ? copy.setAttribute('checked', '') : copy.removeAttribute('checked');
+    } else if (el.tagName === 'TEXTAREA') {
+        copy.textContent = el.value;
+    } else if (el.tagName !== 'SELECT') {
+        copy.setAttribute('value', el.value);
+    }
+});
+clone.querySelectorAll('script, noscript').forEach(el => el.remove());
+[clone, ...clone.querySelectorAll('*')].forEach(el => {
+    Array.from(el.attributes).forEach(attr => {
+        if (attr.name.startsWith('on') || attr.name === 'data-jaa-ref') el.removeAttribute(attr.name);
+    });
+});
+return clone.outerHTML;
+"""
+
+
+class SnapshotStore:
+    """Content-addressed, compressed store of modal HTML plus a JSON-lines manifest of recorded steps"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or RECORDER_CONFIG['directory']
+        self.objects = os.path.join(self.directory, "objects")
+        self.manifest = os.path.join(self.directory, "steps.jsonl")
+        os.makedirs(self.objects, exist_ok=True)
+
+    def _path(self, digest, ext):
+        return os.path.join(self.objects, digest[:2], f"{digest}.html{ext}")
+
+    def put(self, html):
+        """Store html once; returns (sha256 digest, True if it was new)"""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if any(os.path.exists(self._path(digest, ext)) for ext in (".zst", ".gz")):
+            return digest, False
+
+        if zstandard is not None:
+            path, blob = self._path(digest, ".zst"), zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            path, blob = self._path(digest, ".gz"), gzip.compress(data, compresslevel=6)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        return digest, True
+
+    def get(self, digest):
+        path = self._path(digest, ".zst")
+        if os.path.exists(path):
+            if zstandard is None:
+                raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+            with open(path, "rb") as f:
+                return zstandard.ZstdDecompressor().decompress(f.read()).decode("utf-8")
+        with open(self._path(digest, ".gz"), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def append(self, entry):
+        with open(self.manifest, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def entries(self):
+        """Recorded steps in recording order"""
+        if not os.path.exists(self.manifest):
+            return []
+        with open(self.manifest, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class StepRecorder:
+    """Opt-in capture of each Easy Apply step (before filling) and the decisions made on it"""
+
+    def __init__(self, store=None):
+        self.store = store or SnapshotStore()
+        self.recorded = 0
+        self.stored = 0
+
+    def capture(self, driver):
+        """Serialized modal DOM for the current step, or None"""
+        try:
+            return driver.execute_script(MODAL_HTML_JS) or None
+        except Exception as e:
+            logging.debug(f"Step snapshot failed: {str(e)}")
+            return None
+
+    def record(self, html, job_id, step, fill_mode, decisions):
+        """Store the step's DOM and append a manifest entry; never raises"""
+        try:
+            digest, new = self.store.put(html)
+            self.store.append({
+                'ts': datetime.datetime.now().isoformat(timespec="seconds"),
+                'job_id': job_id,
+                'step': step,
+                'digest': digest,
+                'fill_mode': fill_mode,
+                'decisions': decisions,
+            })
+            self.recorded += 1
+            self.stored += new
+        except Exception as e:
+            logging.warning(f"Could not record step {step} of job {job_id}: {str(e)}")
+
+    def log_report(self):
+        if self.recorded:
+            logging.info(f"Step recorder: {self.recorded} steps recorded, {self.stored} new snapshots "
+                         f"in {self.store.directory}")
+
+
+def diff_decisions(recorded, replayed):
+    """Field positions whose (action, value) changed: {position: (recorded, replayed)}"""
+    recorded, replayed = recorded or {}, replayed or {}
+    return {key: (recorded.get(key), replayed.get(key))
+            for key in sorted(set(recorded) | set(replayed), key=int)
+            if recorded.get(key) != replayed.get(key)}
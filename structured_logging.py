@@ -0,0 +1,134 @@
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+_listener = None
+
+# LogRecord attributes that are not user-supplied structured fields
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; extra= fields and span fields become top-level keys"""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def setup_logging(log_dir="logs", level=logging.INFO):
+    """Route all logging through a queue; a listener thread writes JSON lines and console text"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    os.makedirs(log_dir, exist_ok=True)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d")
+    log_file = os.path.join(log_dir, f"linkedin_bot_{timestamp}.jsonl")
+
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(JsonFormatter())
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                               respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Drain the queue and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def current_span():
+    """Name of the innermost open span on this thread, or None"""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def span_path():
+    """All open span names on this thread, outermost first"""
+    return list(getattr(_local, "stack", None) or [])
+
+
+@contextmanager
+def span(name, **fields):
+    """Time a phase and log it as a structured record: ``with span("apply.step", job_id=...)``"""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(name)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield fields
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        stack.pop()
+        logging.getLogger("span").info(
+            f"{name} took {duration_ms:.0f} ms",
+            extra={"span": name, "duration_ms": round(duration_ms, 2), "status": status, **fields})
+
+
+def summarize_spans(paths):
+    """Per-span count/p50/p95/max (ms) from JSON-lines log files"""
+    durations = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "span" in entry:
+                    durations.setdefault(entry["span"], []).append(entry["duration_ms"])
+
+    summary = {}
+    for name, values in durations.items():
+        values.sort()
+        summary[name] = {
+            "count": len(values),
+            "p50": values[len(values) // 2],
+            "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+            "max": values[-1],
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    # python structured_logging.py logs/*.jsonl
+    for name, s in sorted(summarize_spans(sys.argv[1:]).items()):
+        print(f"{name:<24} n={s['count']:<6} p50={s['p50']:>9.1f}ms p95={s['p95']:>9.1f}ms max={s['max']:>9.1f}ms")
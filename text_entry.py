@@ -0,0 +1,81 @@
+import logging
+import random
+import time
+
+from config import TEXT_ENTRY_CONFIG
+
+# Sets the value through the prototype's native setter (so React-controlled inputs
+# notice it) and fires the events LinkedIn's validation listens for, in one call.
+# Returns whether the input kept the value.
+SET_VALUE_JS = r"""
+// @jaa:set-value
+const el = arguments[0], value = arguments[1];
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+el.focus();
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+['input', 'change', 'blur'].forEach(name => el.dispatchEvent(new Event(name, {bubbles: true})));
+return el.value === value;
+"""
+
+STRATEGIES = ('per_char', 'bulk', 'insert_text', 'native')
+
+
+class TextEntry:
+    """Puts text into inputs with the strategy TEXT_ENTRY_CONFIG's policy picks for the field type.
+
+    per_char  one send_keys per character with human-like pauses (1 + len(text) round trips)
+    bulk      clear + one send_keys; real key events
+    insert_text  clear, focus, CDP Input.insertText; one input event, no key events
+    native    one script: native value setter + input/change events
+
+    Every strategy replaces the current value. If one fails (no CDP on this
+    driver, a value the page rejects) the field is retyped with bulk.
+    """
+
+    def __init__(self, driver, policy=None):
+        self.driver = driver
+        self.policy = dict(TEXT_ENTRY_CONFIG['policy'], **(policy or {}))
+
+    def strategy_for(self, field_type):
+        forced = TEXT_ENTRY_CONFIG['strategy']
+        if forced:
+            return forced
+        return self.policy.get(field_type or 'default', self.policy['default'])
+
+    def type(self, element, text, field_type=None):
+        """Replace element's value with text; returns the strategy that did it"""
+        text = str(text)
+        strategy = self.strategy_for(field_type)
+        if strategy not in STRATEGIES:
+            logging.warning(f"Unknown text entry strategy {strategy!r} - using bulk")
+            strategy = 'bulk'
+        try:
+            getattr(self, strategy)(element, text)
+            return strategy
+        except Exception as e:
+            if strategy == 'bulk':
+                raise
+            logging.debug(f"{strategy} text entry failed ({str(e)}) - retyping with bulk")
+            self.bulk(element, text)
+            return 'bulk'
+
+    def per_char(self, element, text):
+        element.clear()
+        element.click()  # focus the input field
+        time.sleep(random.uniform(*TEXT_ENTRY_CONFIG['focus_pause']))
+        for char in text:
+            element.send_keys(char)
+            time.sleep(random.uniform(*TEXT_ENTRY_CONFIG['key_pause']))
+
+    def bulk(self, element, text):
+        element.clear()
+        element.send_keys(text)
+
+    def insert_text(self, element, text):
+        element.clear()
+        element.click()  # Input.insertText types into whatever has focus
+        self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+
+    def native(self, element, text):
+        if not self.driver.execute_script(SET_VALUE_JS, element, text):
+            raise ValueError("value not accepted")
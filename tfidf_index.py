@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+from lazy_imports import LazyImport
+
+np = LazyImport("numpy")
+csr_matrix = LazyImport("scipy.sparse", "csr_matrix")
+TfidfVectorizer = LazyImport("sklearn.feature_extraction.text", "TfidfVectorizer")
+
+# Bump when preprocessing or vectorizer settings change so stale indexes are rebuilt
+INDEX_VERSION = "1"
+
+
+def content_hash(questions, settings=None):
+    """Stable hash of the question list the index was fitted on and of how it was fitted.
+
+    settings holds whatever else the vectors depend on (NLP model and version,
+    preprocessing, vectorizer parameters) so changing any of them refits.
+    """
+    payload = json.dumps([INDEX_VERSION, settings or {}, questions], ensure_ascii=False, sort_keys=True,
+                         default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class TfidfIndex:
+    """On-disk TF-IDF index (vocabulary, IDF weights, CSR question vectors).
+
+    Each fitted index lives in a directory named after the content hash of the
+    question base and fitting settings, so a changed question_database.json or
+    spaCy model simply misses and is refitted. Arrays are memory-mapped on load instead of being read eagerly.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key, name=""):
+        return os.path.join(self.directory, key, name)
+
+    def load(self, questions, settings=None):
+        """Return (vectorizer, question_vectors) for these questions, or None if not indexed"""
+        key = content_hash(questions, settings)
+        if not os.path.exists(self._path(key, "meta.json")):
+            return None
+        try:
+            with open(self._path(key, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self._path(key, "vocabulary.json"), encoding="utf-8") as f:
+                terms = json.load(f)
+
+            vectorizer = TfidfVectorizer()
+            vectorizer.vocabulary_ = {term: i for i, term in enumerate(terms)}
+            vectorizer.idf_ = np.load(self._path(key, "idf.npy"), mmap_mode="r")
+
+            arrays = [np.load(self._path(key, f"{name}.npy"), mmap_mode="r")
+                      for name in ("data", "indices", "indptr")]
+            vectors = csr_matrix(tuple(arrays), shape=tuple(meta["shape"]), copy=False)
+            return vectorizer, vectors
+        except Exception as e:
+            logging.warning(f"TF-IDF index {key} unreadable, refitting: {str(e)}")
+            return None
+
+    def save(self, questions, vectorizer, vectors, settings=None):
+        """Persist a fitted vectorizer and its question vectors, replacing older indexes"""
+        key = content_hash(questions, settings)
+        tmp = self._path(key + ".tmp")
+        try:
+            shutil.rmtree(tmp, ignore_errors=True)
+            os.makedirs(tmp)
+
+            terms = [None] * len(vectorizer.vocabulary_)
+            for term, i in vectorizer.vocabulary_.items():
+                terms[i] = term
+            with open(os.path.join(tmp, "vocabulary.json"), "w", encoding="utf-8") as f:
+                json.dump(terms, f, ensure_ascii=False)
+
+            vectors = csr_matrix(vectors)
+            np.save(os.path.join(tmp, "idf.npy"), np.asarray(vectorizer.idf_))
+            np.save(os.path.join(tmp, "data.npy"), vectors.data)
+            np.save(os.path.join(tmp, "indices.npy"), vectors.indices)
+            np.save(os.path.join(tmp, "indptr.npy"), vectors.indptr)
+
+            # meta.json is written last and marks the index as complete
+            with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"shape": list(vectors.shape), "questions": len(questions), "settings": settings or {}},
+                          f, default=str)
+
+            for entry in os.listdir(self.directory):
+                if entry != key + ".tmp":
+                    shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
+            os.replace(tmp, self._path(key))
+            logging.info(f"TF-IDF index {key} saved ({vectors.shape[0]} questions)")
+        except Exception as e:
+            logging.warning(f"Could not save TF-IDF index: {str(e)}")
+            shutil.rmtree(tmp, ignore_errors=True)
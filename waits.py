@@ -0,0 +1,163 @@
+import logging
+import time
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException
+
+from config import WAIT_CONFIG
+from lazy_imports import LazyImport
+
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+
+MODAL_SELECTOR = ".jobs-easy-apply-modal, div[role='dialog']"
+
+# Resolves once the target subtree has seen no DOM mutations and no newly finished
+# network resources for quiet_ms, or false when timeout_ms elapses first.
+DOM_QUIET_JS = r"""
+// @jaa:dom-quiet
+const selector = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const target = (selector && document.querySelector(selector)) || document.body || document.documentElement;
+const start = performance.now();
+let last = start;
+let resources = performance.getEntriesByType('resource').length;
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    const now = performance.now();
+    const count = performance.getEntriesByType('resource').length;
+    if (count !== resources) { resources = count; last = now; }
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(now - start < timeoutMs);
+    } else {
+        setTimeout(check, 25);
+    }
+})();
+"""
+
+# Identifies the Easy Apply step currently shown: progress, heading and how many of
+# its controls were already tagged by a form snapshot (fresh steps have none).
+STEP_SIGNATURE_JS = r"""
+// @jaa:step-signature
+const modal = document.querySelector(".jobs-easy-apply-modal, div[role='dialog']");
+if (!modal) return '';
+const heading = modal.querySelector('h3, h2');
+const progress = modal.querySelector("progress, [role='progressbar']");
+return [
+    progress ? (progress.getAttribute('value') || progress.getAttribute('aria-valuenow') || '') : '',
+    heading ? heading.textContent.trim() : '',
+    modal.querySelectorAll('input, select, textarea').length,
+    modal.querySelectorAll('[data-jaa-ref]').length,
+    modal.querySelectorAll('.artdeco-inline-feedback--error').length
+].join('|');
+"""
+
+# Whether the job details pane shows the given job: the job ids its links and data
+# attributes point at, or the URL's currentJobId when the pane has none yet.
+JOB_DETAILS_SHOWN_JS = r"""
+// @jaa:job-details-shown
+const jobId = arguments[0], pane = document.querySelector(arguments[1]);
+if (!pane) return false;
+const ids = [...pane.querySelectorAll("a[href*='/jobs/view/'], [data-job-id]")]
+    .map(el => el.getAttribute('data-job-id') || ((el.getAttribute('href') || '').match(/\/jobs\/view\/(\d+)/) || [])[1])
+    .filter(Boolean);
+if (ids.length) return ids.includes(jobId);
+return new URLSearchParams(location.search).get('currentJobId') === jobId;
+"""
+
+RESULTS_COUNT_JS = r"""
+// @jaa:results-count
+return document.querySelectorAll('.job-card-container--clickable').length;
+"""
+
+
+def step_signature(driver):
+    return driver.execute_script(STEP_SIGNATURE_JS) or ""
+
+
+def step_changed(previous):
+    """Condition: the Easy Apply modal moved to another step (or closed)"""
+    def condition(driver):
+        return step_signature(driver) != previous
+    return condition
+
+
+def job_details_shown(job_id, pane_selector):
+    """Condition: the details pane renders job_id (not the previously opened job)"""
+    def condition(driver):
+        return bool(driver.execute_script(JOB_DETAILS_SHOWN_JS, job_id, pane_selector))
+    return condition
+
+
+def results_populated(min_count=1):
+    """Condition: the job search results list has rendered cards"""
+    def condition(driver):
+        count = driver.execute_script(RESULTS_COUNT_JS) or 0
+        return count if count >= min_count else False
+    return condition
+
+
+class WaitEngine:
+    """Condition-driven waits with a per-phase timeout policy and recorded durations"""
+
+    def __init__(self, driver, timeouts=None, poll_frequency=None):
+        self.driver = driver
+        self.timeouts = dict(WAIT_CONFIG['timeouts'], **(timeouts or {}))
+        self.poll_frequency = poll_frequency or WAIT_CONFIG['poll_frequency']
+        self.samples = defaultdict(list)  # phase -> [(seconds, satisfied)]
+
+    def timeout_for(self, phase):
+        return self.timeouts.get(phase, self.timeouts['default'])
+
+    def until(self, phase, condition, required=False):
+        """Wait until condition(driver) is truthy; on timeout raise if required, else return None"""
+        start = time.perf_counter()
+        satisfied = False
+        try:
+            result = WebDriverWait(self.driver, self.timeout_for(phase),
+                                   poll_frequency=self.poll_frequency).until(condition)
+            satisfied = True
+            return result
+        except TimeoutException:
+            logging.warning(f"Wait for '{phase}' timed out after {self.timeout_for(phase)}s")
+            if required:
+                raise
+            return None
+        finally:
+            self.samples[phase].append((time.perf_counter() - start, satisfied))
+
+    def dom_quiet(self, phase, selector=None, quiet_ms=None):
+        """Return as soon as the page (or selector's subtree) stops mutating and loading"""
+        quiet_ms = quiet_ms or WAIT_CONFIG['quiet_ms']
+        timeout_ms = int(self.timeout_for(phase) * 1000)
+        start = time.perf_counter()
+        satisfied = False
+        try:
+            satisfied = bool(self.driver.execute_async_script(DOM_QUIET_JS, selector, quiet_ms, timeout_ms))
+        except Exception as e:
+            logging.debug(f"DOM quiet probe for '{phase}' failed: {str(e)}")
+        finally:
+            self.samples[phase].append((time.perf_counter() - start, satisfied))
+        return satisfied
+
+    def report(self):
+        """Per-phase wait statistics: count, total, p50, p95, max (seconds) and timeouts"""
+        stats = {}
+        for phase, samples in self.samples.items():
+            durations = sorted(seconds for seconds, _ in samples)
+            stats[phase] = {
+                'count': len(durations),
+                'total': sum(durations),
+                'p50': durations[len(durations) // 2],
+                'p95': durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+                'max': durations[-1],
+                'timeouts': sum(1 for _, ok in samples if not ok),
+            }
+        return stats
+
+    def log_report(self):
+        for phase, s in sorted(self.report().items(), key=lambda item: -item[1]['total']):
+            logging.info(f"Wait '{phase}': {s['count']} waits, total {s['total']:.2f}s, "
+                         f"p50 {s['p50']:.2f}s, p95 {s['p95']:.2f}s, max {s['max']:.2f}s, "
+                         f"{s['timeouts']} timeouts")